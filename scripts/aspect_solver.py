@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Aspect Solver
+Root-finding event solver for a single moving body against a fixed ecliptic target.
+
+Instead of recalculating every planet day by day, the solver tracks ONE body
+with swe.calc_ut (longitude + speed), brackets the moments where something
+changes, and refines each bracket with a safeguarded regula falsi:
+
+- Orb entry / orb exit (|separation| crosses the orb)
+- Exact hits (separation crosses zero) - several per retrograde loop
+- Stations (speed crosses zero)
+
+Lookups go through the Chebyshev ephemeris cache when it has been built
+(ephemeris_cache.py), otherwise straight to swe.calc_ut.
+
+Between two consecutive stations a body's longitude is monotonic, so every
+bracket is split at its station first and then holds at most one exact hit and
+one orb crossing. Event times are resolved to ~10 seconds (1e-4 days).
+
+Over a whole date range (find_aspect_episodes) the body's maximum speed bounds
+how soon it can reach the orb, so the search jumps straight to the next
+possible entry and its cost follows the number of episodes, not the days.
+
+Usage:
+    python aspect_solver.py --planet Saturn --target 15.5 --aspect square --date 2025-06-01
+    python aspect_solver.py --planet Mercury --target 200 --aspect conjunction --date 2025-11-10 --orb 1.5
+    python aspect_solver.py --planet Mars --target 200 --aspect square --date 2025-01-01 --end-date 2026-01-01
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Any, Tuple
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from transits import PLANET_NAMES, calculate_julian_day
+from ephemeris_cache import get_default_cache
+
+# Constants
+ASPECT_ANGLES = {
+    'conjunction': 0,
+    'sextile': 60,
+    'square': 90,
+    'trine': 120,
+    'opposition': 180
+}
+
+BODY_IDS = {name: planet_id for planet_id, name in PLANET_NAMES.items()}
+
+# Bracketing step in days while the body is inside the orb.
+# Must stay well below the body's shortest retrograde (or direct) run so that
+# no bracket can contain two stations.
+SCAN_STEPS = {
+    'Sun': 2.0,        # Never retrograde
+    'Moon': 0.25,      # Never retrograde, but covers ~3° per step
+    'Mercury': 3.0,    # Retrograde runs ~20 days
+    'Venus': 5.0,      # Retrograde runs ~40 days
+    'Mars': 7.0,       # Retrograde runs ~60 days
+    'Jupiter': 10.0,   # Retrograde runs ~120 days
+    'Saturn': 10.0,
+    'Uranus': 10.0,
+    'Neptune': 10.0,
+    'Pluto': 10.0,
+}
+
+# Upper bounds on |daily motion| in degrees, padded above the fastest observed.
+# A body cannot close a gap of D degrees in less than D / bound days, which is
+# how far find_aspect_episodes may jump while the body is out of orb.
+MAX_SPEEDS = {
+    'Sun': 1.05,
+    'Moon': 15.5,
+    'Mercury': 2.25,
+    'Venus': 1.3,
+    'Mars': 0.82,
+    'Jupiter': 0.26,
+    'Saturn': 0.14,
+    'Uranus': 0.07,
+    'Neptune': 0.045,
+    'Pluto': 0.045,
+}
+
+# Event time resolution in days (~9 seconds)
+TIME_TOLERANCE = 1e-4
+
+
+def normalize_separation(longitude: float, target_longitude: float) -> float:
+    """Signed angular distance from target to longitude, in (-180, 180]."""
+    diff = (longitude - target_longitude) % 360.0
+    if diff > 180.0:
+        diff -= 360.0
+    return diff
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """Convert a Julian Day (UT) to a naive UTC datetime rounded to the minute."""
+    year, month, day, hour = swe.revjul(jd)
+    dt = datetime(year, month, day) + timedelta(hours=hour)
+    return (dt + timedelta(seconds=30)).replace(second=0, microsecond=0)
+
+
+def find_root(
+    func: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    tolerance: float = TIME_TOLERANCE,
+    max_iterations: int = 60
+) -> float:
+    """
+    Find a root of func inside the bracket [a, b] (fa and fb of opposite sign).
+
+    Uses the Illinois variant of regula falsi, which converges superlinearly on
+    smooth ephemeris curves, with a bisection fallback if a step stalls.
+
+    Returns:
+        Abscissa of the root (within tolerance)
+    """
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+
+    side = 0
+    for _ in range(max_iterations):
+        if abs(b - a) <= tolerance:
+            break
+
+        c = (a * fb - b * fa) / (fb - fa)
+        if not (min(a, b) < c < max(a, b)):
+            c = (a + b) / 2
+        fc = func(c)
+
+        if fc == 0:
+            return c
+
+        if (fc > 0) == (fb > 0):
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2
+            side = 1
+
+    return (a * fb - b * fa) / (fb - fa) if fb != fa else (a + b) / 2
+
+
+class BodyTrack:
+    """Single-body ephemeris sampler that counts its ephemeris lookups."""
+
+    def __init__(self, planet_name: str, target_longitude: float):
+        if planet_name not in BODY_IDS:
+            raise ValueError(f"Unknown planet '{planet_name}'")
+        self.planet_name = planet_name
+        self.planet_id = BODY_IDS[planet_name]
+        self.target_longitude = target_longitude % 360.0
+        self.cache = get_default_cache()
+        self.calls = 0
+
+    def sample(self, jd: float) -> Tuple[float, float, float]:
+        """Return (jd, signed separation from target, speed) for a moment."""
+        self.calls += 1
+        if self.cache is not None:
+            longitude, _, speed = self.cache.position(self.planet_id, jd)
+        else:
+            position, _ = swe.calc_ut(jd, self.planet_id)
+            longitude, speed = position[0], position[3]
+        return jd, normalize_separation(longitude, self.target_longitude), speed
+
+    def separation(self, jd: float) -> float:
+        return self.sample(jd)[1]
+
+    def speed(self, jd: float) -> float:
+        return self.sample(jd)[2]
+
+
+def nearest_aspect_target(planet_name: str, natal_longitude: float, aspect_type: str, jd: float) -> float:
+    """
+    Pick the aspect point (natal ± aspect angle) closest to the body at jd.
+
+    Sextiles, squares and trines perfect on both sides of the natal point; the
+    episode in progress is the one on the side the body currently occupies.
+    """
+    angle = ASPECT_ANGLES.get(aspect_type, 0)
+    position, _ = swe.calc_ut(jd, BODY_IDS[planet_name])
+    candidates = [(natal_longitude + angle) % 360, (natal_longitude - angle) % 360]
+    return min(candidates, key=lambda target: abs(normalize_separation(position[0], target)))
+
+
+def _split_at_station(track: BodyTrack, first: Tuple, second: Tuple, stations: List[Dict[str, Any]]) -> List[Tuple]:
+    """
+    Split a time-ordered bracket at its station, if speed changes sign inside it.
+
+    Records the station and returns the monotonic sub-brackets as sample lists.
+    """
+    if (first[2] > 0) == (second[2] > 0):
+        return [first, second]
+
+    station_jd = find_root(track.speed, first[0], second[0], first[2], second[2])
+    station = track.sample(station_jd)
+    stations.append({
+        'jd': station_jd,
+        'motion': 'retrograde' if first[2] > 0 else 'direct',
+    })
+    return [first, station, second]
+
+
+def find_aspect_episode(
+    planet_name: str,
+    target_longitude: float,
+    orb: float,
+    jd_center: float,
+    max_days: float = 180.0
+) -> Dict[str, Any]:
+    """
+    Solve the contiguous in-orb episode of a body around a given moment.
+
+    Marches outward from jd_center (backward and forward) in body-sized steps
+    while the body stays within orb of target_longitude, and root-finds every
+    station, exact hit and the orb boundaries on the way.
+
+    Args:
+        planet_name: Moving body ('Sun' ... 'Pluto')
+        target_longitude: Ecliptic longitude the aspect perfects at
+                          (natal longitude + aspect angle)
+        orb: Orb in degrees
+        jd_center: Julian Day inside the episode (e.g. snapshot date)
+        max_days: Maximum days to search in each direction
+
+    Returns:
+        {
+            'applying_jd': float,        # Orb entry (or search limit)
+            'separating_jd': float,      # Orb exit (or search limit)
+            'applying_found': bool,      # False if entry lies beyond max_days
+            'separating_found': bool,    # False if exit lies beyond max_days
+            'exact_jds': [float, ...],   # Chronological exact hits
+            'stations': [{'jd': float, 'motion': 'retrograde'/'direct'}, ...],
+            'ephemeris_calls': int
+        }
+    """
+    track = BodyTrack(planet_name, target_longitude)
+    step = SCAN_STEPS.get(planet_name, 5.0)
+    exact_jds = []
+    stations = []
+    edges = {}
+
+    center = track.sample(jd_center)
+    # The episode always contains jd_center, even when it sits on the orb boundary
+    orb = max(orb, abs(center[1]))
+
+    for direction in (-1, 1):
+        limit = jd_center + direction * max_days
+        prev = center
+        edge = None
+
+        while edge is None and (limit - prev[0]) * direction > 0:
+            next_jd = prev[0] + direction * step
+            if (limit - next_jd) * direction < 0:
+                next_jd = limit
+            nxt = track.sample(next_jd)
+
+            # Work on the bracket in chronological order, split at any station
+            first, second = (prev, nxt) if direction > 0 else (nxt, prev)
+            pieces = _split_at_station(track, first, second, stations)
+            brackets = list(zip(pieces[:-1], pieces[1:]))
+            if direction < 0:
+                brackets = [(b, a) for a, b in reversed(brackets)]
+
+            # Each bracket is monotonic in separation, walked away from center
+            for start, end in brackets:
+                if (start[1] > 0) != (end[1] > 0) and abs(end[1] - start[1]) < 180:
+                    exact_jds.append(find_root(track.separation, start[0], end[0], start[1], end[1]))
+
+                if abs(end[1]) > orb:
+                    boundary = orb if end[1] > 0 else -orb
+                    edge = find_root(
+                        lambda jd: track.separation(jd) - boundary,
+                        start[0], end[0], start[1] - boundary, end[1] - boundary
+                    )
+                    break
+
+            prev = nxt
+
+        edges[direction] = edge
+
+    # Drop stations that fall outside the episode (found while overshooting an edge)
+    applying_jd = edges[-1] if edges[-1] is not None else jd_center - max_days
+    separating_jd = edges[1] if edges[1] is not None else jd_center + max_days
+    stations = [s for s in stations if applying_jd <= s['jd'] <= separating_jd]
+
+    return {
+        'applying_jd': applying_jd,
+        'separating_jd': separating_jd,
+        'applying_found': edges[-1] is not None,
+        'separating_found': edges[1] is not None,
+        'exact_jds': sorted(set(exact_jds)),
+        'stations': sorted(stations, key=lambda s: s['jd']),
+        'ephemeris_calls': track.calls,
+    }
+
+
+def find_aspect_episodes(
+    planet_name: str,
+    target_longitude: float,
+    orb: float,
+    jd_start: float,
+    jd_end: float,
+    max_episode_days: float = 730.0
+) -> List[Dict[str, Any]]:
+    """
+    Solve every in-orb episode of a body against a target over a date range.
+
+    While the body is out of orb it cannot reach the orb sooner than
+    (|separation| - orb) / MAX_SPEEDS[planet] days, so the search jumps ahead
+    by that much instead of stepping day by day: a slow planet far from the
+    target is done after a handful of lookups, and the work is spent where
+    episodes actually happen. Each sample found inside the orb is solved with
+    find_aspect_episode and the search resumes after its orb exit.
+
+    Args:
+        planet_name: Moving body ('Sun' ... 'Pluto')
+        target_longitude: Ecliptic longitude the aspect perfects at
+        orb: Orb in degrees
+        jd_start: Start of the range (Julian Day, UT)
+        jd_end: End of the range (Julian Day, UT)
+        max_episode_days: Longest search each way from inside an episode
+
+    Returns:
+        Chronological list of find_aspect_episode results for every episode
+        overlapping [jd_start, jd_end] (the first and last may extend past it)
+    """
+    track = BodyTrack(planet_name, target_longitude)
+    max_speed = MAX_SPEEDS.get(planet_name, 15.5)
+    # Shortest jump: small enough that an episode cannot fit between two samples
+    # (crossing the orb takes at least 2 * orb / max_speed days), stations aside
+    min_step = min(SCAN_STEPS.get(planet_name, 5.0), orb / max_speed)
+
+    episodes = []
+    jd = jd_start
+    while jd <= jd_end:
+        _, separation, _ = track.sample(jd)
+
+        if abs(separation) <= orb:
+            episode = find_aspect_episode(planet_name, target_longitude, orb, jd, max_days=max_episode_days)
+            episode['ephemeris_calls'] += track.calls
+            track.calls = 0
+            episodes.append(episode)
+            if not episode['separating_found']:
+                break
+            jd = episode['separating_jd'] + min_step
+            continue
+
+        jd += max((abs(separation) - orb) / max_speed, min_step)
+
+    # Lookups made after the last episode are charged to it
+    if episodes:
+        episodes[-1]['ephemeris_calls'] += track.calls
+
+    return episodes
+
+
+def format_episode(episode: Dict[str, Any], planet_name: str, aspect_type: str) -> str:
+    """Format a solved episode for display."""
+    output = []
+    fmt = '%Y-%m-%d %H:%M'
+
+    output.append(f"\n{'='*80}")
+    output.append(f"{planet_name.upper()} {aspect_type.upper()} EPISODE")
+    output.append(f"{'='*80}")
+
+    entry = "" if episode['applying_found'] else " (beyond search window)"
+    exit_note = "" if episode['separating_found'] else " (beyond search window)"
+    output.append(f"Enters orb:  {jd_to_datetime(episode['applying_jd']).strftime(fmt)} UT{entry}")
+    for jd in episode['exact_jds']:
+        output.append(f"Exact:       {jd_to_datetime(jd).strftime(fmt)} UT")
+    for station in episode['stations']:
+        output.append(f"Station {station['motion'][0].upper()}:   {jd_to_datetime(station['jd']).strftime(fmt)} UT")
+    output.append(f"Leaves orb:  {jd_to_datetime(episode['separating_jd']).strftime(fmt)} UT{exit_note}")
+    output.append(f"\nEphemeris calls: {episode['ephemeris_calls']}")
+
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Solve a transit episode by root-finding')
+    parser.add_argument('--planet', required=True, choices=list(BODY_IDS), help='Transiting planet')
+    parser.add_argument('--target', type=float, required=True, help='Natal longitude (0-360)')
+    parser.add_argument('--aspect', default='conjunction', choices=list(ASPECT_ANGLES), help='Aspect type')
+    parser.add_argument('--date', required=True, help='Date inside the episode (YYYY-MM-DD)')
+    parser.add_argument('--end-date', help='Solve every episode from --date to this date (YYYY-MM-DD)')
+    parser.add_argument('--orb', type=float, default=2.0, help='Orb in degrees (default 2°)')
+    parser.add_argument('--max-days', type=float, default=180, help='Search window each way (default 180)')
+
+    args = parser.parse_args()
+
+    try:
+        jd = calculate_julian_day(args.date)
+
+        if args.end_date:
+            angle = ASPECT_ANGLES[args.aspect]
+            targets = sorted({(args.target + angle) % 360, (args.target - angle) % 360})
+            episodes = []
+            for target in targets:
+                episodes.extend(find_aspect_episodes(args.planet, target, args.orb, jd,
+                                                     calculate_julian_day(args.end_date)))
+            for episode in sorted(episodes, key=lambda e: e['applying_jd']):
+                print(format_episode(episode, args.planet, args.aspect))
+            print(f"\n{len(episodes)} episode(s), {sum(e['ephemeris_calls'] for e in episodes)} ephemeris calls")
+            return
+
+        target = nearest_aspect_target(args.planet, args.target, args.aspect, jd)
+        episode = find_aspect_episode(args.planet, target, args.orb, jd, args.max_days)
+        print(format_episode(episode, args.planet, args.aspect))
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
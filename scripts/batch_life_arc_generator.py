@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Batch Life Arc Generator
+Generates life arc timeline JSON for many profiles in parallel.
+
+Each (profile, age range) task runs generate_life_arc_timeline in a separate
+worker process from a ProcessPoolExecutor, so a many-core machine can work
+through a whole backlog of profiles at once. Swiss Ephemeris is initialized
+once per worker. Long single-profile runs can be split into age chunks
+(--chunk-size); each chunk is written as its own self-contained timeline file
+(period clusters are detected within the chunk).
+
+Results are reported in task order (profiles as given, then ascending age),
+regardless of which worker finishes first.
+
+Usage:
+    python batch_life_arc_generator.py --start-age 0 --end-age 100
+    python batch_life_arc_generator.py --profiles darren alice --start-age 0 --end-age 100 --workers 8
+    python batch_life_arc_generator.py --profiles darren --start-age 0 --end-age 100 --chunk-size 25
+    python batch_life_arc_generator.py --start-age 0 --end-age 100 --stage-cache
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from profile_loader import load_profile, list_profiles
+from life_arc_generator import generate_life_arc_timeline
+from stage_cache import StageCache
+
+# Constants
+EPHEMERIS_PATH = str(Path(__file__).parent.parent / 'ephemeris')
+
+
+def split_age_range(start_age: int, end_age: int, chunk_size: Optional[int] = None) -> List[tuple]:
+    """
+    Split an inclusive age range into chunks.
+
+    Args:
+        start_age: First age
+        end_age: Last age (inclusive)
+        chunk_size: Ages per chunk (None = one chunk)
+
+    Returns:
+        List of (start_age, end_age) tuples in ascending order
+    """
+    if not chunk_size or chunk_size <= 0:
+        return [(start_age, end_age)]
+    return [(age, min(age + chunk_size - 1, end_age)) for age in range(start_age, end_age + 1, chunk_size)]
+
+
+def build_tasks(
+    profile_names: List[str],
+    start_age: int,
+    end_age: int,
+    chunk_size: Optional[int] = None,
+    simplified_mode: bool = False,
+    output_dir: Optional[str] = None,
+    stage_cache: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Build the ordered task list (profiles as given, ages ascending).
+
+    A profile that fails to load becomes a single task with 'error' already
+    set, so it is reported with the other failures instead of aborting the batch.
+    """
+    tasks = []
+    for profile_name in profile_names:
+        try:
+            profile = load_profile(profile_name)
+        except Exception as e:
+            tasks.append({
+                'profile': profile_name,
+                'start_age': start_age,
+                'end_age': end_age,
+                'simplified_mode': simplified_mode,
+                'output_path': None,
+                'stage_cache_dir': None,
+                'error': f"{type(e).__name__}: {e}",
+            })
+            continue
+        directory = Path(output_dir) if output_dir else profile.output_dir
+        cache_dir = str(profile.profile_dir / 'cache' / 'life_arc') if stage_cache else None
+        for chunk_start, chunk_end in split_age_range(start_age, end_age, chunk_size):
+            filename = f"life_arc_data_{profile_name}_ages_{chunk_start}-{chunk_end}.json"
+            tasks.append({
+                'profile': profile_name,
+                'start_age': chunk_start,
+                'end_age': chunk_end,
+                'simplified_mode': simplified_mode,
+                'output_path': str(directory / filename),
+                'stage_cache_dir': cache_dir,
+            })
+    return tasks
+
+
+def init_worker(ephemeris_path: str = EPHEMERIS_PATH):
+    """Per-process setup: point Swiss Ephemeris at the bundled ephemeris files once."""
+    swe.set_ephe_path(ephemeris_path)
+
+
+def run_life_arc_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate and save one life arc timeline (runs inside a worker).
+
+    Returns:
+        The task dict plus 'seconds' and 'error' (None on success)
+    """
+    started = time.perf_counter()
+    result = dict(task, error=None)
+    try:
+        timeline = generate_life_arc_timeline(
+            profile_name=task['profile'],
+            start_age=task['start_age'],
+            end_age=task['end_age'],
+            include_fortune=True,
+            include_spirit=True,
+            include_progressions=False,
+            include_solar_returns=False,
+            current_date=None,
+            simplified_mode=task['simplified_mode'],
+            stage_cache=StageCache(task['stage_cache_dir']) if task.get('stage_cache_dir') else None
+        )
+        output_path = Path(task['output_path'])
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w') as f:
+            f.write(json.dumps(timeline, indent=2, default=str))
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def run_life_arc_batch(tasks: List[Dict[str, Any]], workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run life arc tasks across a process pool.
+
+    Tasks that already carry an 'error' (unloadable profiles) are not run;
+    they are passed through as failed results.
+
+    Args:
+        tasks: Tasks from build_tasks
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        {
+            'results': [task result, ...],   # Same order as tasks
+            'failed': [task result, ...],
+            'workers': int,
+            'wall_seconds': float,
+            'task_seconds': float            # Sum of per-task times
+        }
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    runnable = [task for task in tasks if not task.get('error')]
+
+    if workers == 1:
+        init_worker()
+        completed = [run_life_arc_task(task) for task in runnable]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            # map() yields in submission order, so output order is deterministic
+            completed = list(executor.map(run_life_arc_task, runnable))
+
+    completed_iter = iter(completed)
+    results = [
+        dict(task, seconds=0.0) if task.get('error') else next(completed_iter)
+        for task in tasks
+    ]
+
+    return {
+        'results': results,
+        'failed': [r for r in results if r['error']],
+        'workers': workers,
+        'wall_seconds': time.perf_counter() - started,
+        'task_seconds': sum(r['seconds'] for r in results),
+    }
+
+
+def format_batch_summary(summary: Dict[str, Any]) -> str:
+    """Format per-task timing and failures for display."""
+    output = []
+    output.append(f"\n{'='*80}")
+    output.append("LIFE ARC BATCH")
+    output.append(f"{'='*80}")
+
+    for result in summary['results']:
+        status = "FAILED" if result['error'] else "ok"
+        output.append(
+            f"{result['profile']:20} ages {result['start_age']:3}-{result['end_age']:<3} "
+            f"{result['seconds']:7.2f}s  {status}"
+        )
+
+    output.append(f"\nTasks: {len(summary['results'])}  Workers: {summary['workers']}")
+    output.append(f"Wall time: {summary['wall_seconds']:.2f}s  (task time {summary['task_seconds']:.2f}s)")
+
+    if summary['failed']:
+        output.append(f"\n❌ {len(summary['failed'])} task(s) failed:")
+        for result in summary['failed']:
+            output.append(f"   {result['profile']} ages {result['start_age']}-{result['end_age']}: {result['error']}")
+
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate life arc timelines for many profiles in parallel')
+    parser.add_argument('--profiles', nargs='+', help='Profile names (default: all profiles)')
+    parser.add_argument('--start-age', type=int, default=0, help='Starting age (default 0)')
+    parser.add_argument('--end-age', type=int, default=100, help='Ending age (default 100)')
+    parser.add_argument('--chunk-size', type=int, help='Split each profile into age chunks of this size')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--simplified', action='store_true', help='Simplified convergence scoring')
+    parser.add_argument('--output-dir', help='Output directory (default: profiles/<name>/output)')
+    parser.add_argument('--stage-cache', action='store_true',
+                        help='Reuse unchanged stages from profiles/<name>/cache/life_arc')
+
+    args = parser.parse_args()
+
+    try:
+        profile_names = args.profiles or list_profiles()
+        if not profile_names:
+            raise ValueError("No profiles found")
+
+        tasks = build_tasks(
+            profile_names, args.start_age, args.end_age,
+            chunk_size=args.chunk_size,
+            simplified_mode=args.simplified,
+            output_dir=args.output_dir,
+            stage_cache=args.stage_cache
+        )
+        summary = run_life_arc_batch(tasks, workers=args.workers)
+        print(format_batch_summary(summary))
+
+        if summary['failed']:
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
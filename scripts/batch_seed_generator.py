@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Batch Seed Generator
+Generates master_seed_data.yaml for many birth records in parallel.
+
+Reads a CSV or JSONL file of birth records (one person per row) and runs
+generate_seed_data for each in a ProcessPoolExecutor worker. Python startup,
+module imports and Swiss Ephemeris setup are paid once per worker instead of
+once per person, and timezone lookups are cached per worker. Each seed file
+(and its binary sidecar) is written atomically, and a manifest records the
+outcome of every record, so one bad row never stops the batch. Records that
+would write the same seed file as an earlier record are reported as errors.
+
+Record fields (CSV header or JSON keys):
+    name, date (YYYY-MM-DD), time (HH:MM:SS), location, lat, lon, timezone
+    Optional: lot_set (natal | life_arc | full), output (seed file path)
+
+Usage:
+    python batch_seed_generator.py --input clients.csv
+    python batch_seed_generator.py --input clients.jsonl --workers 8 --manifest seed_manifest.json
+    python batch_seed_generator.py --input clients.csv --lot-set life_arc --skip-existing
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from seed_data_generator import generate_seed_data, save_seed_data, init_ephemeris
+
+# Constants
+REQUIRED_FIELDS = ['name', 'date', 'time', 'location', 'lat', 'lon', 'timezone']
+LOT_SETS = ['natal', 'life_arc', 'full']
+
+
+def default_output_path(name: str) -> Path:
+    """Seed file location used by seed_data_generator.py when --output is not given."""
+    return Path(f'profiles/{name}/seed_data/master_seed_data.yaml')
+
+
+def read_records(path: str) -> List[Dict[str, Any]]:
+    """
+    Read raw birth records from a CSV (header row) or JSONL file.
+
+    Args:
+        path: .csv, .jsonl or .ndjson file
+
+    Returns:
+        One dict per row, in file order
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == '.csv':
+        with open(path, newline='') as f:
+            return [dict(row) for row in csv.DictReader(f)]
+
+    if suffix in ('.jsonl', '.ndjson'):
+        records = []
+        with open(path) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    records.append({'_error': f"line {line_number}: invalid JSON ({e.msg})"})
+        return records
+
+    raise ValueError(f"Unsupported input format '{path.suffix}' (expected .csv or .jsonl)")
+
+
+def build_seed_task(record: Dict[str, Any], index: int, lot_set: str = 'natal') -> Dict[str, Any]:
+    """
+    Validate one birth record and turn it into a seed task.
+
+    Invalid records still produce a task, carrying the validation error, so
+    they appear in the manifest alongside the successful ones.
+
+    Args:
+        record: Raw record from read_records
+        index: Position in the input file (0-based)
+        lot_set: Lot set used when the record does not name one
+
+    Returns:
+        {'index', 'name', 'args': {...} or None, 'output_path', 'error'}
+    """
+    name = str(record.get('name') or '').strip()
+    task = {'index': index, 'name': name or None, 'args': None, 'output_path': None, 'error': None}
+
+    if '_error' in record:
+        task['error'] = record['_error']
+        return task
+
+    missing = [field for field in REQUIRED_FIELDS if str(record.get(field) or '').strip() == '']
+    if missing:
+        task['error'] = f"missing field(s): {', '.join(missing)}"
+        return task
+
+    try:
+        date = str(record['date']).strip()
+        birth_time = str(record['time']).strip()
+        if len(birth_time) == 5:
+            birth_time += ':00'  # HH:MM
+        datetime.strptime(f"{date} {birth_time}", "%Y-%m-%d %H:%M:%S")
+        lat = float(record['lat'])
+        lon = float(record['lon'])
+    except ValueError as e:
+        task['error'] = f"invalid value: {e}"
+        return task
+
+    if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        task['error'] = f"coordinates out of range: {lat}, {lon}"
+        return task
+
+    record_lot_set = str(record.get('lot_set') or '').strip() or lot_set
+    if record_lot_set not in LOT_SETS:
+        task['error'] = f"unknown lot_set '{record_lot_set}'"
+        return task
+
+    output = str(record.get('output') or '').strip()
+    task['output_path'] = output or str(default_output_path(name))
+    task['args'] = {
+        'name': name,
+        'date': date,
+        'time': birth_time,
+        'location': str(record['location']).strip(),
+        'lat': lat,
+        'lon': lon,
+        'timezone': str(record['timezone']).strip(),
+        'lot_set': record_lot_set,
+    }
+    return task
+
+
+def mark_duplicate_outputs(tasks: List[Dict[str, Any]]) -> int:
+    """
+    Fail every task that would overwrite a seed file an earlier task writes.
+
+    Workers save concurrently, so two records with the same output path would
+    race; the first record keeps the path and later ones become errors.
+
+    Returns:
+        Number of tasks marked
+    """
+    first_by_path = {}
+    marked = 0
+    for task in tasks:
+        if task['error'] is not None:
+            continue
+        path = os.path.normcase(str(Path(task['output_path']).resolve()))
+        if path in first_by_path:
+            task['error'] = f"duplicate output path (record {first_by_path[path] + 1})"
+            marked += 1
+        else:
+            first_by_path[path] = task['index']
+    return marked
+
+
+def init_worker():
+    """Per-process setup: point Swiss Ephemeris at the bundled ephemeris files once."""
+    init_ephemeris()
+
+
+def run_seed_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate and save one seed file (runs inside a worker).
+
+    Returns:
+        Manifest entry: name, index, status ('ok', 'error' or 'skipped'),
+        output, error, seconds, and sect/ascendant on success
+    """
+    started = time.perf_counter()
+    result = {
+        'index': task['index'],
+        'name': task['name'],
+        'status': 'error',
+        'output': task['output_path'],
+        'error': task['error'],
+    }
+
+    if task['error'] is None:
+        try:
+            # generate_seed_data reports progress on stdout; keep worker output quiet
+            with contextlib.redirect_stdout(io.StringIO()):
+                seed_data = generate_seed_data(SimpleNamespace(**task['args']))
+                save_seed_data(seed_data, task['output_path'], task['name'])
+            result['status'] = 'ok'
+            result['sect'] = seed_data['chart_framework']['sect']['type']
+            result['ascendant'] = seed_data['chart_framework']['ascendant']['sign']
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+
+    result['seconds'] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def run_seed_batch(tasks: List[Dict[str, Any]], workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run seed tasks across a process pool.
+
+    Args:
+        tasks: Tasks from build_seed_task
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        {
+            'results': [manifest entry, ...],   # Same order as tasks
+            'workers': int,
+            'wall_seconds': float,
+            'task_seconds': float               # Sum of per-record times
+        }
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    if workers == 1:
+        init_worker()
+        results = [run_seed_task(task) for task in tasks]
+    else:
+        # Records are short (tens of ms), so hand them to workers in chunks
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            # map() yields in submission order, so the manifest follows the input file
+            results = list(executor.map(run_seed_task, tasks, chunksize=chunksize))
+
+    return {
+        'results': results,
+        'workers': workers,
+        'wall_seconds': time.perf_counter() - started,
+        'task_seconds': sum(r['seconds'] for r in results),
+    }
+
+
+def skipped_result(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Manifest entry for a record whose seed file already exists."""
+    return {
+        'index': task['index'],
+        'name': task['name'],
+        'status': 'skipped',
+        'output': task['output_path'],
+        'error': None,
+        'seconds': 0.0,
+    }
+
+
+def generate_seed_batch(
+    input_path: str,
+    workers: Optional[int] = None,
+    lot_set: str = 'natal',
+    skip_existing: bool = False
+) -> Dict[str, Any]:
+    """
+    Generate seed data for every record in a birth-records file.
+
+    Args:
+        input_path: CSV or JSONL birth records
+        workers: Worker processes (default: CPU count)
+        lot_set: Default lot set for records without one
+        skip_existing: Leave records whose seed file already exists untouched
+
+    Returns:
+        Manifest dict: input, generated_at, workers, timings, counts
+        and one result per record in input order
+    """
+    tasks = [build_seed_task(record, i, lot_set) for i, record in enumerate(read_records(input_path))]
+    mark_duplicate_outputs(tasks)
+
+    skipped = {}
+    if skip_existing:
+        for task in tasks:
+            if task['error'] is None and Path(task['output_path']).exists():
+                skipped[task['index']] = skipped_result(task)
+
+    summary = run_seed_batch([t for t in tasks if t['index'] not in skipped], workers)
+    by_index = {r['index']: r for r in summary['results']}
+    by_index.update(skipped)
+    results = [by_index[task['index']] for task in tasks]
+
+    wall_seconds = summary['wall_seconds']
+    generated = sum(1 for r in results if r['status'] == 'ok')
+    return {
+        'input': str(input_path),
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'workers': summary['workers'],
+        'wall_seconds': round(wall_seconds, 3),
+        'task_seconds': round(summary['task_seconds'], 3),
+        'records_per_second': round(generated / wall_seconds, 2) if wall_seconds > 0 else None,
+        'counts': {
+            'total': len(results),
+            'ok': generated,
+            'skipped': len(skipped),
+            'error': sum(1 for r in results if r['status'] == 'error'),
+        },
+        'results': results,
+    }
+
+
+def write_manifest(manifest: Dict[str, Any], path: str):
+    """Write the manifest JSON atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def format_manifest_summary(manifest: Dict[str, Any]) -> str:
+    """Format batch counts, throughput and failures for display."""
+    counts = manifest['counts']
+    output = []
+    output.append(f"\n{'='*80}")
+    output.append("SEED DATA BATCH")
+    output.append(f"{'='*80}")
+    output.append(f"Input: {manifest['input']}")
+    output.append(f"Records: {counts['total']}  Generated: {counts['ok']}  "
+                  f"Skipped: {counts['skipped']}  Failed: {counts['error']}")
+    output.append(f"Workers: {manifest['workers']}  Wall time: {manifest['wall_seconds']:.2f}s  "
+                  f"(task time {manifest['task_seconds']:.2f}s)")
+    if manifest['records_per_second']:
+        output.append(f"Throughput: {manifest['records_per_second']:.1f} records/s")
+
+    failed = [r for r in manifest['results'] if r['status'] == 'error']
+    if failed:
+        output.append(f"\n❌ {len(failed)} record(s) failed:")
+        for result in failed:
+            label = result['name'] or f"record {result['index'] + 1}"
+            output.append(f"   {label}: {result['error']}")
+
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate seed data for many birth records in parallel')
+    parser.add_argument('--input', required=True, help='Birth records file (.csv or .jsonl)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--manifest', default='seed_manifest.json',
+                        help='Per-record results file (default: seed_manifest.json)')
+    parser.add_argument('--lot-set', choices=LOT_SETS, default='natal',
+                        help='Lot set for records without a lot_set field (default: natal)')
+    parser.add_argument('--skip-existing', action='store_true',
+                        help='Skip records whose seed file already exists')
+
+    args = parser.parse_args()
+
+    try:
+        manifest = generate_seed_batch(
+            args.input,
+            workers=args.workers,
+            lot_set=args.lot_set,
+            skip_existing=args.skip_existing
+        )
+        write_manifest(manifest, args.manifest)
+        print(format_manifest_summary(manifest))
+        print(f"\nManifest: {args.manifest}")
+
+        if manifest['counts']['error']:
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Batch Transit Calculator
+Transit report data for many profiles over the same date window in one run.
+
+The transiting sky does not depend on the profile, so it is calculated ONCE
+for the whole window (calculate_transit_sky). Every natal chart then goes into
+a single NatalTargetIndex (natal longitude ± each aspect angle, sorted), and
+each transiting planet in each snapshot is matched against all profiles with
+one range query. The station calendar (stations and retrograde shadows) is
+shared the same way. Only the profile-specific work (timing context, tiering,
+durations, daily scores) runs per profile. One transit JSON is written per
+profile, exactly as transit_calculator.py would write it.
+
+Usage:
+    python batch_transit_calculator.py --start-date 2025-01-15 --end-date 2025-07-15
+    python batch_transit_calculator.py --profiles darren alice --start-date 2025-01-15 --duration 90
+    python batch_transit_calculator.py --start-date 2025-01-15 --duration 90 --verbose
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from profile_loader import load_profile, list_profiles
+from transit_calculator import (
+    calculate_transit_sky,
+    find_snapshot_aspects,
+    calculate_transit_report_data,
+    save_transit_data
+)
+from station_calendar import get_station_calendar
+
+
+def load_natal_charts(profile_names: List[str], orb: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect natal planets and snapshot orb for each profile.
+
+    Args:
+        profile_names: Profiles to include
+        orb: Custom orb override (otherwise each profile's transit_default_orb)
+
+    Returns:
+        {profile_name: {'planets': [...], 'orb': float}}
+    """
+    charts = {}
+    for profile_name in profile_names:
+        profile = load_profile(profile_name)
+        framework = profile.get_chart_framework() or {}
+        settings = framework.get('metadata', {}).get('settings', {})
+        charts[profile_name] = {
+            'planets': profile.get_planets(traditional_only=False),
+            'orb': orb if orb else float(settings.get('transit_default_orb', 2.0)),
+        }
+    return charts
+
+
+def run_transit_batch(
+    profile_names: List[str],
+    start_date: str,
+    end_date: str,
+    report_type: str = 'short',
+    orb: Optional[float] = None,
+    include_modern: bool = True,
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """
+    Calculate and save transit report data for many profiles.
+
+    Args:
+        profile_names: Profiles to process
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        report_type: 'short' or 'long'
+        orb: Custom orb override (optional)
+        include_modern: Include Uranus, Neptune, Pluto
+        verbose: Show per-profile progress output from transit_calculator
+
+    Returns:
+        {
+            'saved': {profile_name: output_path},
+            'failed': {profile_name: error message},
+            'timing': {'sky': s, 'matching': s, 'reports': s, 'total': s}
+        }
+    """
+    timing = {}
+    started = time.perf_counter()
+
+    sky = calculate_transit_sky(start_date, end_date, include_modern=include_modern)
+    station_calendar = get_station_calendar(start_date, end_date)
+    timing['sky'] = time.perf_counter() - started
+
+    mark = time.perf_counter()
+    charts = load_natal_charts(profile_names, orb)
+    snapshot_aspects = find_snapshot_aspects(sky, charts)
+    timing['matching'] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    saved = {}
+    failed = {}
+    for profile_name in profile_names:
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(sys.stdout if verbose else output):
+                report_data = calculate_transit_report_data(
+                    profile_name, start_date, end_date,
+                    report_type=report_type,
+                    orb=orb,
+                    include_modern=include_modern,
+                    sky=sky,
+                    snapshot_aspects=snapshot_aspects[profile_name],
+                    station_calendar=station_calendar
+                )
+                saved[profile_name] = save_transit_data(report_data, profile_name, start_date, end_date)
+        except Exception as e:
+            failed[profile_name] = str(e)
+    timing['reports'] = time.perf_counter() - mark
+    timing['total'] = time.perf_counter() - started
+
+    return {
+        'saved': saved,
+        'failed': failed,
+        'timing': timing,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calculate transit report data for many profiles')
+    parser.add_argument('--profiles', nargs='+', help='Profile names (default: all profiles)')
+    parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
+    parser.add_argument('--duration', type=int, help='Duration in days from start date')
+    parser.add_argument('--report-type', choices=['short', 'long'], default='short',
+                        help='Report type: short (all planets) or long (slower planets)')
+    parser.add_argument('--orb', type=float, help='Custom orb override')
+    parser.add_argument('--verbose', action='store_true', help='Show per-profile progress')
+
+    args = parser.parse_args()
+
+    try:
+        if args.end_date:
+            end_date = args.end_date
+        elif args.duration:
+            end_date = (datetime.strptime(args.start_date, '%Y-%m-%d') + timedelta(days=args.duration)).strftime('%Y-%m-%d')
+        else:
+            raise ValueError("Provide --end-date or --duration")
+
+        profile_names = args.profiles or list_profiles()
+        if not profile_names:
+            raise ValueError("No profiles found")
+
+        print(f"📊 Batch Transit Calculator")
+        print(f"Profiles: {len(profile_names)}")
+        print(f"Date Range: {args.start_date} to {end_date}\n")
+
+        result = run_transit_batch(
+            profile_names, args.start_date, end_date,
+            report_type=args.report_type,
+            orb=args.orb,
+            verbose=args.verbose
+        )
+
+        timing = result['timing']
+        print(f"\n✅ {len(result['saved'])} transit data files saved")
+        print(f"   Sky: {timing['sky']:.2f}s  Matching: {timing['matching']:.2f}s  "
+              f"Reports: {timing['reports']:.2f}s  Total: {timing['total']:.2f}s")
+
+        if result['failed']:
+            print(f"\n❌ {len(result['failed'])} profile(s) failed:")
+            for profile_name, error in result['failed'].items():
+                print(f"   {profile_name}: {error}")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+Reproducible timings for every pipeline stage, for comparing commits.
+
+Generates synthetic but realistic profiles with seed_data_generator
+(births at high, middle, equatorial and southern latitudes, day and night
+sect) in a temporary workspace, then times each stage per profile:
+
+    seed_generation   generate_seed_data + YAML/sidecar write
+    transit_short     calculate_transit_report_data, 90-day short report
+    transit_long      calculate_transit_report_data, 2-year long report
+    life_arc          generate_life_arc_timeline, ages 0-100
+    life_arc_full     the same with progressions and solar returns
+    pdf_render        pdf_generator.markdown_to_pdf on a synthetic report
+                      (skipped when weasyprint/markdown are not installed)
+
+Each measurement runs warmup iterations first (not recorded), then the
+timed repetitions. The life arc stages clear the process-level caches they
+fill (profiles, natal target and time-lord indexes, solar return charts,
+progressed ephemerides) and delete the on-disk progressed ephemeris tables
+before every timed run, so they measure a cold process with warm imports; the other stages measure warm runs. Peak Python memory is taken with tracemalloc in one
+extra run so it does not distort the timings. Pipeline output is silenced.
+Results are written as JSON and can be compared with an earlier run.
+
+Usage:
+    python benchmark.py
+    python benchmark.py --stages life_arc transit_short --repeat 5 --output bench_new.json
+    python benchmark.py --profiles 2 --compare bench_old.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Any, Optional
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from seed_data_generator import generate_seed_data, save_seed_data
+
+# Synthetic births: varied latitudes, day (noon) and night (pre-dawn) sect
+SYNTHETIC_PROFILES = [
+    {'name': 'bench_reykjavik_day', 'date': '1984-06-21', 'time': '12:30:00', 'location': 'Reykjavik, Iceland',
+     'lat': 64.1466, 'lon': -21.9426, 'timezone': 'Atlantic/Reykjavik'},
+    {'name': 'bench_denver_night', 'date': '1991-11-03', 'time': '03:15:00', 'location': 'Denver, CO',
+     'lat': 39.7392, 'lon': -104.9903, 'timezone': 'America/Denver'},
+    {'name': 'bench_singapore_day', 'date': '1978-02-14', 'time': '10:05:00', 'location': 'Singapore',
+     'lat': 1.3521, 'lon': 103.8198, 'timezone': 'Asia/Singapore'},
+    {'name': 'bench_buenos_aires_night', 'date': '2001-08-30', 'time': '22:40:00', 'location': 'Buenos Aires, Argentina',
+     'lat': -34.6037, 'lon': -58.3816, 'timezone': 'America/Argentina/Buenos_Aires'},
+    {'name': 'bench_london_night', 'date': '1966-12-24', 'time': '23:55:00', 'location': 'London, UK',
+     'lat': 51.5074, 'lon': -0.1278, 'timezone': 'Europe/London'},
+    {'name': 'bench_sydney_day', 'date': '1995-03-09', 'time': '14:20:00', 'location': 'Sydney, Australia',
+     'lat': -33.8688, 'lon': 151.2093, 'timezone': 'Australia/Sydney'},
+]
+
+STAGES = ['seed_generation', 'transit_short', 'transit_long', 'life_arc', 'life_arc_full', 'pdf_render']
+
+TRANSIT_START = '2025-01-01'
+TRANSIT_SHORT_END = '2025-04-01'
+TRANSIT_LONG_END = '2027-01-01'
+
+
+def seed_path(name: str) -> Path:
+    return Path('profiles') / name / 'seed_data' / 'master_seed_data.yaml'
+
+
+def run_seed_generation(profile: Dict[str, Any]) -> None:
+    args = SimpleNamespace(lot_set='natal', **profile)
+    save_seed_data(generate_seed_data(args), seed_path(profile['name']), profile['name'])
+
+
+def run_transit_short(profile: Dict[str, Any]) -> None:
+    from transit_calculator import calculate_transit_report_data
+    calculate_transit_report_data(profile['name'], TRANSIT_START, TRANSIT_SHORT_END, report_type='short')
+
+
+def run_transit_long(profile: Dict[str, Any]) -> None:
+    from transit_calculator import calculate_transit_report_data
+    calculate_transit_report_data(profile['name'], TRANSIT_START, TRANSIT_LONG_END, report_type='long')
+
+
+def run_life_arc(profile: Dict[str, Any]) -> None:
+    from life_arc_generator import generate_life_arc_timeline
+    generate_life_arc_timeline(profile['name'], 0, 100)
+
+
+def run_life_arc_full(profile: Dict[str, Any]) -> None:
+    from life_arc_generator import generate_life_arc_timeline
+    generate_life_arc_timeline(profile['name'], 0, 100, include_progressions=True, include_solar_returns=True)
+
+
+def clear_life_arc_caches() -> None:
+    """
+    Empty the caches a life arc run fills, so the next run starts cold.
+
+    Clears the process-level caches and deletes each workspace profile's
+    cache/progressed_ephemeris.bin, so every run rebuilds the progressed table.
+    """
+    import natal_target_index
+    import progressed_ephemeris
+    import profile_loader
+    import solar_returns
+    import time_lord_index
+    profile_loader.invalidate()
+    natal_target_index._profile_indexes.clear()
+    time_lord_index._timeline_indexes.clear()
+    solar_returns._solar_return_cache.clear()
+    progressed_ephemeris._ephemerides.clear()
+    for path in Path('profiles').glob(f'*/cache/{progressed_ephemeris.CACHE_FILENAME}'):
+        path.unlink()
+
+
+def synthetic_report(profile: Dict[str, Any], sections: int = 12) -> str:
+    """Markdown shaped like a life arc synthesis: headings, prose, lists and a table."""
+    lines = [f"# Life Arc Report: {profile['name']}", '']
+    for i in range(1, sections + 1):
+        lines += [f"## Chapter {i}: Ages {(i - 1) * 8}-{i * 8}", '']
+        lines += ["The timing techniques converge on a period of restructuring and growth. " * 6, '']
+        lines += ["### Key Themes", '']
+        lines += [f"- Theme {j}: profection year, zodiacal releasing and firdaria agree" for j in range(1, 6)]
+        lines += ['', '| Age | Technique | Event |', '|-----|-----------|-------|']
+        lines += [f"| {(i - 1) * 8 + j} | Profection | House {j % 12 + 1} year |" for j in range(8)]
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def run_pdf_render(profile: Dict[str, Any]) -> None:
+    from pdf_generator import markdown_to_pdf
+    output_dir = Path('profiles') / profile['name'] / 'output'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    md_path = output_dir / 'benchmark_report.md'
+    md_path.write_text(synthetic_report(profile), encoding='utf-8')
+    markdown_to_pdf(str(md_path), str(output_dir / 'benchmark_report.pdf'), str(seed_path(profile['name'])),
+                    'Benchmark Report', 'life_arc', use_cache=False)
+
+
+STAGE_RUNNERS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    'seed_generation': run_seed_generation,
+    'transit_short': run_transit_short,
+    'transit_long': run_transit_long,
+    'life_arc': run_life_arc,
+    'life_arc_full': run_life_arc_full,
+    'pdf_render': run_pdf_render,
+}
+
+# Run before every timed repetition (untimed)
+STAGE_SETUP: Dict[str, Callable[[], None]] = {
+    'life_arc': clear_life_arc_caches,
+    'life_arc_full': clear_life_arc_caches,
+}
+
+
+def stage_unavailable(stage: str) -> Optional[str]:
+    """Reason a stage cannot run in this environment (missing optional dependency), or None."""
+    if stage == 'pdf_render':
+        try:
+            import pdf_generator  # noqa: F401 (weasyprint and markdown are imported at module level)
+        except ImportError as e:
+            return str(e)
+    return None
+
+
+def measure(
+    func: Callable[[], None],
+    warmup: int,
+    repeat: int,
+    track_memory: bool,
+    setup: Optional[Callable[[], None]] = None
+) -> Dict[str, Any]:
+    """
+    Time a zero-argument callable.
+
+    Args:
+        func: Work to time (stdout is silenced)
+        warmup: Untimed runs first (imports, process-level caches)
+        repeat: Timed runs
+        track_memory: Also take the tracemalloc peak in one extra run
+        setup: Untimed call before each timed and memory run (e.g. clearing caches)
+
+    Returns:
+        {'times': [...], 'mean', 'median', 'min', 'max', 'stdev', 'peak_memory_kb'}
+    """
+    def quiet():
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+
+    for _ in range(warmup):
+        quiet()
+
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        quiet()
+        times.append(time.perf_counter() - start)
+
+    peak_kb = None
+    if track_memory:
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            quiet()
+            peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'times': times,
+        'mean': statistics.mean(times),
+        'median': statistics.median(times),
+        'min': min(times),
+        'max': max(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'peak_memory_kb': peak_kb,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    stages: List[str],
+    profiles: List[Dict[str, Any]],
+    warmup: int = 1,
+    repeat: int = 3,
+    track_memory: bool = True,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Benchmark pipeline stages on synthetic profiles in a temporary workspace.
+
+    Seed data is always generated first (untimed unless seed_generation is
+    selected), since every other stage reads it.
+
+    Returns:
+        {'metadata': {...}, 'stages': {stage: {'skipped'?, 'profiles': {name: measurement},
+                                                'median': total of profile medians}}}
+    """
+    results = {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'warmup': warmup,
+            'repeat': repeat,
+            'profiles': [p['name'] for p in profiles],
+        },
+        'stages': {},
+    }
+
+    original_cwd = Path.cwd()
+    with tempfile.TemporaryDirectory(prefix='astro_bench_') as workspace:
+        os.chdir(workspace)
+        try:
+            if 'seed_generation' not in stages:
+                for profile in profiles:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        run_seed_generation(profile)
+
+            for stage in stages:
+                reason = stage_unavailable(stage)
+                if reason:
+                    results['stages'][stage] = {'skipped': reason}
+                    if verbose:
+                        print(f"{stage:16} skipped ({reason})")
+                    continue
+
+                runner = STAGE_RUNNERS[stage]
+                per_profile = {}
+                for profile in profiles:
+                    per_profile[profile['name']] = measure(
+                        lambda profile=profile: runner(profile), warmup, repeat, track_memory,
+                        setup=STAGE_SETUP.get(stage)
+                    )
+                    if verbose:
+                        m = per_profile[profile['name']]
+                        memory = f"  peak {m['peak_memory_kb'] / 1024:7.1f} MB" if m['peak_memory_kb'] is not None else ''
+                        print(f"{stage:16} {profile['name']:26} median {m['median']:8.3f}s  "
+                              f"min {m['min']:8.3f}s{memory}")
+
+                results['stages'][stage] = {
+                    'profiles': per_profile,
+                    'median': sum(m['median'] for m in per_profile.values()),
+                }
+        finally:
+            os.chdir(original_cwd)
+
+    return results
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> str:
+    """Per-stage change in summed profile medians from a baseline results file."""
+    output = [
+        f"\n{'Benchmark comparison':^80}",
+        f"{'-'*80}",
+        f"Baseline: {baseline['metadata'].get('commit')}  Current: {current['metadata'].get('commit')}",
+        f"{'Stage':18} {'Baseline':>12} {'Current':>12} {'Change':>10}",
+    ]
+    for stage, result in current['stages'].items():
+        before = baseline['stages'].get(stage, {})
+        # Only profiles measured in both runs, so differing --profiles counts still compare
+        shared = [name for name in result.get('profiles', {}) if name in before.get('profiles', {})]
+        if not shared:
+            output.append(f"{stage:18} {'-':>12} {'-':>12} {'n/a':>10}")
+            continue
+        old = sum(before['profiles'][name]['median'] for name in shared)
+        new = sum(result['profiles'][name]['median'] for name in shared)
+        change = (new - old) / old * 100 if old else 0.0
+        output.append(f"{stage:18} {old:11.3f}s {new:11.3f}s {change:+9.1f}%")
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pipeline stages on synthetic profiles')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='Stages to time (default: all)')
+    parser.add_argument('--profiles', type=int, default=len(SYNTHETIC_PROFILES),
+                        help=f'Number of synthetic profiles (1-{len(SYNTHETIC_PROFILES)})')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed warmup runs per measurement (default 1)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per measurement (default 3)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak-memory run')
+    parser.add_argument('--output', help='Write results JSON here (default: benchmark_<commit>_<time>.json)')
+    parser.add_argument('--compare', help='Baseline results JSON to compare against')
+
+    args = parser.parse_args()
+
+    try:
+        if not 1 <= args.profiles <= len(SYNTHETIC_PROFILES):
+            raise ValueError(f"--profiles must be between 1 and {len(SYNTHETIC_PROFILES)}")
+        if args.repeat < 1 or args.warmup < 0:
+            raise ValueError("--repeat must be at least 1 and --warmup non-negative")
+
+        stages = [stage for stage in STAGES if stage in args.stages]
+        results = run_benchmarks(stages, SYNTHETIC_PROFILES[:args.profiles], args.warmup, args.repeat,
+                                 track_memory=not args.no_memory)
+
+        output_path = Path(args.output or
+                           f"benchmark_{results['metadata']['commit'] or 'nogit'}_{datetime.now():%Y%m%d_%H%M%S}.json")
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Results saved: {output_path}")
+
+        if args.compare:
+            with open(args.compare) as f:
+                print(compare_results(json.load(f), results))
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
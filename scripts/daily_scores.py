@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Daily Scores
+Sweep-line accumulation of daily transit quality scores.
+
+Every transit with a duration contributes its quality score to each day from
+its applying date through its separating date. Instead of testing every
+transit against every day, each transit adds its score at its applying day
+and subtracts it the day after separating (a difference array); one prefix
+sum then yields all daily totals in O(days + transits).
+
+Which transits contribute to which day is only needed for the days that are
+reported, so that index is built lazily, in a single sweep, on first use.
+Peak/low periods and the most auspicious/challenging days are then found in
+one pass over the daily totals.
+
+Usage:
+    python daily_scores.py --input profiles/darren/output/transit_data_darren_2025-10-01_to_2026-01-01.json
+"""
+
+import argparse
+import heapq
+import json
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+
+# Constants
+PEAK_THRESHOLD = 12          # Peak period: consecutive days above +12
+LOW_THRESHOLD = -12          # Low period: consecutive days below -12
+RANKED_DAYS = 20             # Auspicious/challenging days reported
+RANKED_MIN_SCORE = 5         # ...with |score| above 5
+
+
+class DailyScoreSeries:
+    """Daily score totals over an inclusive date range, fed by transit durations."""
+
+    def __init__(self, start_dt: datetime, end_dt: datetime):
+        self.start_dt = start_dt
+        self.days = max((end_dt - start_dt).days + 1, 0)
+        self._diff = [0] * (self.days + 1)
+        self._spans = []            # (first_day, last_day, contribution), in insertion order
+        self._scores = None
+        self._contributors = None
+
+    def add(self, applying_date: str, separating_date: str, score: int, contribution: Dict[str, Any]) -> bool:
+        """
+        Add one transit active from applying_date through separating_date.
+
+        Args:
+            applying_date: First active day (YYYY-MM-DD)
+            separating_date: Last active day (YYYY-MM-DD)
+            score: Quality score added to each active day
+            contribution: Entry listed under each active day
+
+        Returns:
+            True if the transit overlaps the date range
+        """
+        first = (datetime.strptime(applying_date, '%Y-%m-%d') - self.start_dt).days
+        last = (datetime.strptime(separating_date, '%Y-%m-%d') - self.start_dt).days
+        first, last = max(first, 0), min(last, self.days - 1)
+        if first > last:
+            return False
+
+        self._diff[first] += score
+        self._diff[last + 1] -= score
+        self._spans.append((first, last, contribution))
+        self._scores = None
+        self._contributors = None
+        return True
+
+    def date(self, index: int) -> str:
+        return (self.start_dt + timedelta(days=index)).strftime('%Y-%m-%d')
+
+    @property
+    def dates(self) -> List[str]:
+        return [self.date(i) for i in range(self.days)]
+
+    @property
+    def scores(self) -> List[int]:
+        """Daily totals (prefix sum of the difference array)."""
+        if self._scores is None:
+            scores = []
+            running = 0
+            for delta in self._diff[:self.days]:
+                running += delta
+                scores.append(running)
+            self._scores = scores
+        return self._scores
+
+    def transits_on(self, index: int) -> List[Dict[str, Any]]:
+        """Contributions active on a day (builds the per-day index on first call)."""
+        if self._contributors is None:
+            contributors = [[] for _ in range(self.days)]
+            for first, last, contribution in self._spans:
+                for day in range(first, last + 1):
+                    contributors[day].append(contribution)
+            self._contributors = contributors
+        return self._contributors[index]
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """{date: {'score': int, 'transits': [...]}} for every day in the range."""
+        scores = self.scores
+        return {
+            self.date(i): {'score': scores[i], 'transits': self.transits_on(i)}
+            for i in range(self.days)
+        }
+
+
+def accumulate_daily_scores(transits: List[Dict[str, Any]], start_dt: datetime, end_dt: datetime) -> DailyScoreSeries:
+    """
+    Accumulate the quality scores of all transits that have a duration.
+
+    Transits sharing an 'episode_id' (the weekly snapshots of one episode all
+    carry its full duration) are counted once, by their first occurrence.
+
+    Args:
+        transits: Transit aspects (with 'duration' and 'quality_score')
+        start_dt: First day
+        end_dt: Last day (inclusive)
+
+    Returns:
+        DailyScoreSeries
+    """
+    series = DailyScoreSeries(start_dt, end_dt)
+    counted_episodes = set()
+    for transit in transits:
+        episode_id = transit.get('episode_id')
+        if episode_id is not None:
+            if episode_id in counted_episodes:
+                continue
+            counted_episodes.add(episode_id)
+        if transit.get('duration'):
+            try:
+                transit_score = transit['quality_score']['score']
+                series.add(
+                    transit['duration']['applying_date'],
+                    transit['duration']['separating_date'],
+                    transit_score,
+                    {
+                        'transiting': transit['transiting_planet'],
+                        'natal': transit['natal_planet'],
+                        'aspect': transit['aspect_type'],
+                        'score': transit_score
+                    }
+                )
+            except (KeyError, TypeError, ValueError):
+                # Incomplete duration data: leave this transit out of the daily totals
+                pass
+    return series
+
+
+def _close_period(period: Optional[Dict[str, Any]], periods: List[Dict[str, Any]]) -> None:
+    if period is not None:
+        periods.append(period)
+
+
+def analyze_daily_scores(series: DailyScoreSeries) -> Dict[str, Any]:
+    """
+    Peak/low periods and best/worst days, in one pass over the daily totals.
+
+    Returns:
+        {
+            'peak_periods': [...],          # Consecutive days above PEAK_THRESHOLD
+            'low_periods': [...],           # Consecutive days below LOW_THRESHOLD
+            'most_auspicious_day': {...} or None,
+            'auspicious_days': [...],       # Up to RANKED_DAYS, highest first
+            'most_challenging_day': {...} or None,
+            'challenging_days': [...]       # Up to RANKED_DAYS, lowest first
+        }
+    """
+    scores = series.scores
+    peak_periods = []
+    low_periods = []
+    current_peak = None
+    current_low = None
+    best = None
+    worst = None
+    positive = []
+    negative = []
+
+    for i, score in enumerate(scores):
+        date_key = series.date(i)
+
+        # Highest score (earliest day on ties) and lowest score (latest day on ties)
+        if best is None or score > scores[best]:
+            best = i
+        if worst is None or score <= scores[worst]:
+            worst = i
+
+        if score > RANKED_MIN_SCORE:
+            positive.append(i)
+        elif score < -RANKED_MIN_SCORE:
+            negative.append(i)
+
+        if score > PEAK_THRESHOLD:
+            if current_peak is None:
+                current_peak = {
+                    'start_date': date_key,
+                    'end_date': date_key,
+                    'total_score': score,
+                    'peak_score': score,
+                    'days': [date_key]
+                }
+            else:
+                current_peak['end_date'] = date_key
+                current_peak['total_score'] += score
+                current_peak['peak_score'] = max(current_peak['peak_score'], score)
+                current_peak['days'].append(date_key)
+        else:
+            _close_period(current_peak, peak_periods)
+            current_peak = None
+
+        if score < LOW_THRESHOLD:
+            if current_low is None:
+                current_low = {
+                    'start_date': date_key,
+                    'end_date': date_key,
+                    'total_score': score,
+                    'low_score': score,
+                    'days': [date_key]
+                }
+            else:
+                current_low['end_date'] = date_key
+                current_low['total_score'] += score
+                current_low['low_score'] = min(current_low['low_score'], score)
+                current_low['days'].append(date_key)
+        else:
+            _close_period(current_low, low_periods)
+            current_low = None
+
+    # Add final periods if they run to the end of the range
+    _close_period(current_peak, peak_periods)
+    _close_period(current_low, low_periods)
+
+    def day_entry(i: int) -> Dict[str, Any]:
+        return {'date': series.date(i), 'score': scores[i], 'transits': series.transits_on(i)}
+
+    # Ties: earlier days rank first among auspicious days, later days among challenging days
+    auspicious = heapq.nsmallest(RANKED_DAYS, positive, key=lambda i: (-scores[i], i))
+    challenging = heapq.nsmallest(RANKED_DAYS, negative, key=lambda i: (scores[i], -i))
+
+    return {
+        'peak_periods': peak_periods,
+        'low_periods': low_periods,
+        'most_auspicious_day': day_entry(best) if best is not None and scores[best] > 0 else None,
+        'auspicious_days': [day_entry(i) for i in auspicious],
+        'most_challenging_day': day_entry(worst) if worst is not None and scores[worst] < 0 else None,
+        'challenging_days': [day_entry(i) for i in challenging],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recompute daily scores from saved transit data')
+    parser.add_argument('--input', required=True, help='Transit data JSON (from transit_calculator.py)')
+
+    args = parser.parse_args()
+
+    try:
+        with open(args.input, 'r') as f:
+            data = json.load(f)
+
+        start_dt = datetime.strptime(data['date_range']['start'], '%Y-%m-%d')
+        end_dt = datetime.strptime(data['date_range']['end'], '%Y-%m-%d')
+        series = accumulate_daily_scores(data['all_transits'], start_dt, end_dt)
+        analysis = analyze_daily_scores(series)
+
+        print(f"\n{series.days} days, {len(data['all_transits'])} transits")
+        print(f"Peak periods: {len(analysis['peak_periods'])}  Low periods: {len(analysis['low_periods'])}")
+        for label, key in (('Most auspicious', 'most_auspicious_day'), ('Most challenging', 'most_challenging_day')):
+            day = analysis[key]
+            if day:
+                print(f"{label} day: {day['date']} (score: {day['score']:+d}, {len(day['transits'])} transits)")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
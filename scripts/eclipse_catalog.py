@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Eclipse Catalog
+Every solar and lunar eclipse in a span of years, searched once and stored as a compact table.
+
+Swiss Ephemeris finds eclipses one at a time (swe.sol_eclipse_when_glob,
+swe.lun_eclipse_when), each search stepping through lunations - far too slow
+to repeat for every report. This module runs the searches once for a whole
+span (1900-2100 by default), records type, time of maximum, ecliptic
+longitude, magnitude and saros series/member per eclipse, and writes them to
+ephemeris/eclipse_catalog.bin as one sorted fixed-width table that is memory
+mapped on load.
+
+Queries are binary searches on time: the eclipses in a window cost
+O(log n), and matching them to a natal chart is one NatalTargetIndex range
+query per eclipse (conjunction and opposition to planets and angles).
+
+File layout (little-endian):
+    Header:  magic 'ECLCAT01', version, eclipse count, jd_start, jd_end
+    Records: ECLIPSE_DTYPE rows sorted by time of maximum
+
+Usage:
+    python eclipse_catalog.py --build --start-year 1900 --end-year 2100
+    python eclipse_catalog.py --start-date 2025-01-01 --end-date 2026-12-31
+    python eclipse_catalog.py --start-date 2025-01-01 --end-date 2026-12-31 --profile darren --orb 3
+"""
+
+import argparse
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+import numpy as np
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from aspect_solver import jd_to_datetime
+from ephemeris_cache import EPHEMERIS_DIR, get_cached_span
+from ephemeris_sampler import SIGNS
+from natal_target_index import NatalTargetIndex
+from profile_loader import load_profile
+from transits import calculate_julian_day
+
+# Constants
+DEFAULT_CATALOG_PATH = EPHEMERIS_DIR / 'eclipse_catalog.bin'
+DEFAULT_START_YEAR = 1900
+DEFAULT_END_YEAR = 2100
+
+MAGIC = b'ECLCAT01'
+VERSION = 1
+HEADER_FORMAT = '<8sIIdd'
+
+ECLIPSE_DTYPE = np.dtype([
+    ('jd', '<f8'),              # Time of maximum eclipse (UT)
+    ('longitude', '<f8'),       # Sun (solar) or Moon (lunar) longitude at maximum
+    ('magnitude', '<f4'),       # Solar: max magnitude; lunar: umbral magnitude
+    ('flags', '<i4'),           # Swiss Ephemeris eclipse type flags
+    ('saros_series', '<i2'),
+    ('saros_member', '<i2'),
+    ('kind', 'u1'),             # 0 = solar, 1 = lunar
+])
+
+KINDS = ('solar', 'lunar')
+
+# Eclipse type from the Swiss Ephemeris flags (first match wins)
+ECLIPSE_TYPES = (
+    (swe.ECL_ANNULAR_TOTAL, 'hybrid'),
+    (swe.ECL_TOTAL, 'total'),
+    (swe.ECL_ANNULAR, 'annular'),
+    (swe.ECL_PARTIAL, 'partial'),
+    (swe.ECL_PENUMBRAL, 'penumbral'),
+)
+
+# Aspects that count as an eclipse contact with a natal point
+CONTACT_ASPECTS = {'conjunction': 0, 'opposition': 180}
+
+DEFAULT_FLAGS = swe.FLG_SWIEPH
+
+_catalogs = {}
+
+
+def eclipse_type(flags: int) -> str:
+    """Type name ('total', 'annular', 'hybrid', 'partial', 'penumbral') from eclipse flags."""
+    for flag, name in ECLIPSE_TYPES:
+        if flags & flag:
+            return name
+    return 'unknown'
+
+
+def _search(kind: str, jd_start: float, jd_end: float) -> List[tuple]:
+    """Every eclipse of one kind with maximum in [jd_start, jd_end), as ECLIPSE_DTYPE rows."""
+    rows = []
+    jd = jd_start
+    while True:
+        if kind == 'solar':
+            flags, times = swe.sol_eclipse_when_glob(jd, DEFAULT_FLAGS, 0, False)
+        else:
+            flags, times = swe.lun_eclipse_when(jd, DEFAULT_FLAGS, 0, False)
+        jd_max = times[0]
+        if jd_max >= jd_end:
+            break
+
+        if kind == 'solar':
+            # Global maximum: magnitude and saros come from the point of greatest eclipse
+            _, _, attributes = swe.sol_eclipse_where(jd_max, DEFAULT_FLAGS)
+            body = swe.SUN
+        else:
+            _, attributes = swe.lun_eclipse_how(jd_max, (0.0, 0.0, 0.0), DEFAULT_FLAGS)
+            body = swe.MOON
+        position, _ = swe.calc_ut(jd_max, body, DEFAULT_FLAGS)
+
+        rows.append((
+            jd_max, position[0] % 360.0, attributes[0], flags,
+            int(attributes[9]), int(attributes[10]), KINDS.index(kind)
+        ))
+        # Eclipses of one kind are at least a lunation apart
+        jd = jd_max + 20.0
+
+    return rows
+
+
+def calculate_eclipses(start_year: int, end_year: int) -> np.ndarray:
+    """
+    Search every solar and lunar eclipse from 1 January start_year through 31 December end_year.
+
+    Returns:
+        ECLIPSE_DTYPE array sorted by time of maximum
+    """
+    swe.set_ephe_path(str(EPHEMERIS_DIR))
+    jd_start = swe.julday(start_year, 1, 1, 0.0)
+    jd_end = swe.julday(end_year + 1, 1, 1, 0.0)
+
+    rows = _search('solar', jd_start, jd_end) + _search('lunar', jd_start, jd_end)
+    table = np.array(rows, dtype=ECLIPSE_DTYPE)
+    return np.sort(table, order='jd')
+
+
+def build_catalog(
+    start_year: int = DEFAULT_START_YEAR,
+    end_year: int = DEFAULT_END_YEAR,
+    path: Union[str, Path] = DEFAULT_CATALOG_PATH
+) -> 'EclipseCatalog':
+    """
+    Search the eclipses of a span of years and write the catalog file.
+
+    Args:
+        start_year: First covered year
+        end_year: Last covered year (included)
+        path: Output file (default ephemeris/eclipse_catalog.bin)
+
+    Returns:
+        EclipseCatalog over the written file
+    """
+    if end_year < start_year:
+        raise ValueError("End year must not be before start year")
+
+    table = calculate_eclipses(start_year, end_year)
+    jd_start = swe.julday(start_year, 1, 1, 0.0)
+    jd_end = swe.julday(end_year + 1, 1, 1, 0.0)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(table), jd_start, jd_end))
+        f.write(table.tobytes())
+    temp_path.replace(path)
+
+    _catalogs.pop(str(path), None)
+    return EclipseCatalog.load(path)
+
+
+class EclipseCatalog:
+    """Sorted eclipse table (memory-mapped from disk, or built in memory)."""
+
+    def __init__(self, table: np.ndarray, jd_start: float, jd_end: float, path: Optional[Path] = None):
+        """
+        Args:
+            table: ECLIPSE_DTYPE rows sorted by 'jd'
+            jd_start: Start of the searched span
+            jd_end: End of the searched span (exclusive)
+            path: Backing file, if any
+        """
+        self.table = table
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self.path = path
+        self._jds = np.asarray(table['jd'])
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_CATALOG_PATH) -> 'EclipseCatalog':
+        """Memory-map a catalog file written by build_catalog."""
+        path = Path(path)
+        with open(path, 'rb') as f:
+            header = f.read(struct.calcsize(HEADER_FORMAT))
+        magic, version, count, jd_start, jd_end = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not an eclipse catalog file: {path}")
+
+        table = np.memmap(path, dtype=ECLIPSE_DTYPE, mode='r',
+                          offset=struct.calcsize(HEADER_FORMAT), shape=(count,))
+        return cls(table, jd_start, jd_end, path)
+
+    @classmethod
+    def for_years(cls, start_year: int, end_year: int) -> 'EclipseCatalog':
+        """Catalog searched in memory (not written to disk)."""
+        return cls(
+            calculate_eclipses(start_year, end_year),
+            swe.julday(start_year, 1, 1, 0.0),
+            swe.julday(end_year + 1, 1, 1, 0.0)
+        )
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def covers(self, jd_start: float, jd_end: float) -> bool:
+        return self.jd_start <= jd_start and jd_end <= self.jd_end
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        row = self.table[i]
+        jd = float(row['jd'])
+        longitude = float(row['longitude'])
+        flags = int(row['flags'])
+        dt = jd_to_datetime(jd)
+        return {
+            'kind': KINDS[int(row['kind'])],
+            'type': eclipse_type(flags),
+            'date': dt.strftime('%Y-%m-%d'),
+            'time': dt.strftime('%Y-%m-%d %H:%M'),
+            'jd': jd,
+            'longitude': longitude,
+            'sign': SIGNS[int(longitude / 30) % 12],
+            'degree': longitude % 30,
+            'magnitude': float(row['magnitude']),
+            'saros_series': int(row['saros_series']),
+            'saros_member': int(row['saros_member']),
+        }
+
+    def between(self, jd_start: float, jd_end: float) -> List[Dict[str, Any]]:
+        """Eclipses with maximum in [jd_start, jd_end], chronological."""
+        first = int(np.searchsorted(self._jds, jd_start, side='left'))
+        last = int(np.searchsorted(self._jds, jd_end, side='right'))
+        return [self._record(i) for i in range(first, last)]
+
+    def near_points(
+        self,
+        points: List[Dict[str, Any]],
+        jd_start: float,
+        jd_end: float,
+        orb: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Eclipses in a window, each with its contacts to natal points.
+
+        Args:
+            points: Natal points with 'name' and 'longitude' (planets, angles)
+            jd_start: Window start (Julian Day, UT)
+            jd_end: Window end (Julian Day, UT)
+            orb: Maximum distance from conjunction or opposition, in degrees
+
+        Returns:
+            Eclipse records (see between) with 'natal_contacts':
+            [{'natal_point', 'aspect_type', 'orb'}, ...] sorted by orb
+        """
+        index = NatalTargetIndex(CONTACT_ASPECTS)
+        index.add_chart('natal', points)
+
+        eclipses = self.between(jd_start, jd_end)
+        for eclipse in eclipses:
+            hits = sorted(index.query(eclipse['longitude'], orb), key=lambda hit: (hit[1], hit[0]['order']))
+            eclipse['natal_contacts'] = [
+                {'natal_point': entry['natal_planet'], 'aspect_type': entry['aspect_type'], 'orb': distance}
+                for entry, distance in hits
+            ]
+        return eclipses
+
+
+def get_eclipse_catalog(start_date: str, end_date: str, path: Union[str, Path] = DEFAULT_CATALOG_PATH) -> EclipseCatalog:
+    """
+    Eclipse catalog covering a date range.
+
+    Uses the catalog file when it covers the range; otherwise searches the
+    range's years (plus a year each side) in memory - see get_cached_span.
+    Catalogs are kept for the life of the process.
+    """
+    return get_cached_span(EclipseCatalog, DEFAULT_CATALOG_PATH, start_date, end_date, _catalogs, path)
+
+
+def natal_points(profile) -> List[Dict[str, Any]]:
+    """Natal planets plus Ascendant and Midheaven of a loaded profile."""
+    points = [{'name': p['name'], 'longitude': p['longitude']} for p in profile.get_planets()]
+    framework = profile.get_chart_framework() or {}
+    for name, key in (('Ascendant', 'ascendant'), ('Midheaven', 'midheaven')):
+        if framework.get(key, {}).get('longitude') is not None:
+            points.append({'name': name, 'longitude': framework[key]['longitude']})
+    return points
+
+
+def format_eclipses(eclipses: List[Dict[str, Any]]) -> str:
+    """Format eclipse records for display."""
+    output = []
+    output.append(f"\n{'='*80}")
+    output.append(f"ECLIPSES ({len(eclipses)})")
+    output.append(f"{'='*80}")
+    for eclipse in eclipses:
+        output.append(
+            f"{eclipse['time']} UT  {eclipse['kind']:5} {eclipse['type']:9} "
+            f"{eclipse['degree']:5.2f}° {eclipse['sign']:11} mag {eclipse['magnitude']:.3f}  "
+            f"saros {eclipse['saros_series']}/{eclipse['saros_member']}"
+        )
+        for contact in eclipse.get('natal_contacts', []):
+            output.append(f"    {contact['aspect_type']:12} natal {contact['natal_point']:10} orb {contact['orb']:.2f}°")
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the eclipse catalog')
+    parser.add_argument('--build', action='store_true', help='Search eclipses and write the catalog file')
+    parser.add_argument('--start-year', type=int, default=DEFAULT_START_YEAR, help='First year for --build')
+    parser.add_argument('--end-year', type=int, default=DEFAULT_END_YEAR, help='Last year for --build')
+    parser.add_argument('--start-date', help='Window start (YYYY-MM-DD)')
+    parser.add_argument('--end-date', help='Window end (YYYY-MM-DD)')
+    parser.add_argument('--profile', help='Show contacts with this profile\'s natal points')
+    parser.add_argument('--orb', type=float, default=3.0, help='Contact orb in degrees (default 3°)')
+    parser.add_argument('--path', default=str(DEFAULT_CATALOG_PATH), help='Catalog file')
+
+    args = parser.parse_args()
+
+    try:
+        if args.build:
+            catalog = build_catalog(args.start_year, args.end_year, args.path)
+            print(f"Wrote {len(catalog)} eclipses ({args.start_year}-{args.end_year}) to {args.path}")
+            return
+
+        if not (args.start_date and args.end_date):
+            raise ValueError("Provide --build, or --start-date and --end-date")
+
+        catalog = get_eclipse_catalog(args.start_date, args.end_date, args.path)
+        jd_start = calculate_julian_day(args.start_date) - 0.5
+        jd_end = calculate_julian_day(args.end_date) + 0.5
+
+        if args.profile:
+            profile = load_profile(args.profile)
+            eclipses = catalog.near_points(natal_points(profile), jd_start, jd_end, args.orb)
+        else:
+            eclipses = catalog.between(jd_start, jd_end)
+        print(format_eclipses(eclipses))
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
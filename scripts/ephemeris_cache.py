@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Ephemeris Cache
+Precomputed Chebyshev ephemeris for the ten planets, shared across runs on disk.
+
+Every batch job (transit reports, life arcs, progressions) asks Swiss Ephemeris
+for the same planets on the same calendar days. This module fits each body with
+piecewise Chebyshev polynomials over a date span once, stores the coefficients
+in a memory-mappable binary file next to ephemeris/seas_18.se1, and afterwards
+serves longitude, latitude and speed by polynomial evaluation (a few
+microseconds per lookup). Outside the cached span, or for bodies that are not
+cached, it falls back to live swe.calc_ut.
+
+Accuracy:
+    Fits are interpolations at Chebyshev nodes, checked against swe.calc_ut at
+    VALIDATION_POINTS points inside every segment while building. The build
+    fails if any body exceeds ACCURACY_BOUND (0.002° longitude/latitude) or,
+    away from the Sun, a speed error of SPEED_RELATIVE_BOUND (1%) of the
+    body's fastest speed in the span - about 4e-4°/day for Pluto, 0.02°/day
+    for Mercury. Measured errors there stay below 3.5e-4°/day.
+
+    Within SOLAR_ELONGATION_LIMIT of the Sun, Swiss Ephemeris applies
+    gravitational light deflection, which bends the live speed sharply over
+    a day or so (up to ~0.03°/day for Uranus). No polynomial follows it, and
+    shorter segments do not help. The build instead requires the fitted speed
+    to keep the live speed's sign there. Superior planets are at their
+    fastest direct motion at conjunction, and Mercury and Venus are well
+    into retrograde motion at inferior conjunction.
+
+    Speeds near zero are where the sign can differ, so a cached retrograde
+    flag can disagree with a live one within a few hours of a station. The
+    measured maximum speed error away from the Sun, per body, is stored in
+    the file and shown when the script runs without --build.
+
+File layout (little-endian):
+    Header:      magic 'EPHCHEB1', version, body count, jd_start, jd_end
+    Body table:  body id, coefficient count, segment days, data offset,
+                 max longitude error, max speed error (one row per body)
+    Data:        float64 array (n_segments, 2, n_coefficients) per body,
+                 row 0 = unwrapped longitude, row 1 = latitude
+
+Usage:
+    python ephemeris_cache.py --build --start-date 1900-01-01 --end-date 2100-12-31
+    python ephemeris_cache.py
+    python ephemeris_cache.py --check --date 2025-06-01
+"""
+
+import argparse
+import struct
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+import numpy as np
+import swisseph as swe
+
+# Constants
+EPHEMERIS_DIR = Path(__file__).parent.parent / 'ephemeris'
+DEFAULT_CACHE_PATH = EPHEMERIS_DIR / 'ephemeris_cache.bin'
+
+MAGIC = b'EPHCHEB1'
+VERSION = 1
+HEADER_FORMAT = '<8sIIdd'
+BODY_FORMAT = '<iIdqdd'
+
+DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Segment length in days per body (14 coefficients per segment)
+SEGMENT_DAYS = {
+    swe.SUN: 16.0,
+    swe.MOON: 4.0,
+    swe.MERCURY: 8.0,
+    swe.VENUS: 16.0,
+    swe.MARS: 16.0,
+    swe.JUPITER: 32.0,
+    swe.SATURN: 32.0,
+    swe.URANUS: 32.0,
+    swe.NEPTUNE: 32.0,
+    swe.PLUTO: 32.0,
+}
+COEFFICIENTS = 14
+
+# Build-time verification
+VALIDATION_POINTS = 8
+ACCURACY_BOUND = 0.002          # Degrees (longitude and latitude)
+SPEED_RELATIVE_BOUND = 0.01     # Speed error, as a fraction of the body's fastest speed
+SOLAR_ELONGATION_LIMIT = 1.0    # Degrees from the Sun where light deflection applies
+
+# Years added on each side of a range computed in memory by get_cached_span
+SPAN_MARGIN_YEARS = 1
+
+_default_cache = None
+_default_cache_loaded = False
+
+
+def _chebyshev_nodes(count: int) -> np.ndarray:
+    """Chebyshev points of the first kind on [-1, 1], ascending."""
+    return np.cos(np.pi * (np.arange(count) + 0.5) / count)[::-1]
+
+
+def _clenshaw(coefficients: List[float], x: float) -> Tuple[float, float]:
+    """Evaluate a Chebyshev series and its derivative (d/dx) at x."""
+    b1 = b2 = 0.0
+    d1 = d2 = 0.0
+    for k in range(len(coefficients) - 1, 0, -1):
+        d1, d2 = 2 * b1 + 2 * x * d1 - d2, d1
+        b1, b2 = coefficients[k] + 2 * x * b1 - b2, b1
+    return coefficients[0] + x * b1 - b2, b1 + x * d1 - d2
+
+
+def _live_position(body_id: int, jd: float) -> Tuple[float, float, float]:
+    position, _ = swe.calc_ut(jd, body_id, DEFAULT_FLAGS)
+    return position[0], position[1], position[3]
+
+
+def _fit_body(body_id: int, jd_start: float, jd_end: float) -> Dict[str, Any]:
+    """
+    Fit one body over [jd_start, jd_end] and measure the fit error.
+
+    Speed errors are measured away from the Sun only. Within
+    SOLAR_ELONGATION_LIMIT the fit is checked for the sign of the speed instead.
+    """
+    segment_days = SEGMENT_DAYS[body_id]
+    n_segments = int(np.ceil((jd_end - jd_start) / segment_days))
+    nodes = _chebyshev_nodes(COEFFICIENTS)
+    checks = np.linspace(-1.0, 1.0, VALIDATION_POINTS + 2)[1:-1]
+
+    coefficients = np.empty((n_segments, 2, COEFFICIENTS), dtype=np.float64)
+    max_error = 0.0
+    max_speed_error = 0.0
+    speed_scale = 0.0
+    solar_sign_errors = 0
+
+    for segment in range(n_segments):
+        seg_start = jd_start + segment * segment_days
+        samples = np.array([_live_position(body_id, seg_start + (x + 1) * segment_days / 2) for x in nodes])
+        longitude = np.unwrap(samples[:, 0], period=360.0)
+
+        coefficients[segment, 0] = np.polynomial.chebyshev.chebfit(nodes, longitude, COEFFICIENTS - 1)
+        coefficients[segment, 1] = np.polynomial.chebyshev.chebfit(nodes, samples[:, 1], COEFFICIENTS - 1)
+
+        for x in checks.tolist():
+            lon, lat, speed = _live_position(body_id, seg_start + (x + 1) * segment_days / 2)
+            fit_lon, fit_speed = _clenshaw(coefficients[segment, 0].tolist(), x)
+            fit_lat, _ = _clenshaw(coefficients[segment, 1].tolist(), x)
+            fit_speed *= 2 / segment_days
+            lon_error = abs((fit_lon - lon + 180.0) % 360.0 - 180.0)
+            max_error = max(max_error, lon_error, abs(fit_lat - lat))
+            speed_scale = max(speed_scale, abs(speed))
+
+            if body_id != swe.SUN:
+                sun_lon = _live_position(swe.SUN, seg_start + (x + 1) * segment_days / 2)[0]
+                if abs((lon - sun_lon + 180.0) % 360.0 - 180.0) < SOLAR_ELONGATION_LIMIT:
+                    solar_sign_errors += (fit_speed < 0) != (speed < 0)
+                    continue
+            max_speed_error = max(max_speed_error, abs(fit_speed - speed))
+
+    return {
+        'body_id': body_id,
+        'segment_days': segment_days,
+        'coefficients': coefficients,
+        'max_error': max_error,
+        'max_speed_error': max_speed_error,
+        'speed_scale': speed_scale,
+        'solar_sign_errors': solar_sign_errors,
+    }
+
+
+def build_cache(
+    start_date: str,
+    end_date: str,
+    path: Union[str, Path] = DEFAULT_CACHE_PATH,
+    bodies: Optional[Sequence[int]] = None
+) -> Dict[str, Any]:
+    """
+    Precompute Chebyshev segments and write the cache file.
+
+    Args:
+        start_date: First covered date (YYYY-MM-DD)
+        end_date: Last covered date (YYYY-MM-DD), included
+        path: Output file (default ephemeris/ephemeris_cache.bin)
+        bodies: Swiss Ephemeris body ids (default Sun through Pluto)
+
+    Returns:
+        Summary dict from EphemerisCache.info() for the written file
+
+    Raises:
+        ValueError: If the span is empty or a body exceeds the accuracy bound
+    """
+    swe.set_ephe_path(str(EPHEMERIS_DIR))
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    jd_start = swe.julday(start.year, start.month, start.day, 0.0)
+    jd_end = swe.julday(end.year, end.month, end.day, 24.0)
+    if jd_end <= jd_start:
+        raise ValueError("End date must be after start date")
+
+    fits = [_fit_body(body_id, jd_start, jd_end) for body_id in (bodies or list(SEGMENT_DAYS))]
+
+    for fit in fits:
+        speed_bound = SPEED_RELATIVE_BOUND * fit['speed_scale']
+        if fit['max_error'] > ACCURACY_BOUND or fit['max_speed_error'] > speed_bound:
+            raise ValueError(
+                f"Body {fit['body_id']} fit error {fit['max_error']:.2e}° "
+                f"(speed {fit['max_speed_error']:.2e}°/day, bound {speed_bound:.2e}) exceeds accuracy bound"
+            )
+        if fit['solar_sign_errors']:
+            raise ValueError(
+                f"Body {fit['body_id']} fitted speed changes sign near the Sun "
+                f"({fit['solar_sign_errors']} validation points)"
+            )
+
+    # Data blocks start after the header and body table, 8-byte aligned
+    offset = struct.calcsize(HEADER_FORMAT) + len(fits) * struct.calcsize(BODY_FORMAT)
+    offset += -offset % 8
+    table = []
+    for fit in fits:
+        table.append(struct.pack(
+            BODY_FORMAT, fit['body_id'], COEFFICIENTS, fit['segment_days'],
+            offset, fit['max_error'], fit['max_speed_error']
+        ))
+        offset += fit['coefficients'].nbytes
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(fits), jd_start, jd_end))
+        f.write(b''.join(table))
+        f.write(b'\0' * (-f.tell() % 8))
+        for fit in fits:
+            f.write(fit['coefficients'].astype('<f8').tobytes())
+    temp_path.replace(path)
+
+    reset_default_cache()
+    return EphemerisCache(path).info()
+
+
+class EphemerisCache:
+    """Read-only, memory-mapped Chebyshev ephemeris with live fallback."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            header = f.read(struct.calcsize(HEADER_FORMAT))
+            magic, version, n_bodies, self.jd_start, self.jd_end = struct.unpack(HEADER_FORMAT, header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Not an ephemeris cache file: {self.path}")
+            rows = [struct.unpack(BODY_FORMAT, f.read(struct.calcsize(BODY_FORMAT))) for _ in range(n_bodies)]
+
+        self.bodies = {}
+        for body_id, n_coefficients, segment_days, offset, max_error, max_speed_error in rows:
+            n_segments = int(np.ceil((self.jd_end - self.jd_start) / segment_days))
+            self.bodies[body_id] = {
+                'segment_days': segment_days,
+                'n_segments': n_segments,
+                'max_error': max_error,
+                'max_speed_error': max_speed_error,
+                # Plain ndarray view over the mapping (memmap slicing is slow per lookup)
+                'coefficients': np.asarray(np.memmap(
+                    self.path, dtype='<f8', mode='r', offset=offset,
+                    shape=(n_segments, 2, n_coefficients)
+                )),
+            }
+
+    def covers(self, body_id: int, jd: float) -> bool:
+        return body_id in self.bodies and self.jd_start <= jd < self.jd_end
+
+    def position(self, body_id: int, jd: float) -> Tuple[float, float, float]:
+        """
+        Longitude, latitude and longitude speed for one body at one moment.
+
+        Returns:
+            (longitude 0-360, latitude, speed in degrees/day)
+        """
+        if not self.covers(body_id, jd):
+            return _live_position(body_id, jd)
+
+        body = self.bodies[body_id]
+        segment_days = body['segment_days']
+        segment = int((jd - self.jd_start) / segment_days)
+        x = 2 * (jd - self.jd_start - segment * segment_days) / segment_days - 1
+        lon_coefficients, lat_coefficients = body['coefficients'][segment].tolist()
+
+        longitude, derivative = _clenshaw(lon_coefficients, x)
+        latitude, _ = _clenshaw(lat_coefficients, x)
+        return longitude % 360.0, latitude, derivative * 2 / segment_days
+
+    def sample(self, body_id: int, jds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized lookup for one body over many Julian Days.
+
+        Returns:
+            (longitude, latitude, speed) float64 arrays shaped like jds
+        """
+        jds = np.asarray(jds, dtype=np.float64)
+        longitude = np.empty_like(jds)
+        latitude = np.empty_like(jds)
+        speed = np.empty_like(jds)
+
+        inside = (jds >= self.jd_start) & (jds < self.jd_end) if body_id in self.bodies else np.zeros(jds.shape, bool)
+
+        if inside.any():
+            body = self.bodies[body_id]
+            segment_days = body['segment_days']
+            offsets = jds[inside] - self.jd_start
+            segments = (offsets // segment_days).astype(np.int64)
+            x = 2 * (offsets - segments * segment_days) / segment_days - 1
+            coefficients = body['coefficients'][segments]
+
+            # Clenshaw recurrence over all samples at once (value and derivative)
+            b1 = np.zeros((x.shape[0], 2))
+            b2 = np.zeros_like(b1)
+            d1 = np.zeros_like(b1)
+            d2 = np.zeros_like(b1)
+            xx = x[:, None]
+            for k in range(coefficients.shape[2] - 1, 0, -1):
+                d1, d2 = 2 * b1 + 2 * xx * d1 - d2, d1
+                b1, b2 = coefficients[:, :, k] + 2 * xx * b1 - b2, b1
+            values = coefficients[:, :, 0] + xx * b1 - b2
+
+            longitude[inside] = np.mod(values[:, 0], 360.0)
+            latitude[inside] = values[:, 1]
+            speed[inside] = (b1[:, 0] + x * d1[:, 0] - d2[:, 0]) * 2 / segment_days
+
+        for index in np.flatnonzero(~inside).tolist():
+            longitude[index], latitude[index], speed[index] = _live_position(body_id, float(jds[index]))
+
+        return longitude, latitude, speed
+
+    def info(self) -> Dict[str, Any]:
+        """Span, size and measured accuracy of the cache."""
+        start = swe.revjul(self.jd_start)
+        end = swe.revjul(self.jd_end)
+        return {
+            'path': str(self.path),
+            'start_date': f"{start[0]:04d}-{start[1]:02d}-{start[2]:02d}",
+            'end_date': f"{end[0]:04d}-{end[1]:02d}-{end[2]:02d}",
+            'size_bytes': self.path.stat().st_size,
+            'bodies': {
+                swe.get_planet_name(body_id): {
+                    'segment_days': body['segment_days'],
+                    'segments': body['n_segments'],
+                    'max_error': body['max_error'],
+                    'max_speed_error': body['max_speed_error'],
+                }
+                for body_id, body in self.bodies.items()
+            },
+        }
+
+
+def get_default_cache() -> Optional[EphemerisCache]:
+    """Open ephemeris/ephemeris_cache.bin once per process (None if not built)."""
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache_loaded = True
+        if DEFAULT_CACHE_PATH.exists():
+            _default_cache = EphemerisCache(DEFAULT_CACHE_PATH)
+    return _default_cache
+
+
+def reset_default_cache():
+    """Forget the process-wide cache so the next lookup reopens the file."""
+    global _default_cache, _default_cache_loaded
+    _default_cache = None
+    _default_cache_loaded = False
+
+
+def get_cached_span(
+    cls,
+    default_path: Path,
+    start_date: str,
+    end_date: str,
+    cache: Dict[str, Any],
+    path: Union[str, Path, None] = None
+):
+    """
+    Precomputed table (eclipse catalog, sky calendar) covering a date range.
+
+    Uses the table file at path when it exists and covers the range (files are
+    written by each module's --build). Otherwise computes, in memory, a table
+    of just the range's years plus SPAN_MARGIN_YEARS on each side - a few
+    seconds, where building the full default span would take minutes without
+    the Chebyshev cache. Tables are kept in cache for the life of the process.
+
+    Args:
+        cls: Table class with load(path), for_years(start, end) and covers(jd_start, jd_end)
+        default_path: The module's default table file
+        start_date: First date (YYYY-MM-DD)
+        end_date: Last date (YYYY-MM-DD)
+        cache: The calling module's process-level {key: table} dict
+        path: Table file to use (default: default_path)
+
+    Returns:
+        Table instance covering the whole range
+    """
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    jd_start = swe.julday(start.year, start.month, start.day, 0.0)
+    jd_end = swe.julday(end.year, end.month, end.day, 24.0)
+
+    for table in cache.values():
+        if table.covers(jd_start, jd_end):
+            return table
+
+    path = Path(path) if path is not None else default_path
+    table = cls.load(path) if path.exists() else None
+
+    if table is None or not table.covers(jd_start, jd_end):
+        first_year = start.year - SPAN_MARGIN_YEARS
+        last_year = end.year + SPAN_MARGIN_YEARS
+        key = f"{first_year}-{last_year}"
+        table = cls.for_years(first_year, last_year)
+    else:
+        key = str(path)
+
+    cache[key] = table
+    return table
+
+
+def format_info(info: Dict[str, Any]) -> str:
+    """Format cache info for display."""
+    output = []
+    output.append(f"\n{'='*80}")
+    output.append(f"EPHEMERIS CACHE - {info['start_date']} to {info['end_date']}")
+    output.append(f"{'='*80}")
+    output.append(f"File: {info['path']} ({info['size_bytes'] / 1e6:.1f} MB)\n")
+    output.append(f"{'Body':10} {'Segment':>8} {'Segments':>9} {'Max error (°)':>14} {'Max speed error':>16}")
+    for name, body in info['bodies'].items():
+        output.append(
+            f"{name:10} {body['segment_days']:7.0f}d {body['segments']:9} "
+            f"{body['max_error']:14.2e} {body['max_speed_error']:16.2e}"
+        )
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or inspect the Chebyshev ephemeris cache')
+    parser.add_argument('--build', action='store_true', help='Build the cache file')
+    parser.add_argument('--start-date', default='1900-01-01', help='Cache start (YYYY-MM-DD, default 1900-01-01)')
+    parser.add_argument('--end-date', default='2100-12-31', help='Cache end (YYYY-MM-DD, default 2100-12-31)')
+    parser.add_argument('--check', action='store_true', help='Compare cached and live positions for --date')
+    parser.add_argument('--date', help='Date for --check (YYYY-MM-DD)')
+    parser.add_argument('--path', default=str(DEFAULT_CACHE_PATH), help='Cache file path')
+
+    args = parser.parse_args()
+
+    try:
+        if args.build:
+            info = build_cache(args.start_date, args.end_date, args.path)
+            print(format_info(info))
+            return
+
+        cache = EphemerisCache(args.path)
+
+        if args.check:
+            if not args.date:
+                raise ValueError("--check requires --date")
+            dt = datetime.strptime(args.date, '%Y-%m-%d')
+            jd = swe.julday(dt.year, dt.month, dt.day, 12.0)
+            swe.set_ephe_path(str(EPHEMERIS_DIR))
+            print(f"\n{'Body':10} {'Cached':>14} {'Live':>14} {'Difference':>12}")
+            for body_id in cache.bodies:
+                cached = cache.position(body_id, jd)[0]
+                live = _live_position(body_id, jd)[0]
+                diff = (cached - live + 180.0) % 360.0 - 180.0
+                print(f"{swe.get_planet_name(body_id):10} {cached:14.6f} {live:14.6f} {diff:12.2e}")
+            return
+
+        print(format_info(cache.info()))
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
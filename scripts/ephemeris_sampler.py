@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Ephemeris Sampler
+Vectorized Swiss Ephemeris sampling for many bodies and many Julian days at once.
+
+Returns contiguous float64 NumPy arrays shaped (n_dates, n_bodies) for
+longitude, latitude and speed. No dicts or formatted strings are built per
+sample - sign/degree/DMS formatting belongs at the presentation boundary
+(see format_dms and the calculate_* functions in transits.py,
+secondary_progressions.py, solar_returns.py and seed_data_generator.py).
+
+When ephemeris/ephemeris_cache.bin has been built (see ephemeris_cache.py),
+the ten planets are served from the Chebyshev cache inside its span.
+
+Usage:
+    python ephemeris_sampler.py --start-date 2025-01-01 --end-date 2025-12-31
+    python ephemeris_sampler.py --start-date 2025-01-01 --end-date 2025-01-31 --step 0.25 --bodies Moon Sun
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Sequence, Union
+import numpy as np
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from ephemeris_cache import DEFAULT_FLAGS, get_default_cache
+
+# Constants
+SIGNS = [
+    'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+    'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
+]
+
+BODY_IDS = {
+    'Sun': swe.SUN,
+    'Moon': swe.MOON,
+    'Mercury': swe.MERCURY,
+    'Venus': swe.VENUS,
+    'Mars': swe.MARS,
+    'Jupiter': swe.JUPITER,
+    'Saturn': swe.SATURN,
+    'Uranus': swe.URANUS,
+    'Neptune': swe.NEPTUNE,
+    'Pluto': swe.PLUTO,
+}
+
+
+def julian_day_range(start_date: str, end_date: str, step: float = 1.0, hour: float = 12.0) -> np.ndarray:
+    """
+    Build an evenly spaced array of Julian Days (UT) covering a date range.
+
+    Args:
+        start_date: First date (YYYY-MM-DD)
+        end_date: Last date (YYYY-MM-DD), included
+        step: Spacing in days (default 1.0)
+        hour: UT hour of the first sample (default noon, as in transits.py)
+
+    Returns:
+        1-D float64 array of Julian Days
+    """
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    jd_start = swe.julday(start.year, start.month, start.day, hour)
+    jd_end = swe.julday(end.year, end.month, end.day, hour)
+    count = int(np.floor((jd_end - jd_start) / step + 1e-9)) + 1
+    return jd_start + step * np.arange(count, dtype=np.float64)
+
+
+def sample_positions(
+    bodies: Sequence[Union[int, str]],
+    jd_array: Union[Sequence[float], np.ndarray],
+    flags: int = DEFAULT_FLAGS,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Sample ecliptic positions for several bodies over many Julian Days.
+
+    Args:
+        bodies: Swiss Ephemeris body ids (swe.SUN, ...) or names ('Sun', ...)
+        jd_array: Julian Days (UT) to sample
+        flags: Swiss Ephemeris calculation flags (speed is always requested)
+        use_cache: Serve from the Chebyshev ephemeris cache when it is built
+                   (only with default flags; live swe.calc_ut otherwise)
+
+    Returns:
+        {
+            'jd': ndarray (n_dates,),
+            'bodies': [int, ...],                # Body ids, column order
+            'longitude': ndarray (n_dates, n_bodies),
+            'latitude': ndarray (n_dates, n_bodies),
+            'speed': ndarray (n_dates, n_bodies)  # Longitude speed, deg/day
+        }
+    """
+    body_ids = [BODY_IDS[b] if isinstance(b, str) else b for b in bodies]
+    jds = np.ascontiguousarray(np.atleast_1d(np.asarray(jd_array, dtype=np.float64)))
+    flags |= swe.FLG_SPEED
+
+    shape = (jds.shape[0], len(body_ids))
+    longitude = np.empty(shape, dtype=np.float64)
+    latitude = np.empty(shape, dtype=np.float64)
+    speed = np.empty(shape, dtype=np.float64)
+
+    cache = get_default_cache() if use_cache and flags == DEFAULT_FLAGS else None
+    if cache is not None:
+        for col, body_id in enumerate(body_ids):
+            longitude[:, col], latitude[:, col], speed[:, col] = cache.sample(body_id, jds)
+    else:
+        calc_ut = swe.calc_ut
+        for row, jd in enumerate(jds.tolist()):
+            for col, body_id in enumerate(body_ids):
+                position, _ = calc_ut(jd, body_id, flags)
+                longitude[row, col] = position[0]
+                latitude[row, col] = position[1]
+                speed[row, col] = position[3]
+
+    return {
+        'jd': jds,
+        'bodies': body_ids,
+        'longitude': longitude,
+        'latitude': latitude,
+        'speed': speed,
+    }
+
+
+def sign_indices(longitudes: np.ndarray) -> np.ndarray:
+    """Vectorized sign index (0 = Aries ... 11 = Pisces) for longitudes."""
+    return (np.floor(np.mod(longitudes, 360.0) / 30.0).astype(np.int64)) % 12
+
+
+def format_dms(degree: float) -> str:
+    """Format a degree within sign as D°M'S" (presentation only)."""
+    return f"{int(degree)}°{int((degree % 1) * 60)}'{int(((degree * 60) % 1) * 60)}\""
+
+
+def format_samples(samples: Dict[str, Any], names: List[str], row: int = 0) -> List[Dict[str, Any]]:
+    """
+    Format one sampled row into the planet dicts used by report scripts.
+
+    Args:
+        samples: Result of sample_positions
+        names: Display names in the same order as samples['bodies']
+        row: Date row to format
+
+    Returns:
+        List of {'name', 'longitude', 'sign', 'degree', 'dms', 'speed', 'retrograde'}
+    """
+    planets = []
+    for col, name in enumerate(names):
+        longitude = float(samples['longitude'][row, col])
+        speed = float(samples['speed'][row, col])
+        degree = longitude % 30
+        planets.append({
+            'name': name,
+            'longitude': longitude,
+            'sign': SIGNS[int(longitude / 30) % 12],
+            'degree': degree,
+            'dms': format_dms(degree),
+            'speed': speed,
+            'retrograde': speed < 0,
+        })
+    return planets
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sample planetary positions over a date range')
+    parser.add_argument('--start-date', required=True, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end-date', required=True, help='End date (YYYY-MM-DD)')
+    parser.add_argument('--step', type=float, default=1.0, help='Step in days (default 1)')
+    parser.add_argument('--bodies', nargs='+', default=list(BODY_IDS), choices=list(BODY_IDS),
+                        help='Bodies to sample (default all ten)')
+
+    args = parser.parse_args()
+
+    try:
+        jds = julian_day_range(args.start_date, args.end_date, args.step)
+        samples = sample_positions(args.bodies, jds)
+
+        print(f"\n{'='*80}")
+        print(f"EPHEMERIS SAMPLES - {args.start_date} to {args.end_date} (step {args.step} days)")
+        print(f"{'='*80}")
+        print(f"Samples: {len(jds)} dates x {len(args.bodies)} bodies\n")
+
+        signs = sign_indices(samples['longitude'])
+        for col, name in enumerate(args.bodies):
+            changes = int(np.count_nonzero(np.diff(signs[:, col])))
+            retro_days = int(np.count_nonzero(samples['speed'][:, col] < 0))
+            print(f"{name:10} sign changes: {changes:4}   retrograde samples: {retro_days:5}")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,7 @@ Usage:
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -29,6 +30,7 @@ from datetime import datetime
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 from profile_loader import load_profile, list_profiles
+from time_lord_index import PeriodIndex
 
 # Planet period lengths (years)
 PLANET_YEARS = {
@@ -126,6 +128,16 @@ def calculate_sub_periods(major_period: Dict[str, Any], sect: str) -> List[Dict[
     return sub_periods
 
 
+@lru_cache(maxsize=2)
+def _firdaria_index(sect: str) -> tuple:
+    """Major and sub-period indexes for a sect (the sequence is fixed, so built once)."""
+    major_periods = calculate_major_periods(sect)
+    sub_periods = []
+    for major in major_periods:
+        sub_periods.extend(calculate_sub_periods(major, sect))
+    return PeriodIndex(major_periods), PeriodIndex(sub_periods)
+
+
 def find_active_periods(age: float, sect: str) -> Dict[str, Any]:
     """
     Find active major and sub-period for a given age.
@@ -144,26 +156,19 @@ def find_active_periods(age: float, sect: str) -> Dict[str, Any]:
             'message': 'Age beyond Firdaria coverage (75 years)'
         }
 
-    # Find active major period
-    major_periods = calculate_major_periods(sect)
-    active_major = None
-
-    for period in major_periods:
-        if period['start_age'] <= age < period['end_age']:
-            active_major = period
-            break
+    major_index, sub_index = _firdaria_index('day' if sect == 'day' else 'night')
 
+    # Find active major period
+    active_major = major_index.at(age)
     if not active_major:
         return None
 
     # Find active sub-period within the major period
-    sub_periods = calculate_sub_periods(active_major, sect)
-    active_sub = None
+    active_sub = sub_index.at(age)
 
-    for sub_period in sub_periods:
-        if sub_period['start_age'] <= age < sub_period['end_age']:
-            active_sub = sub_period
-            break
+    # Copies, so callers never alter the cached periods
+    active_major = dict(active_major)
+    active_sub = dict(active_sub) if active_sub else None
 
     return {
         'age': age,
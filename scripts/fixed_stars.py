@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Fixed Stars
+Traditional fixed-star catalog, precessed to any epoch and indexed by ecliptic longitude.
+
+The catalog (J2000 right ascension/declination and visual magnitude of the
+traditional stars) is embedded below and converted to J2000 ecliptic
+coordinates once per process. FixedStarIndex precesses every star to an
+epoch in one vectorized step (Meeus' rigorous ecliptic precession plus
+nutation in longitude, i.e. tropical positions of date) and keeps them in a
+sorted longitude array, so "which stars are within orb of this point" is a
+bisect instead of a catalog scan per star.
+
+Positions agree with Swiss Ephemeris fixstar_ut to well under an arcminute
+for most stars. Proper motion is not applied; over a century it moves even
+the fastest catalog star (Arcturus) by only a few arcminutes, far inside
+the 1° fixed-star orb.
+
+Natal star contacts use the index for the birth moment. Transits and
+progressions to natal stars query the same natal index with the moving
+body's longitudes (query_many).
+
+Usage:
+    python fixed_stars.py --date 2025-10-01
+    python fixed_stars.py --profile darren
+    python fixed_stars.py --profile darren --age 40        # Progressed planets on natal stars
+    python fixed_stars.py --profile darren --date 2025-10-01   # Transiting planets on natal stars
+"""
+
+import argparse
+import math
+import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+import numpy as np
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from ephemeris_sampler import SIGNS, format_dms
+
+# Constants
+J2000 = 2451545.0
+OBLIQUITY_J2000 = 23.4392911    # Mean obliquity of the ecliptic at J2000 (degrees)
+DEFAULT_ORB = 1.0               # Traditional 1° orb for fixed stars
+
+# The five stars always listed in natal seed data, with or without contacts
+MAJOR_STARS = ['Regulus', 'Spica', 'Algol', 'Antares', 'Aldebaran']
+
+# name, RA (J2000, h m s), Dec (J2000, ° ' "), magnitude, traditional name, nature
+FIXED_STAR_CATALOG = [
+    ('Alpheratz', '00 08 23.3', '+29 05 26', 2.1, 'Caput Andromedae (Head of Andromeda)', 'Independence, freedom, honor'),
+    ('Algenib', '00 13 14.2', '+15 11 01', 2.8, 'Wing of Pegasus', 'Ambition, notoriety, forceful will'),
+    ('Deneb Kaitos', '00 43 35.4', '-17 59 12', 2.0, 'Cauda Ceti (Tail of the Whale)', 'Restraint, enforced inactivity'),
+    ('Schedar', '00 40 30.4', '+56 32 14', 2.2, "Breast of Cassiopeia", 'Authority, dignity, command'),
+    ('Mirach', '01 09 43.9', '+35 37 14', 2.1, 'Cingulum Andromedae (Girdle of Andromeda)', 'Beauty, devotion, receptivity'),
+    ('Sheratan', '01 54 38.4', '+20 48 29', 2.6, 'Horn of the Ram', 'Boldness, conflict, injury'),
+    ('Hamal', '02 07 10.4', '+23 27 45', 2.0, 'Head of the Ram', 'Independence, headstrong drive'),
+    ('Almach', '02 03 54.0', '+42 19 47', 2.1, 'Pes Andromedae (Foot of Andromeda)', 'Honor, artistic ability, popularity'),
+    ('Menkar', '03 02 16.8', '+04 05 23', 2.5, "Jaw of the Whale", 'Collective forces, illness, loss'),
+    ('Algol', '03 08 10.1', '+40 57 20', 2.1, "Caput Medusae (Medusa's Head)", 'Violence, danger, challenges (use with caution)'),
+    ('Mirfak', '03 24 19.4', '+49 51 40', 1.8, 'Side of Perseus', 'Courage, martial action'),
+    ('Alcyone', '03 47 29.1', '+24 06 18', 2.9, 'The Pleiades', 'Ambition, sorrow, eyesight'),
+    ('Prima Hyadum', '04 19 47.6', '+15 37 39', 3.7, 'The Hyades', 'Upheaval, turbulence, vision'),
+    ('Aldebaran', '04 35 55.2', '+16 30 33', 0.9, 'Oculus Tauri (Eye of the Bull)', 'Honor, integrity, achievement'),
+    ('Rigel', '05 14 32.3', '-08 12 06', 0.1, 'Left Foot of Orion', 'Education, skill, lasting fame'),
+    ('Capella', '05 16 41.4', '+45 59 53', 0.1, 'The Goat', 'Curiosity, learning, civic honor'),
+    ('Bellatrix', '05 25 07.9', '+06 20 59', 1.6, 'The Female Warrior', 'Quick success, sudden reversal'),
+    ('Elnath', '05 26 17.5', '+28 36 27', 1.7, 'Horn of the Bull', 'Fortune, eminence, decisiveness'),
+    ('Mintaka', '05 32 00.4', '-00 17 57', 2.2, "Belt of Orion", 'Good fortune, leadership'),
+    ('Alnilam', '05 36 12.8', '-01 12 07', 1.7, "Belt of Orion", 'Public honor, brief fame'),
+    ('Alnitak', '05 40 45.5', '-01 56 34', 1.8, "Belt of Orion", 'Strength, distinction'),
+    ('Betelgeuse', '05 55 10.3', '+07 24 25', 0.5, 'Shoulder of Orion', 'Martial honor, success, wealth'),
+    ('Menkalinan', '05 59 31.7', '+44 56 51', 1.9, 'Shoulder of the Charioteer', 'Ruin, disgrace, violence'),
+    ('Polaris', '02 31 49.1', '+89 15 51', 2.0, 'The Pole Star', 'Direction, steadfastness'),
+    ('Alhena', '06 37 42.7', '+16 23 57', 1.9, 'Foot of the Twins', 'Artistic gifts, spiritual drive'),
+    ('Sirius', '06 45 08.9', '-16 42 58', -1.5, 'The Dog Star', 'Ambition, fame, guardianship'),
+    ('Canopus', '06 23 57.1', '-52 41 45', -0.7, 'Rudder of the Ship', 'Voyages, piety, transformation'),
+    ('Castor', '07 34 35.9', '+31 53 18', 1.6, 'Head of the Northern Twin', 'Intellect, distinction, sudden loss'),
+    ('Pollux', '07 45 18.9', '+28 01 34', 1.1, 'Head of the Southern Twin', 'Courage, cunning, cruelty'),
+    ('Procyon', '07 39 18.1', '+05 13 30', 0.3, 'The Little Dog', 'Sudden rise and fall, activity'),
+    ('Praesepe', '08 40 24.0', '+19 40 00', 3.7, 'The Beehive', 'Industry, blindness, disgrace'),
+    ('Acubens', '08 58 29.2', '+11 51 28', 4.3, 'Claw of the Crab', 'Shelter, malevolence'),
+    ('Dubhe', '11 03 43.7', '+61 45 03', 1.8, 'Back of the Great Bear', 'Protection, harshness'),
+    ('Alphard', '09 27 35.2', '-08 39 31', 2.0, 'Cor Hydrae (Heart of the Hydra)', 'Wisdom, passion, poison'),
+    ('Algieba', '10 19 58.4', '+19 50 29', 2.0, 'Mane of the Lion', 'Pride, ambition, display'),
+    ('Regulus', '10 08 22.3', '+11 58 02', 1.4, 'Cor Leonis (Heart of the Lion)', 'Success, royalty, honor, leadership'),
+    ('Zosma', '11 14 06.5', '+20 31 25', 2.6, 'Back of the Lion', 'Victimhood, burden, benefit through others'),
+    ('Denebola', '11 49 03.6', '+14 34 19', 2.1, 'Tail of the Lion', 'Rash judgment, social exclusion'),
+    ('Alkaid', '13 47 32.4', '+49 18 48', 1.9, 'Tail of the Great Bear', 'Mourning, leadership of the bereaved'),
+    ('Thuban', '14 04 23.3', '+64 22 33', 3.7, 'Tail of the Dragon', 'Guarding treasure, wealth'),
+    ('Vindemiatrix', '13 02 10.6', '+10 57 33', 2.8, 'The Grape Gatherer', 'Widowhood, loss, sobriety'),
+    ('Algorab', '12 29 51.9', '-16 30 56', 3.0, 'Wing of the Crow', 'Scavenging, destructiveness'),
+    ('Spica', '13 25 11.6', '-11 09 41', 1.0, 'Spica Virginis (Ear of Wheat)', 'Gifts, protection, success through skill'),
+    ('Arcturus', '14 15 39.7', '+19 10 57', -0.1, 'Guardian of the Bear', 'Prosperity, pathfinding, honor'),
+    ('Acrux', '12 26 35.9', '-63 05 57', 0.8, 'Southern Cross', 'Ceremony, mysticism'),
+    ('Alphecca', '15 34 41.3', '+26 42 53', 2.2, 'Northern Crown', 'Dignity, artistic gifts'),
+    ('Zuben Elgenubi', '14 50 52.7', '-16 02 30', 2.8, 'Southern Scale', 'Social reform, unforgiveness'),
+    ('Zuben Eschamali', '15 17 00.4', '-09 22 59', 2.6, 'Northern Scale', 'Honor, ambition, social reform'),
+    ('Unukalhai', '15 44 16.1', '+06 25 32', 2.6, 'Neck of the Serpent', 'Immorality, danger of poison'),
+    ('Agena', '14 03 49.4', '-60 22 23', 0.6, 'Knee of the Centaur', 'Position, friendship, health'),
+    ('Toliman', '14 39 36.5', '-60 50 02', -0.3, 'Foot of the Centaur', 'Refinement, friendship, honor'),
+    ('Acrab', '16 05 26.2', '-19 48 19', 2.6, 'Forehead of the Scorpion', 'Malevolence, contagion'),
+    ('Antares', '16 29 24.5', '-26 25 55', 1.0, 'Cor Scorpii (Heart of Scorpion)', 'Conflict, courage, obsession'),
+    ('Ras Algethi', '17 14 38.9', '+14 23 25', 3.1, 'Head of the Kneeler', 'Boldness, self-reliance'),
+    ('Rasalhague', '17 34 56.1', '+12 33 36', 2.1, 'Head of the Serpent Bearer', 'Healing, perversity'),
+    ('Lesath', '17 30 45.8', '-37 17 45', 2.7, "Sting of the Scorpion", 'Danger, desperation'),
+    ('Shaula', '17 33 36.5', '-37 06 14', 1.6, 'Sting of the Scorpion', 'Danger, desperation, accidents'),
+    ('Kaus Australis', '18 24 10.3', '-34 23 05', 1.9, 'Bow of the Archer', 'Honor, focus'),
+    ('Nunki', '18 55 15.9', '-26 17 48', 2.1, 'Vane of the Arrow', 'Truthfulness, optimism'),
+    ('Ascella', '19 02 36.7', '-29 52 49', 2.6, 'Armpit of the Archer', 'Good fortune, happiness'),
+    ('Vega', '18 36 56.3', '+38 47 01', 0.0, 'The Lyre', 'Charisma, artistry, idealism'),
+    ('Altair', '19 50 47.0', '+08 52 06', 0.8, 'The Eagle', 'Boldness, ambition, sudden wealth'),
+    ('Algedi', '20 18 03.3', '-12 32 41', 3.6, 'Horn of the Goat', 'Sacrifice, offering'),
+    ('Dabih', '20 21 00.7', '-14 46 53', 3.1, 'Eye of the Goat', 'Reserve, retirement'),
+    ('Sadalsuud', '21 31 33.5', '-05 34 16', 2.9, 'Luck of Lucks', 'Good fortune, public service'),
+    ('Deneb Algedi', '21 47 02.4', '-16 07 38', 2.9, 'Tail of the Goat', 'Justice, sorrow and happiness'),
+    ('Sadalmelik', '22 05 47.0', '-00 19 11', 3.0, 'Luck of the King', 'Persecution, sudden destruction'),
+    ('Fomalhaut', '22 57 39.0', '-29 37 20', 1.2, 'Mouth of the Southern Fish', 'Idealism, fame, magic'),
+    ('Deneb Adige', '20 41 25.9', '+45 16 49', 1.3, 'Tail of the Swan', 'Learning, intelligence'),
+    ('Achernar', '01 37 42.8', '-57 14 12', 0.5, 'End of the River', 'Success in public office'),
+    ('Markab', '23 04 45.7', '+15 12 19', 2.5, 'Saddle of Pegasus', 'Honor, wealth, danger of cuts and fire'),
+    ('Scheat', '23 03 46.5', '+28 04 58', 2.4, 'Leg of Pegasus', 'Intellect, misfortune, drowning'),
+]
+
+
+def _sexagesimal(value: str) -> float:
+    """'hh mm ss.s' or '±dd mm ss' to a decimal number."""
+    sign = -1.0 if value.strip().startswith('-') else 1.0
+    whole, minutes, seconds = (abs(float(part)) for part in value.split())
+    return sign * (whole + minutes / 60.0 + seconds / 3600.0)
+
+
+@lru_cache(maxsize=1)
+def load_catalog() -> Dict[str, Any]:
+    """
+    The embedded catalog with J2000 ecliptic coordinates (parsed once per process).
+
+    Returns:
+        {
+            'names': [str, ...],
+            'longitude': np.ndarray,   # J2000 ecliptic longitude (degrees)
+            'latitude': np.ndarray,    # J2000 ecliptic latitude (degrees)
+            'magnitude': np.ndarray,
+            'info': {name: {'traditional_name', 'nature', 'magnitude'}}
+        }
+    """
+    ra = np.radians([_sexagesimal(star[1]) * 15.0 for star in FIXED_STAR_CATALOG])
+    dec = np.radians([_sexagesimal(star[2]) for star in FIXED_STAR_CATALOG])
+    eps = math.radians(OBLIQUITY_J2000)
+
+    longitude = np.degrees(np.arctan2(
+        np.sin(ra) * math.cos(eps) + np.tan(dec) * math.sin(eps),
+        np.cos(ra)
+    )) % 360.0
+    latitude = np.degrees(np.arcsin(
+        np.sin(dec) * math.cos(eps) - np.cos(dec) * math.sin(eps) * np.sin(ra)
+    ))
+
+    return {
+        'names': [star[0] for star in FIXED_STAR_CATALOG],
+        'longitude': longitude,
+        'latitude': latitude,
+        'magnitude': np.array([star[3] for star in FIXED_STAR_CATALOG]),
+        'info': {
+            star[0]: {'traditional_name': star[4], 'nature': star[5], 'magnitude': star[3]}
+            for star in FIXED_STAR_CATALOG
+        },
+    }
+
+
+def precess_ecliptic(longitude: np.ndarray, latitude: np.ndarray, jd: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precess J2000 ecliptic coordinates to the true ecliptic and equinox of date.
+
+    Meeus, Astronomical Algorithms (21.5) with the J2000 angles, plus
+    nutation in longitude from Swiss Ephemeris.
+
+    Args:
+        longitude: J2000 ecliptic longitudes (degrees)
+        latitude: J2000 ecliptic latitudes (degrees)
+        jd: Julian Day of the epoch
+
+    Returns:
+        (longitude, latitude) of date in degrees
+    """
+    t = (jd - J2000) / 36525.0
+    eta = math.radians((47.0029 * t - 0.03302 * t ** 2 + 0.000060 * t ** 3) / 3600.0)
+    pi_node = math.radians(174.876384 + (-869.8089 * t + 0.03536 * t ** 2) / 3600.0)
+    p = math.radians((5029.0966 * t + 1.11113 * t ** 2 - 0.000006 * t ** 3) / 3600.0)
+
+    lon = np.radians(longitude)
+    lat = np.radians(latitude)
+    a = math.cos(eta) * np.cos(lat) * np.sin(pi_node - lon) - math.sin(eta) * np.sin(lat)
+    b = np.cos(lat) * np.cos(pi_node - lon)
+    c = math.cos(eta) * np.sin(lat) + math.sin(eta) * np.cos(lat) * np.sin(pi_node - lon)
+
+    nutation = swe.calc_ut(jd, swe.ECL_NUT)[0][2]
+    longitude_of_date = (np.degrees(p + pi_node - np.arctan2(a, b)) + nutation) % 360.0
+    latitude_of_date = np.degrees(np.arcsin(np.clip(c, -1.0, 1.0)))
+    return longitude_of_date, latitude_of_date
+
+
+class FixedStarIndex:
+    """Catalog stars precessed to one epoch, sorted by ecliptic longitude."""
+
+    def __init__(self, jd: float, max_magnitude: Optional[float] = None):
+        """
+        Args:
+            jd: Julian Day of the epoch (e.g. the birth moment)
+            max_magnitude: Only index stars at least this bright (default: all)
+        """
+        catalog = load_catalog()
+        keep = np.ones(len(catalog['names']), dtype=bool)
+        if max_magnitude is not None:
+            keep = catalog['magnitude'] <= max_magnitude
+
+        longitude, latitude = precess_ecliptic(catalog['longitude'][keep], catalog['latitude'][keep], jd)
+        order = np.argsort(longitude, kind='stable')
+        names = [name for name, k in zip(catalog['names'], keep) if k]
+
+        self.jd = jd
+        self.names = [names[i] for i in order]
+        self.longitudes = longitude[order]
+        self.latitudes = latitude[order]
+        self._info = catalog['info']
+        # Each star at -360, 0 and +360 so every orb window is one contiguous slice
+        self._ring = np.concatenate([self.longitudes - 360.0, self.longitudes, self.longitudes + 360.0])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def star(self, i: int) -> Dict[str, Any]:
+        """Star i (in longitude order) with its catalog details and position of date."""
+        name = self.names[i]
+        return dict(
+            self._info[name],
+            name=name,
+            longitude=float(self.longitudes[i]),
+            latitude=float(self.latitudes[i]),
+        )
+
+    def position(self, name: str) -> Dict[str, Any]:
+        """A star by name."""
+        try:
+            return self.star(self.names.index(name))
+        except ValueError:
+            raise ValueError(f"Star not in index: {name}")
+
+    def stars(self) -> List[Dict[str, Any]]:
+        """Every indexed star, in longitude order."""
+        return [self.star(i) for i in range(len(self))]
+
+    def query(self, longitude: float, orb: float = DEFAULT_ORB) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Stars within orb of an ecliptic longitude.
+
+        Args:
+            longitude: Point longitude, degrees
+            orb: Maximum distance in longitude, degrees (below 180)
+
+        Returns:
+            List of (star, orb) in longitude order
+        """
+        return self.query_many([longitude], orb)[0]
+
+    def query_many(self, longitudes: Sequence[float], orb: float = DEFAULT_ORB) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Batched query: stars within orb of each of many longitudes.
+
+        Args:
+            longitudes: Point longitudes (any array-like, degrees), e.g. one
+                transiting or progressed body over many dates
+            orb: Maximum distance in longitude, degrees (below 180)
+
+        Returns:
+            One list of (star, orb) per longitude, as query() returns
+        """
+        longitudes = np.mod(np.atleast_1d(np.asarray(longitudes, dtype=np.float64)), 360.0)
+        lows = np.searchsorted(self._ring, longitudes - orb, side='left')
+        highs = np.searchsorted(self._ring, longitudes + orb, side='right')
+
+        n = len(self.names)
+        results = []
+        for longitude, low, high in zip(longitudes.tolist(), lows.tolist(), highs.tolist()):
+            results.append([
+                (self.star(j % n), abs(longitude - float(self._ring[j])))
+                for j in range(low, high)
+            ])
+        return results
+
+    def contacts(self, points: Dict[str, float], orb: float = DEFAULT_ORB) -> List[Dict[str, Any]]:
+        """
+        Star conjunctions to named points.
+
+        Args:
+            points: {point name: longitude} (planets, angles, lots...)
+            orb: Maximum distance in longitude, degrees
+
+        Returns:
+            [{'star', 'point', 'orb', 'star_longitude', 'point_longitude'}, ...]
+            in the order of points, then star longitude
+        """
+        names = list(points)
+        hits = self.query_many([points[name] for name in names], orb)
+        return [
+            {
+                'star': star['name'],
+                'point': name,
+                'orb': distance,
+                'star_longitude': star['longitude'],
+                'point_longitude': points[name],
+            }
+            for name, point_hits in zip(names, hits)
+            for star, distance in point_hits
+        ]
+
+
+_indexes = {}
+
+
+def star_index(jd: float, max_magnitude: Optional[float] = None) -> FixedStarIndex:
+    """
+    Fixed-star index for an epoch, built once per (epoch, magnitude limit) per process.
+
+    Args:
+        jd: Julian Day of the epoch
+        max_magnitude: Only index stars at least this bright (default: all)
+    """
+    key = (jd, max_magnitude)
+    index = _indexes.get(key)
+    if index is None:
+        index = FixedStarIndex(jd, max_magnitude)
+        _indexes[key] = index
+    return index
+
+
+def natal_star_index(profile, max_magnitude: Optional[float] = None) -> FixedStarIndex:
+    """Fixed stars at a profile's birth moment (for natal, transit and progressed contacts)."""
+    from secondary_progressions import birth_julian_day
+    return star_index(birth_julian_day(profile), max_magnitude)
+
+
+def format_longitude(longitude: float) -> str:
+    """'29°50'0" Leo' style position."""
+    return f"{format_dms(longitude % 30)} {SIGNS[int(longitude // 30) % 12]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fixed-star positions and contacts')
+    parser.add_argument('--date', help='Epoch date YYYY-MM-DD (with --profile: transiting planets on natal stars)')
+    parser.add_argument('--profile', help='Profile name (natal star contacts)')
+    parser.add_argument('--age', type=float, help='With --profile: progressed planets on natal stars at this age')
+    parser.add_argument('--orb', type=float, default=DEFAULT_ORB, help=f'Orb in degrees (default {DEFAULT_ORB})')
+    parser.add_argument('--max-magnitude', type=float, help='Only stars at least this bright')
+
+    args = parser.parse_args()
+
+    try:
+        if args.profile is None:
+            if not args.date:
+                raise ValueError("Give --date and/or --profile")
+            date = datetime.strptime(args.date, '%Y-%m-%d')
+            index = star_index(swe.julday(date.year, date.month, date.day, 12.0), args.max_magnitude)
+            for star in index.stars():
+                print(f"{star['name']:16} {format_longitude(star['longitude']):>18}  mag {star['magnitude']:4.1f}")
+            return
+
+        from profile_loader import load_profile
+        profile = load_profile(args.profile)
+        index = natal_star_index(profile, args.max_magnitude)
+
+        if args.age is None and not args.date:
+            points = {p['name']: p['longitude'] for p in profile.get_planets()}
+            label = 'Natal'
+        elif args.age is not None:
+            from secondary_progressions import progressed_ephemeris
+            from progressed_ephemeris import PLANET_NAMES
+            samples = progressed_ephemeris(profile).sample([args.age])
+            points = dict(zip(PLANET_NAMES, samples['longitude'][0].tolist()))
+            label = f'Progressed (age {args.age})'
+        else:
+            from ephemeris_sampler import sample_positions
+            from progressed_ephemeris import PLANET_NAMES, TRADITIONAL_PLANETS
+            date = datetime.strptime(args.date, '%Y-%m-%d')
+            samples = sample_positions(TRADITIONAL_PLANETS, [swe.julday(date.year, date.month, date.day, 12.0)])
+            points = dict(zip(PLANET_NAMES, samples['longitude'][0].tolist()))
+            label = f'Transiting ({args.date})'
+
+        contacts = index.contacts(points, args.orb)
+        print(f"{label} contacts to {args.profile}'s natal fixed stars (orb {args.orb}°):")
+        for contact in contacts:
+            print(f"  {contact['point']:10} conjunct {contact['star']:16} orb {contact['orb']:.2f}°")
+        if not contacts:
+            print("  None")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,14 @@
 """
 Generate Short-Range Transit Report
 Implements transit-analyzer-short agent logic
+
+Stations and retrograde shadows (the 'stations' section and each transit's
+'retrograde_phase', from station_calendar.py) are shown as timing context:
+each movement lists the stations inside it, key transits are marked when the
+transiting planet is retrograde or in shadow, and the retrograde periods
+touching the window are listed at the end. They do not affect tiering - a
+transit's tier comes from which natal point it touches (see tier_transit),
+and the repeated passes of a retrograde are already separate transits.
 """
 
 import json
@@ -15,10 +23,15 @@ def load_transit_data(filepath):
     with open(filepath) as f:
         return json.load(f)
 
-def analyze_movements(transits, start_date, end_date):
+def analyze_movements(transits, start_date, end_date, sky_events=None):
     """
     Analyze transits to identify 2-4 thematic movements
     Returns list of movements with their transit clusters
+
+    sky_events: optional {'ingresses': [...], 'lunations': [...], 'stations': [...]}
+    from the transit data (exact times from sky_calendar.py and station_calendar.py);
+    each movement then lists the sign ingresses, lunations and stations from its
+    start until the next movement begins
     """
     # Group transits by week
     weekly_groups = defaultdict(list)
@@ -71,6 +84,17 @@ def analyze_movements(transits, start_date, end_date):
             'end': movement_transits[-1]['date']
         })
 
+    if sky_events:
+        # A movement lasts until the next one begins (the last one to the end date)
+        for i, movement in enumerate(movements):
+            until = movements[i + 1]['start'] if i + 1 < len(movements) else end_date
+            for key in ('ingresses', 'lunations', 'stations'):
+                movement[key] = [
+                    event for event in sky_events.get(key, [])
+                    if movement['start'] <= event['date'] < until
+                    or (i + 1 == len(movements) and event['date'] == until)
+                ]
+
     return movements
 
 def analyze_themes(transits):
@@ -184,6 +208,12 @@ def generate_movement_title(theme, transits):
     else:
         return "Transition Period"
 
+RETROGRADE_PHASE_LABELS = {
+    'pre_shadow': 'pre-shadow',
+    'retrograde': 'retrograde',
+    'post_shadow': 'post-shadow'
+}
+
 def format_transit_description(transit):
     """Format single transit for technical appendix"""
     planet = transit['transiting_planet']
@@ -192,8 +222,30 @@ def format_transit_description(transit):
     orb = abs(transit['orb'])
     exact = "exact" if transit['exact'] else f"orb {orb:.1f}°"
     applying = "applying" if transit['applying'] else "separating"
+    details = [exact, applying]
+
+    phase = transit.get('retrograde_phase')
+    if phase in RETROGRADE_PHASE_LABELS:
+        details.append(f"{planet} {RETROGRADE_PHASE_LABELS[phase]}")
+
+    return f"{planet} {aspect} natal {natal} ({', '.join(details)})"
+
+def format_station(station):
+    """Format one station (from the transit data's stations section)"""
+    motion = "stations retrograde" if station['motion'] == 'retrograde' else "stations direct"
+    return f"{station['planet']} {motion} at {int(station['degree'])}° {station['sign']}"
+
+def format_retrograde_period(period):
+    """Format one retrograde period with its shadow dates"""
+    def when(moment):
+        return moment['date'] if moment else '?'
 
-    return f"{planet} {aspect} natal {natal} ({exact}, {applying})"
+    retro = period['station_retrograde']
+    direct = period['station_direct']
+    return (f"{period['planet']}: pre-shadow {when(period['pre_shadow_start'])}, "
+            f"Rx {retro['date']} ({int(retro['degree'])}° {retro['sign']}), "
+            f"direct {direct['date']} ({int(direct['degree'])}° {direct['sign']}), "
+            f"post-shadow ends {when(period['post_shadow_end'])}")
 
 def main():
     # Load data
@@ -212,7 +264,11 @@ def main():
 
     # Analyze movements
     print("\nAnalyzing thematic movements...")
-    movements = analyze_movements(all_transits, data['date_range']['start'], data['date_range']['end'])
+    sky_events = {key: data[key] for key in ('ingresses', 'lunations') if key in data}
+    station_data = data.get('stations', {})
+    if station_data:
+        sky_events['stations'] = station_data.get('stations', [])
+    movements = analyze_movements(all_transits, data['date_range']['start'], data['date_range']['end'], sky_events)
 
     print(f"\nDetected {len(movements)} movements:")
     for i, m in enumerate(movements, 1):
@@ -223,6 +279,19 @@ def main():
         print(f"    Key transits:")
         for t in m['transits'][:5]:  # Show first 5
             print(f"      - {t['date']}: {format_transit_description(t)}")
+        for ingress in m.get('ingresses', []):
+            print(f"      * {ingress['date']}: {ingress['planet']} enters {ingress['sign']}")
+        for lunation in m.get('lunations', []):
+            if lunation['phase'] in ('new_moon', 'full_moon'):
+                print(f"      * {lunation['date']}: {lunation['phase'].replace('_', ' ').title()} in {lunation['sign']}")
+        for station in m.get('stations', []):
+            print(f"      * {station['date']}: {format_station(station)}")
+
+    retrograde_periods = station_data.get('retrograde_periods', [])
+    if retrograde_periods:
+        print(f"\nRetrograde periods in range:")
+        for period in retrograde_periods:
+            print(f"  - {format_retrograde_period(period)}")
 
     return movements, data
 
@@ -18,22 +18,74 @@ Usage:
     python life_arc_generator.py --profile darren --current-age 35
     python life_arc_generator.py --profile darren --age-range 30-50 --format summary
     python life_arc_generator.py --profile darren --current-age 36 --include-progressions --include-sr
+    python life_arc_generator.py --profile darren --start-age 0 --end-age 80 --stage-cache
 """
 
 import argparse
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
+import numpy as np
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 from profile_loader import load_profile, list_profiles
 from profections_calculator import calculate_profection_with_natal
-from zodiacal_releasing import calculate_zr_from_lot, find_current_period
-from secondary_progressions import calculate_progressed_positions, find_progressed_aspects_to_natal
-from solar_returns import calculate_solar_return_chart, find_sr_to_natal_aspects
+from zodiacal_releasing import calculate_zr_from_lot
+from secondary_progressions import calculate_progressed_positions, find_progressed_aspects_to_natal, find_progressed_events
+from solar_returns import calculate_solar_return_chart, calculate_solar_returns_range, find_sr_to_natal_aspects
 from transits import calculate_transiting_positions, find_transit_aspects_to_natal, find_transits_in_natal_houses
-from firdaria_calculator import calculate_major_periods, calculate_sub_periods, find_active_periods
+from firdaria_calculator import calculate_major_periods, calculate_sub_periods
+from time_lord_index import get_timeline_index
+from stage_cache import StageCache, code_fingerprint, file_fingerprint
+import profections_calculator
+import zodiacal_releasing
+import firdaria_calculator
+import secondary_progressions
+import solar_returns as solar_returns_module
+import transits as transits_module
+import ephemeris_sampler
+import progressed_ephemeris
+import time_lord_index
+import natal_target_index
+import aspect_solver
+
+# Convergence scoring point values (see calculate_convergence_score)
+CONVERGENCE_POINTS = {
+    # TIER 1 - rare multi-decade events
+    'zr_l1_transition': 20,
+    'progressed_sun_sign_change': 20,
+    # TIER 2 - major milestones
+    'saturn_uranus_return': 15,
+    'firdaria_major_transition': 10,
+    # TIER 3 - regular cycles
+    'jupiter_return': 5,
+    'firdaria_sub_transition': 2,
+    'profection_baseline': 1,
+    # Timing point activations
+    'stellium_activation': 5,
+    'fixed_star_activation': 3,
+    'antiscia_activation': 2,
+    # Profection house and lord overlays
+    'house_11_profection': 3,
+    'house_5_profection': 2,
+    'house_10_profection': 2,
+    'difficult_house_profection': 3,
+    'benefic_lord_year': 2,
+    'malefic_lord_year': 2,
+    # Traditional period overlays
+    'loosing_of_bond': 10,
+    'peak_period': 10,
+    'l1_climax': 5,
+    'opening_phase': 5,
+}
+
+# Minimum convergence score for each event level
+CONVERGENCE_THRESHOLDS = {
+    'major': 25,
+    'significant': 15,
+    'notable': 8,
+}
 
 
 def calculate_planetary_returns(start_age: int = 0, end_age: int = 100) -> List[Dict[str, Any]]:
@@ -100,66 +152,32 @@ def calculate_planetary_returns(start_age: int = 0, end_age: int = 100) -> List[
 
 def calculate_progression_sign_changes(profile_name: str, start_age: int = 0, end_age: int = 100) -> List[Dict[str, Any]]:
     """
-    Calculate major progressed sign changes (Sun and angles only).
+    Calculate major progressed sign changes (Sun only).
 
     These are RARE events marking major identity evolution:
     - Progressed Sun changes sign every ~30 years (only 2-3 times in life)
-    - Progressed ASC/MC change signs (timing varies by birth location)
+
+    Ages are exact (root-found on the progressed Sun's longitude, see
+    secondary_progressions.find_progressed_events), not a flat 1°/year.
 
     Returns:
         List of sign change events
     """
-    sign_changes = []
-
-    # Get natal positions
-    profile = load_profile(profile_name)
-    natal_planets = profile.get_planets()
-    natal_houses = profile.get_houses()
-
-    # Find natal Sun sign
-    natal_sun = next((p for p in natal_planets if p['name'] == 'Sun'), None)
-    if not natal_sun:
-        return sign_changes
-
-    natal_sun_sign = natal_sun['sign']
-    natal_sun_degree = natal_sun['degree']
-
-    # Calculate when progressed Sun changes signs
-    # Progressed Sun moves ~1 degree per year
-    # Need to reach 30 degrees to change sign
-    degrees_to_next_sign = 30.0 - natal_sun_degree
-    age_at_first_change = degrees_to_next_sign
-
-    # Track sign changes
-    current_age = age_at_first_change
-    sign_count = 0
-
-    while current_age <= end_age:
-        if current_age >= start_age:
-            sign_count += 1
-            # Calculate which sign we're entering
-            signs = [
-                'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-            ]
-            natal_sign_index = signs.index(natal_sun_sign)
-            new_sign_index = (natal_sign_index + sign_count) % 12
-            new_sign = signs[new_sign_index]
-
-            sign_changes.append({
-                'age': round(current_age, 1),
-                'point': 'Progressed Sun',
-                'event': f'Progressed Sun enters {new_sign}',
-                'old_sign': signs[(new_sign_index - 1) % 12],
-                'new_sign': new_sign,
-                'significance': 'Major identity evolution, new life chapter begins'
-            })
+    events = find_progressed_events(profile_name, start_age, end_age, include_angles=False)
 
-        # Each sign takes ~30 years
-        current_age += 30.0
-
-    # Sort by age
-    sign_changes.sort(key=lambda x: x['age'])
+    sign_changes = []
+    for ingress in events['ingresses']:
+        if ingress['body'] != 'Sun':
+            continue
+        sign_changes.append({
+            'age': round(ingress['age'], 2),
+            'date': ingress['date'],
+            'point': 'Progressed Sun',
+            'event': f"Progressed Sun enters {ingress['new_sign']}",
+            'old_sign': ingress['old_sign'],
+            'new_sign': ingress['new_sign'],
+            'significance': 'Major identity evolution, new life chapter begins'
+        })
 
     return sign_changes
 
@@ -344,14 +362,13 @@ def detect_traditional_periods(timeline: Dict[str, Any]) -> Dict[str, List[Dict[
 
     # Process Fortune ZR periods
     if timeline.get('zr_fortune'):
+        index = get_timeline_index(timeline)
         l1_periods = timeline['zr_fortune'].get('l1_periods', [])
-        l2_periods = timeline['zr_fortune'].get('l2_periods', [])
 
         # Detect Loosing of Bond (final L2 before each L1 transition)
         for i, l1_period in enumerate(l1_periods[:-1]):  # Skip last L1 (no transition after)
             # Find L2 periods within this L1
-            l2_in_l1 = [l2 for l2 in l2_periods
-                       if l1_period['start_age'] <= l2['start_age'] < l1_period['end_age']]
+            l2_in_l1 = index.changes('fortune_l2', l1_period['start_age'], l1_period['end_age'])
 
             if l2_in_l1:
                 # Get final L2 period before L1 ends
@@ -364,8 +381,7 @@ def detect_traditional_periods(timeline: Dict[str, Any]) -> Dict[str, List[Dict[
 
         # Detect Peak Periods (L2 matches L1 sign)
         for l1_period in l1_periods:
-            l2_in_l1 = [l2 for l2 in l2_periods
-                       if l1_period['start_age'] <= l2['start_age'] < l1_period['end_age']]
+            l2_in_l1 = index.changes('fortune_l2', l1_period['start_age'], l1_period['end_age'])
 
             for l2 in l2_in_l1:
                 if l2['sign'] == l1_period['sign']:
@@ -394,7 +410,107 @@ def detect_traditional_periods(timeline: Dict[str, Any]) -> Dict[str, List[Dict[
     return periods
 
 
-def calculate_convergence_score(age: int, snapshot: Dict[str, Any], timeline: Dict[str, Any], simplified_mode: bool = False) -> tuple[int, List[str]]:
+def _profection_overlays(seed_data: Dict[str, Any], profected_house: int, lord_name: Optional[str]) -> List[tuple]:
+    """
+    Timing point activations and house/lord overlays of a profection year.
+
+    Depends only on the natal seed data, the profected house and the lord of
+    the year, so callers scoring many ages can evaluate it once per house.
+
+    Returns:
+        List of (CONVERGENCE_POINTS key, reason) in scoring order
+    """
+    overlays = []
+
+    # 1. STELLIUM ACTIVATION (+5 pts): Profection enters house with 3+ planets
+    stelliums = seed_data.get('stelliums', [])
+    house_stelliums = [s for s in stelliums if s.get('type') == 'house']
+    for stellium in house_stelliums:
+        # Extract house number from "House N" format
+        location = stellium.get('location', '')
+        if location.startswith('House '):
+            stellium_house = int(location.split(' ')[1])
+            if stellium_house == profected_house:
+                planet_names = ', '.join(stellium['planets'])
+                overlays.append(('stellium_activation', f"Stellium activation: House {profected_house} ({planet_names})"))
+                break  # Only count once per house
+
+    # 2. FIXED STAR ACTIVATION (+3 pts): Profection activates natal fixed star
+    # Check if any planets in the profected house are conjunct fixed stars
+    houses = seed_data.get('houses', [])
+    for house in houses:
+        if house.get('number') == profected_house:
+            planets_in_house = house.get('planets_in_house', [])
+            if planets_in_house:
+                fixed_stars_data = seed_data.get('fixed_stars', {})
+                stars = fixed_stars_data.get('stars', [])
+
+                for planet in planets_in_house:
+                    planet_name = planet.get('name')
+                    # Check if this planet is conjunct a fixed star
+                    for star in stars:
+                        for conj in star.get('conjunctions', []):
+                            if conj.get('planet') == planet_name:
+                                star_name = star.get('traditional_name', star.get('name'))
+                                overlays.append(('fixed_star_activation', f"Fixed star activation: {planet_name} conjunct {star_name}"))
+                                break
+
+    # 3. ANTISCIA ACTIVATION (+2 pts): Profection activates planet's antiscion
+    # Check if any planet's antiscion or contra-antiscion falls in the profected house's sign
+    antiscia_list = seed_data.get('antiscia', [])
+
+    # Get the sign of the profected house
+    profected_sign = None
+    for house in houses:
+        if house.get('number') == profected_house:
+            profected_sign = house.get('sign')
+            break
+
+    if profected_sign:
+        # Check each planet's antiscia
+        for antiscion_data in antiscia_list:
+            antiscion_sign = antiscion_data.get('antiscion', {}).get('sign')
+            contra_sign = antiscion_data.get('contra_antiscion', {}).get('sign')
+
+            if antiscion_sign == profected_sign or contra_sign == profected_sign:
+                planet_name = antiscion_data.get('planet')
+                activation_type = 'antiscion' if antiscion_sign == profected_sign else 'contra-antiscion'
+                overlays.append(('antiscia_activation', f"Antiscia activation: {planet_name} {activation_type} in {profected_sign}"))
+                break  # Only count once per profection
+
+    # PROFECTION HOUSE OVERLAYS - Traditional house bonuses
+    if profected_house == 11:
+        overlays.append(('house_11_profection', "11H profection (fortunate - friends, hopes)"))
+    elif profected_house == 5:
+        overlays.append(('house_5_profection', "5H profection (joyful - creativity, pleasure)"))
+    elif profected_house == 10:
+        overlays.append(('house_10_profection', "10H profection (career, public status)"))
+    elif profected_house in [6, 8, 12]:
+        house_names = {6: '6H (health/service)', 8: '8H (death/crisis)', 12: '12H (loss/isolation)'}
+        overlays.append(('difficult_house_profection', f"{house_names.get(profected_house)} profection (difficult)"))
+
+    # PROFECTION LORD OVERLAYS - Benefic/malefic ruled years
+    if lord_name:
+        if lord_name in ['Jupiter', 'Venus']:
+            overlays.append(('benefic_lord_year', f"{lord_name} year (benefic)"))
+        elif lord_name in ['Saturn', 'Mars']:
+            # Only add bonus if malefic of sect
+            framework = seed_data.get('chart_framework', {})
+            sect_type = framework.get('sect', {}).get('type', 'day')
+            # Saturn malefic in day charts, Mars malefic in night charts
+            if (lord_name == 'Saturn' and sect_type == 'day') or (lord_name == 'Mars' and sect_type == 'night'):
+                overlays.append(('malefic_lord_year', f"{lord_name} year (malefic of sect)"))
+
+    return overlays
+
+
+def calculate_convergence_score(
+    age: int,
+    snapshot: Dict[str, Any],
+    timeline: Dict[str, Any],
+    simplified_mode: bool = False,
+    points: Optional[Dict[str, int]] = None
+) -> tuple[int, List[str]]:
     """
     Calculate convergence score for a given age.
 
@@ -414,228 +530,177 @@ def calculate_convergence_score(age: int, snapshot: Dict[str, Any], timeline: Di
         snapshot: Snapshot of all active periods at this age
         timeline: Full timeline data
         simplified_mode: If True, exclude L2 periods and Firdaria subs from scoring
+        points: Point values overriding CONVERGENCE_POINTS (optional)
 
     Returns:
         Tuple of (score, list of reasons)
     """
-    score = 0
-    reasons = []
-
-    # TIER 1 - RARE MULTI-DECADE EVENTS (20 points)
-    # ZR L1 transitions (sign changes)
-    if snapshot['fortune_l1']:
-        fortune_start = snapshot['fortune_l1'].get('start_age', 0)
-        if abs(age - fortune_start) <= 0.5:  # FIXED: Changed < to <=
-            score += 20
-            reasons.append(f"ZR Fortune L1 → {snapshot['fortune_l1']['sign']}")
-
-    if snapshot['spirit_l1']:
-        spirit_start = snapshot['spirit_l1'].get('start_age', 0)
-        if abs(age - spirit_start) <= 0.5:  # FIXED: Changed < to <=
-            score += 20
-            reasons.append(f"ZR Spirit L1 → {snapshot['spirit_l1']['sign']}")
-
-    # Progressed Sun sign changes
+    row = calculate_convergence_scores(
+        timeline,
+        ages=[age],
+        snapshots={age: snapshot},
+        simplified_mode=simplified_mode,
+        points=points
+    )[age]
+    return row['score'], row['reasons']
+
+
+def calculate_convergence_scores(
+    timeline: Dict[str, Any],
+    ages: Optional[Sequence[float]] = None,
+    snapshots: Optional[Dict[Any, Dict[str, Any]]] = None,
+    simplified_mode: bool = False,
+    points: Optional[Dict[str, int]] = None
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Convergence scores for many ages at once.
+
+    Implements the scoring rules documented on calculate_convergence_score
+    (which scores a single age through this function). Each feature is
+    materialized once as an array over all ages (period start ages, event
+    proximity, profected house and lord, aftermath windows) and adds its
+    points with array operations. Profection overlays are evaluated once per
+    (house, lord) pair. Ages may be fractional (e.g. monthly steps).
+
+    Args:
+        timeline: Full timeline data
+        ages: Ages to score (default: every whole age in the timeline's range)
+        snapshots: {age: get_year_snapshot(timeline, age)}, computed if missing
+        simplified_mode: If True, exclude L2 periods and Firdaria subs from scoring
+        points: Point values overriding CONVERGENCE_POINTS (optional)
+
+    Returns:
+        {age: {'score': int, 'reasons': [str, ...], 'snapshot': dict}} in age order
+    """
+    points = dict(CONVERGENCE_POINTS, **(points or {}))
+    if ages is None:
+        ages = range(timeline['age_range']['start'], timeline['age_range']['end'] + 1)
+    ages = list(ages)
+    if snapshots is None:
+        snapshots = {}
+    snapshots = {age: snapshots[age] if age in snapshots else get_year_snapshot(timeline, age) for age in ages}
+    snaps = [snapshots[age] for age in ages]
+
+    age_array = np.asarray(ages, dtype=np.float64)
+    scores = np.zeros(len(ages), dtype=np.int64)
+    reasons = [[] for _ in ages]
+
+    def add(mask: np.ndarray, value, reason) -> None:
+        """Add points where mask holds; reason is a string or a callable of the row."""
+        scores[mask] += value if np.isscalar(value) else np.asarray(value)[mask]
+        for i in np.flatnonzero(mask).tolist():
+            reasons[i].append(reason(i) if callable(reason) else reason)
+
+    def period_feature(key: str, field: str) -> np.ndarray:
+        """Start age of the active period in each snapshot (NaN where none)."""
+        return np.array([snap[key].get(field, 0) if snap[key] else np.nan for snap in snaps], dtype=np.float64)
+
+    def near(target) -> np.ndarray:
+        with np.errstate(invalid='ignore'):
+            return np.abs(age_array - target) <= 0.5
+
+    # TIER 1 - RARE MULTI-DECADE EVENTS: ZR L1 transitions, progressed Sun sign changes
+    add(near(period_feature('fortune_l1', 'start_age')), points['zr_l1_transition'],
+        lambda i: f"ZR Fortune L1 → {snaps[i]['fortune_l1']['sign']}")
+    add(near(period_feature('spirit_l1', 'start_age')), points['zr_l1_transition'],
+        lambda i: f"ZR Spirit L1 → {snaps[i]['spirit_l1']['sign']}")
+
     for prog_change in timeline.get('progression_sign_changes', []):
-        if abs(age - prog_change['age']) <= 0.5:  # FIXED: Changed < to <=
-            score += 20
-            reasons.append(f"Progressed Sun → {prog_change['new_sign']}")
+        add(near(prog_change['age']), points['progressed_sun_sign_change'], f"Progressed Sun → {prog_change['new_sign']}")
 
-    # TIER 2 - MAJOR MILESTONES (10-15 points)
+    # TIER 2 - MAJOR MILESTONES
     for return_event in timeline.get('planetary_returns', []):
-        if abs(age - return_event['age']) <= 0.5:  # FIXED: Changed < to <=
-            if return_event['planet'] in ['Saturn', 'Uranus']:
-                score += 15
-                reasons.append(return_event['event'])
-            elif return_event['planet'] == 'Jupiter':
-                score += 5
-                reasons.append(return_event['event'])
-
-    # Firdaria major transitions
-    if snapshot['firdaria_major']:
-        fir_start = snapshot['firdaria_major'].get('start_age', 0)
-        if abs(age - fir_start) <= 0.5:  # FIXED: Changed < to <=
-            score += 10
-            reasons.append(f"Firdaria → {snapshot['firdaria_major']['planet']}")
-
-    # TIER 3 - REGULAR CYCLES (1-2 points)
-    # Skip Firdaria sub-periods in simplified mode (reduces noise)
-    if not simplified_mode and snapshot['firdaria_sub']:
-        sub_start = snapshot['firdaria_sub'].get('start_age', 0)
-        if abs(age - sub_start) <= 0.5:  # FIXED: Changed < to <=
-            score += 2
-            reasons.append(f"Firdaria sub → {snapshot['firdaria_sub']['sub_planet']}")
-
-    # Always add 1 point for profection (baseline)
-    score += 1
-
-    # TIMING POINT ACTIVATIONS - When profections/ZR activate natal features
-    # These add convergence when timing techniques activate special chart points
-
-    # Get profile name and load seed data for activation checks
+        if return_event['planet'] in ['Saturn', 'Uranus']:
+            add(near(return_event['age']), points['saturn_uranus_return'], return_event['event'])
+        elif return_event['planet'] == 'Jupiter':
+            add(near(return_event['age']), points['jupiter_return'], return_event['event'])
+
+    add(near(period_feature('firdaria_major', 'start_age')), points['firdaria_major_transition'],
+        lambda i: f"Firdaria → {snaps[i]['firdaria_major']['planet']}")
+
+    # TIER 3 - REGULAR CYCLES
+    if not simplified_mode:
+        add(near(period_feature('firdaria_sub', 'start_age')), points['firdaria_sub_transition'],
+            lambda i: f"Firdaria sub → {snaps[i]['firdaria_sub']['sub_planet']}")
+
+    scores += points['profection_baseline']
+
+    # TIMING POINT ACTIVATIONS and PROFECTION HOUSE/LORD OVERLAYS, once per (house, lord)
     profile_name = timeline.get('profile')
-    if profile_name and snapshot['profection']:
+    if profile_name:
         try:
             from profile_loader import load_profile
-            profile = load_profile(profile_name)
-            seed_data = profile.seed_data
-
-            if seed_data:
-                profected_house = snapshot['profection']['profection']['profected_house']
-
-                # 1. STELLIUM ACTIVATION (+5 pts): Profection enters house with 3+ planets
-                stelliums = seed_data.get('stelliums', [])
-                house_stelliums = [s for s in stelliums if s.get('type') == 'house']
-                for stellium in house_stelliums:
-                    # Extract house number from "House N" format
-                    location = stellium.get('location', '')
-                    if location.startswith('House '):
-                        stellium_house = int(location.split(' ')[1])
-                        if stellium_house == profected_house:
-                            score += 5
-                            planet_names = ', '.join(stellium['planets'])
-                            reasons.append(f"Stellium activation: House {profected_house} ({planet_names})")
-                            break  # Only count once per house
-
-                # 2. FIXED STAR ACTIVATION (+3 pts): Profection activates natal fixed star
-                # Check if any planets in the profected house are conjunct fixed stars
-                houses = seed_data.get('houses', [])
-                for house in houses:
-                    if house.get('number') == profected_house:
-                        planets_in_house = house.get('planets_in_house', [])
-                        if planets_in_house:
-                            fixed_stars_data = seed_data.get('fixed_stars', {})
-                            stars = fixed_stars_data.get('stars', [])
-
-                            for planet in planets_in_house:
-                                planet_name = planet.get('name')
-                                # Check if this planet is conjunct a fixed star
-                                for star in stars:
-                                    for conj in star.get('conjunctions', []):
-                                        if conj.get('planet') == planet_name:
-                                            score += 3
-                                            star_name = star.get('traditional_name', star.get('name'))
-                                            reasons.append(f"Fixed star activation: {planet_name} conjunct {star_name}")
-                                            break
-
-                # 3. ANTISCIA ACTIVATION (+2 pts): Profection activates planet's antiscion
-                # Check if any planet's antiscion or contra-antiscion falls in the profected house's sign
-                antiscia_list = seed_data.get('antiscia', [])
-                houses = seed_data.get('houses', [])
-
-                # Get the sign of the profected house
-                profected_sign = None
-                for house in houses:
-                    if house.get('number') == profected_house:
-                        profected_sign = house.get('sign')
-                        break
-
-                if profected_sign:
-                    # Check each planet's antiscia
-                    for antiscion_data in antiscia_list:
-                        antiscion_sign = antiscion_data.get('antiscion', {}).get('sign')
-                        contra_sign = antiscion_data.get('contra_antiscion', {}).get('sign')
-
-                        if antiscion_sign == profected_sign or contra_sign == profected_sign:
-                            score += 2
-                            planet_name = antiscion_data.get('planet')
-                            activation_type = 'antiscion' if antiscion_sign == profected_sign else 'contra-antiscion'
-                            reasons.append(f"Antiscia activation: {planet_name} {activation_type} in {profected_sign}")
-                            break  # Only count once per profection
-
-                # PROFECTION HOUSE OVERLAYS - Traditional house bonuses
-                if profected_house == 11:
-                    score += 3
-                    reasons.append("11H profection (fortunate - friends, hopes)")
-                elif profected_house == 5:
-                    score += 2
-                    reasons.append("5H profection (joyful - creativity, pleasure)")
-                elif profected_house == 10:
-                    score += 2
-                    reasons.append("10H profection (career, public status)")
-                elif profected_house in [6, 8, 12]:
-                    score += 3
-                    house_names = {6: '6H (health/service)', 8: '8H (death/crisis)', 12: '12H (loss/isolation)'}
-                    reasons.append(f"{house_names.get(profected_house)} profection (difficult)")
-
-                # PROFECTION LORD OVERLAYS - Benefic/malefic ruled years
-                lord_name = snapshot['profection']['profection'].get('lord_of_year')
-                if lord_name:
-                    if lord_name in ['Jupiter', 'Venus']:
-                        score += 2
-                        reasons.append(f"{lord_name} year (benefic)")
-                    elif lord_name in ['Saturn', 'Mars']:
-                        # Only add bonus if malefic of sect
-                        framework = seed_data.get('chart_framework', {})
-                        sect_type = framework.get('sect', {}).get('type', 'day')
-                        # Saturn malefic in day charts, Mars malefic in night charts
-                        if (lord_name == 'Saturn' and sect_type == 'day') or (lord_name == 'Mars' and sect_type == 'night'):
-                            score += 2
-                            reasons.append(f"{lord_name} year (malefic of sect)")
-
-        except Exception as e:
-            # Silently skip if profile loading fails (don't break convergence calculation)
-            pass
-
-    # TRADITIONAL PERIOD OVERLAYS - Traditional Hellenistic periods
-    # Check if timeline has traditional_periods data
+            seed_data = load_profile(profile_name).seed_data
+        except Exception:
+            seed_data = None
+
+        if seed_data:
+            year_keys = [
+                (snap['profection']['profection']['profected_house'], snap['profection']['profection'].get('lord_of_year'))
+                if snap['profection'] else None
+                for snap in snaps
+            ]
+            for year_key in dict.fromkeys(k for k in year_keys if k is not None):
+                try:
+                    overlays = _profection_overlays(seed_data, *year_key)
+                except Exception:
+                    continue
+                mask = np.array([k == year_key for k in year_keys])
+                for key, reason in overlays:
+                    add(mask, points[key], reason)
+
+    # TRADITIONAL PERIOD OVERLAYS - first matching period of each kind
     traditional_periods = timeline.get('traditional_periods')
     if traditional_periods:
-        # Loosing of Bond: Final L2 before L1 transition (intense preparatory phase)
-        for loosing in traditional_periods.get('loosing_of_bond', []):
-            if loosing['ages'][0] <= age <= loosing['ages'][1]:
-                score += 10
-                reasons.append(f"Loosing of Bond ({loosing['l1_sign']} → next L1)")
-                break
-
-        # Peak Periods: L2 matches L1 sign (empowered/smooth expression)
-        for peak in traditional_periods.get('peak_periods', []):
-            if peak['ages'][0] <= age <= peak['ages'][1]:
-                score += 10
-                reasons.append(f"Peak Period ({peak['sign']} empowerment)")
-                break
-
-        # Climax Periods: Midpoint of L1 (culmination)
-        for climax in traditional_periods.get('climax_periods', []):
-            if abs(age - climax['age']) <= 0.5:
-                score += 5
-                reasons.append(f"L1 Climax ({climax['l1_sign']} midpoint)")
-                break
-
-        # Opening Phases: First 2 years of L1 (new chapter begins)
-        for opening in traditional_periods.get('opening_phases', []):
-            if opening['ages'][0] <= age <= opening['ages'][1]:
-                score += 5
-                reasons.append(f"Opening Phase ({opening['l1_sign']} begins)")
-                break
-
-    # SATURN RETURN AFTERMATH - Multi-year difficulty overlay
-    # Check if timeline has saturn_assessments data (list of assessments, one per return)
-    saturn_assessments = timeline.get('saturn_assessments')
-    if saturn_assessments:
-        # Match each assessment to its corresponding return age
-        for assessment in saturn_assessments:
-            return_age = assessment['return_age']
-            aftermath_years = assessment['aftermath_years']
-            aftermath_bonus = assessment['aftermath_bonus']
-            level = assessment['difficulty_level']
-
-            # Check if current age is within aftermath window
-            if return_age < age <= return_age + aftermath_years:
-                score += aftermath_bonus
-                years_after = age - int(return_age)
-                reasons.append(f"Saturn aftermath year {years_after}/{aftermath_years} ({level})")
-
-    return score, reasons
-
-
-def identify_convergence_events(timeline: Dict[str, Any], simplified_mode: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        overlays = [
+            ('loosing_of_bond', 'loosing_of_bond',
+             lambda p: (p['ages'][0] <= age_array) & (age_array <= p['ages'][1]),
+             lambda p: f"Loosing of Bond ({p['l1_sign']} → next L1)"),
+            ('peak_periods', 'peak_period',
+             lambda p: (p['ages'][0] <= age_array) & (age_array <= p['ages'][1]),
+             lambda p: f"Peak Period ({p['sign']} empowerment)"),
+            ('climax_periods', 'l1_climax',
+             lambda p: near(p['age']),
+             lambda p: f"L1 Climax ({p['l1_sign']} midpoint)"),
+            ('opening_phases', 'opening_phase',
+             lambda p: (p['ages'][0] <= age_array) & (age_array <= p['ages'][1]),
+             lambda p: f"Opening Phase ({p['l1_sign']} begins)"),
+        ]
+        for kind, key, within, describe in overlays:
+            matched = np.zeros(len(ages), dtype=bool)
+            for period in traditional_periods.get(kind, []):
+                mask = within(period) & ~matched
+                add(mask, points[key], describe(period))
+                matched |= mask
+
+    # SATURN RETURN AFTERMATH - multi-year difficulty overlay
+    for assessment in timeline.get('saturn_assessments') or []:
+        return_age = assessment['return_age']
+        aftermath_years = assessment['aftermath_years']
+        mask = (return_age < age_array) & (age_array <= return_age + aftermath_years)
+        add(mask, assessment['aftermath_bonus'],
+            lambda i: f"Saturn aftermath year {ages[i] - int(return_age)}/{aftermath_years} ({assessment['difficulty_level']})")
+
+    return {
+        age: {'score': int(scores[i]), 'reasons': reasons[i], 'snapshot': snapshots[age]}
+        for i, age in enumerate(ages)
+    }
+
+
+def identify_convergence_events(
+    timeline: Dict[str, Any],
+    simplified_mode: bool = False,
+    points: Optional[Dict[str, int]] = None,
+    scores: Optional[Dict[Any, Dict[str, Any]]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
     """
     Identify all convergence events in timeline.
 
     Args:
         timeline: Complete timeline data
         simplified_mode: If True, exclude L2 periods and Firdaria subs from scoring
+        points: Point values overriding CONVERGENCE_POINTS (optional)
+        scores: Precomputed calculate_convergence_scores table (computed if None)
 
     Returns:
         Dictionary with 'major', 'significant', and 'notable' event lists
@@ -644,25 +709,23 @@ def identify_convergence_events(timeline: Dict[str, Any], simplified_mode: bool
     significant_events = []
     notable_events = []
 
-    start_age = timeline['age_range']['start']
-    end_age = timeline['age_range']['end']
-
-    for age in range(start_age, end_age + 1):
-        snapshot = get_year_snapshot(timeline, age)
-        score, reasons = calculate_convergence_score(age, snapshot, timeline, simplified_mode)
+    if scores is None:
+        scores = calculate_convergence_scores(timeline, simplified_mode=simplified_mode, points=points)
 
+    for age, score_data in scores.items():
+        score = score_data['score']
         event = {
             'age': age,
             'score': score,
-            'reasons': reasons,
-            'snapshot': snapshot
+            'reasons': list(score_data['reasons']),
+            'snapshot': score_data['snapshot']
         }
 
-        if score >= 25:
+        if score >= CONVERGENCE_THRESHOLDS['major']:
             major_events.append(event)
-        elif score >= 15:
+        elif score >= CONVERGENCE_THRESHOLDS['significant']:
             significant_events.append(event)
-        elif score >= 8:
+        elif score >= CONVERGENCE_THRESHOLDS['notable']:
             notable_events.append(event)
 
     return {
@@ -784,6 +847,53 @@ def analyze_period_nature(cluster: Dict[str, Any], scores: Dict[int, Dict[str, A
         return 'mixed'
 
 
+def _run_stage(
+    stage_cache: Optional[StageCache],
+    stage: str,
+    inputs: Dict[str, Any],
+    code: tuple,
+    compute
+) -> tuple:
+    """
+    Run one timeline stage through the stage cache (or directly without one).
+
+    Args:
+        stage_cache: StageCache, or None to always compute
+        stage: Stage name
+        inputs: Everything the stage depends on besides code
+        code: Functions/modules whose source the result depends on
+        compute: Zero-argument function producing the result
+
+    Returns:
+        (stage key or None, result)
+    """
+    if stage_cache is None:
+        return None, compute()
+    return stage_cache.get_or_compute(stage, dict(inputs, code=code_fingerprint(*code)), compute)
+
+
+def _stage_cached(stage_cache: Optional[StageCache], stage: str, inputs: Dict[str, Any], code: tuple) -> bool:
+    """True if _run_stage would return a stored result instead of computing."""
+    return stage_cache is not None and stage_cache.contains(stage, dict(inputs, code=code_fingerprint(*code)))
+
+
+def _calculate_solar_return_entry(
+    profile_name: str,
+    age: int,
+    chart: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    try:
+        sr = chart if chart is not None else calculate_solar_return_chart(profile_name, age=age)
+        sr_aspects = find_sr_to_natal_aspects(sr, profile_name, orb=3.0)
+        return {
+            'chart': sr,
+            'aspects': sr_aspects
+        }
+    except Exception as e:
+        # Skip if SR calculation fails (e.g., age beyond valid range)
+        return None
+
+
 def generate_life_arc_timeline(
     profile_name: str,
     start_age: int = 0,
@@ -793,11 +903,19 @@ def generate_life_arc_timeline(
     include_progressions: bool = False,
     include_solar_returns: bool = False,
     current_date: Optional[str] = None,
-    simplified_mode: bool = False
+    simplified_mode: bool = False,
+    stage_cache: Optional[StageCache] = None,
+    convergence_points: Optional[Dict[str, int]] = None
 ) -> Dict[str, Any]:
     """
     Generate complete life arc timeline combining all techniques.
 
+    With a stage_cache, each stage (period tables, returns, progression sign
+    changes, per-age progressions/solar returns, snapshots, scores) is looked
+    up by a hash of its inputs and only recomputed when they change - e.g.
+    changing convergence_points re-runs scoring alone, and widening the age
+    range reuses the Saturn return assessments and per-age charts.
+
     Args:
         profile_name: Profile to analyze
         start_age: Starting age
@@ -809,6 +927,8 @@ def generate_life_arc_timeline(
         current_date: Date for current transits (YYYY-MM-DD or None)
         simplified_mode: If True, exclude L2 periods and Firdaria subs from convergence scoring
                          (reduces noise for decades-long life arc analysis)
+        stage_cache: StageCache for incremental regeneration (optional)
+        convergence_points: Point values overriding CONVERGENCE_POINTS (optional)
 
     Returns:
         Dictionary with unified timeline data
@@ -817,84 +937,131 @@ def generate_life_arc_timeline(
     profile = load_profile(profile_name)
     birth_data = profile.get_birth_data()
 
-    # Calculate profections for entire range
-    profections = []
-    for age in range(start_age, end_age + 1):
-        prof = calculate_profection_with_natal(profile_name, age)
-        profections.append(prof)
-
-    # Calculate ZR from Fortune and Spirit
-    zr_fortune = None
-    zr_spirit = None
-
-    if include_fortune:
-        zr_fortune = calculate_zr_from_lot(profile_name, 'fortune', max_age=end_age + 10)
-
-    if include_spirit:
-        zr_spirit = calculate_zr_from_lot(profile_name, 'spirit', max_age=end_age + 10)
-
-    # Calculate Firdaria (75-year planetary period system)
-    framework = profile.get_chart_framework()
-    sect = framework.get('sect', {}).get('type', 'day')
-    firdaria_major = calculate_major_periods(sect)
-
-    # Calculate all sub-periods for timeline
-    firdaria_all_subs = []
-    for major in firdaria_major:
-        subs = calculate_sub_periods(major, sect)
-        firdaria_all_subs.extend(subs)
-
-    firdaria = {
-        'sect': sect,
-        'major_periods': firdaria_major,
-        'sub_periods': firdaria_all_subs,
+    # Every stage depends on the seed data; the key only matters when caching
+    seed = {
+        'profile': profile_name,
+        'seed_hash': file_fingerprint(profile.seed_data_path) if stage_cache else None,
     }
 
+    # Calculate profections for entire range
+    profections_key, profections = _run_stage(
+        stage_cache, 'profections',
+        dict(seed, start_age=start_age, end_age=end_age),
+        (profections_calculator,),
+        lambda: [calculate_profection_with_natal(profile_name, age) for age in range(start_age, end_age + 1)]
+    )
+
+    # Calculate ZR from Fortune and Spirit, and Firdaria (75-year planetary period system)
+    def calculate_period_tables():
+        zr_fortune = None
+        zr_spirit = None
+
+        if include_fortune:
+            zr_fortune = calculate_zr_from_lot(profile_name, 'fortune', max_age=end_age + 10)
+
+        if include_spirit:
+            zr_spirit = calculate_zr_from_lot(profile_name, 'spirit', max_age=end_age + 10)
+
+        framework = profile.get_chart_framework()
+        sect = framework.get('sect', {}).get('type', 'day')
+        firdaria_major = calculate_major_periods(sect)
+
+        # Calculate all sub-periods for timeline
+        firdaria_all_subs = []
+        for major in firdaria_major:
+            subs = calculate_sub_periods(major, sect)
+            firdaria_all_subs.extend(subs)
+
+        firdaria = {
+            'sect': sect,
+            'major_periods': firdaria_major,
+            'sub_periods': firdaria_all_subs,
+        }
+        return zr_fortune, zr_spirit, firdaria
+
+    period_tables_key, (zr_fortune, zr_spirit, firdaria) = _run_stage(
+        stage_cache, 'period_tables',
+        dict(seed, max_age=end_age + 10, include_fortune=include_fortune, include_spirit=include_spirit),
+        (zodiacal_releasing, firdaria_calculator),
+        calculate_period_tables
+    )
+
     # Calculate planetary returns (Jupiter, Saturn, Uranus opposition)
-    planetary_returns = calculate_planetary_returns(start_age, end_age)
+    returns_key, planetary_returns = _run_stage(
+        stage_cache, 'planetary_returns',
+        {'start_age': start_age, 'end_age': end_age},
+        (calculate_planetary_returns,),
+        lambda: calculate_planetary_returns(start_age, end_age)
+    )
 
     # Calculate progressed Sun/angles sign changes (CORE - always included)
-    progression_sign_changes = calculate_progression_sign_changes(profile_name, start_age, end_age)
+    sign_changes_key, progression_sign_changes = _run_stage(
+        stage_cache, 'progression_sign_changes',
+        dict(seed, start_age=start_age, end_age=end_age),
+        (calculate_progression_sign_changes, secondary_progressions, progressed_ephemeris, aspect_solver),
+        lambda: calculate_progression_sign_changes(profile_name, start_age, end_age)
+    )
 
-    # Calculate progressions (if requested)
+    # Calculate progressions (if requested) - one stage per age, so a wider range reuses the rest
     progressions = None
+    progression_keys = None
     if include_progressions:
         progressions = {}
+        progression_keys = {}
         for age in range(start_age, end_age + 1):
-            prog = calculate_progressed_positions(profile_name, float(age))
-            prog_aspects = find_progressed_aspects_to_natal(profile_name, float(age), orb=3.0)
-            progressions[age] = {
-                'positions': prog,
-                'aspects': prog_aspects
-            }
+            progression_keys[age], progressions[age] = _run_stage(
+                stage_cache, 'progressions',
+                dict(seed, age=age),
+                (secondary_progressions, progressed_ephemeris, ephemeris_sampler, natal_target_index),
+                lambda age=age: {
+                    'positions': calculate_progressed_positions(profile_name, float(age)),
+                    'aspects': find_progressed_aspects_to_natal(profile_name, float(age), orb=3.0)
+                }
+            )
 
     # Calculate solar returns (if requested)
     solar_returns = None
+    solar_return_keys = None
     if include_solar_returns:
         solar_returns = {}
-        for age in range(start_age, end_age + 1):
-            try:
-                sr = calculate_solar_return_chart(profile_name, age=age)
-                sr_aspects = find_sr_to_natal_aspects(sr, profile_name, orb=3.0)
-                solar_returns[age] = {
-                    'chart': sr,
-                    'aspects': sr_aspects
-                }
-            except Exception as e:
-                # Skip if SR calculation fails (e.g., age beyond valid range)
-                pass
+        solar_return_keys = {}
+        sr_code = (solar_returns_module, ephemeris_sampler, natal_target_index)
+        sr_ages = range(start_age, end_age + 1)
+
+        # Cast every age the stage cache cannot serve in one batch
+        uncached = [age for age in sr_ages if not _stage_cached(stage_cache, 'solar_return', dict(seed, age=age), sr_code)]
+        charts = calculate_solar_returns_range(profile_name, uncached) if uncached else {}
+
+        for age in sr_ages:
+            solar_return_keys[age], entry = _run_stage(
+                stage_cache, 'solar_return',
+                dict(seed, age=age),
+                sr_code,
+                lambda age=age: _calculate_solar_return_entry(profile_name, age, charts.get(age))
+            )
+            if entry is not None:
+                solar_returns[age] = entry
 
     # Calculate current transits (if date provided)
-    transits = None
-    if current_date:
+    def calculate_current_transits():
         transits_data = calculate_transiting_positions(current_date, include_modern=True)
         transits_data = find_transits_in_natal_houses(transits_data, profile_name)
         transit_aspects = find_transit_aspects_to_natal(transits_data, profile_name, orb=3.0)
-        transits = {
+        return {
             'positions': transits_data,
             'aspects': transit_aspects
         }
 
+    transits = None
+    transits_key = None
+    if current_date:
+        transits_key, transits = _run_stage(
+            stage_cache, 'transits',
+            dict(seed, current_date=current_date),
+            (transits_module, ephemeris_sampler, natal_target_index),
+            calculate_current_transits
+        )
+
     # Get all calculated lots
     lots = profile.get_lots()
 
@@ -921,10 +1088,18 @@ def generate_life_arc_timeline(
     # Assess EACH Saturn return individually based on progressed Saturn condition at that age
     saturn_returns = [r for r in planetary_returns if r['planet'] == 'Saturn']
     saturn_assessments = []
+    saturn_keys = []
     for saturn_return in saturn_returns:
         return_age = saturn_return['age']
-        assessment = assess_saturn_return_difficulty(profile_name, return_age)
+        key, assessment = _run_stage(
+            stage_cache, 'saturn_assessment',
+            dict(seed, return_age=return_age),
+            (assess_saturn_return_difficulty, secondary_progressions, progressed_ephemeris, ephemeris_sampler,
+             natal_target_index),
+            lambda return_age=return_age: assess_saturn_return_difficulty(profile_name, return_age)
+        )
         saturn_assessments.append(assessment)
+        saturn_keys.append(key)
 
     traditional_periods = detect_traditional_periods(timeline)
 
@@ -932,49 +1107,77 @@ def generate_life_arc_timeline(
     timeline['saturn_assessments'] = saturn_assessments  # List of assessments, one per return
     timeline['traditional_periods'] = traditional_periods
 
-    # Calculate convergence events (needs complete timeline data)
-    convergence = identify_convergence_events(timeline, simplified_mode)
-    timeline['convergence'] = convergence
-    timeline['simplified_mode'] = simplified_mode
+    # Everything scoring reads from the timeline, by content address
+    timeline_keys = {
+        'profections': profections_key,
+        'period_tables': period_tables_key,
+        'planetary_returns': returns_key,
+        'progression_sign_changes': sign_changes_key,
+        'progressions': progression_keys,
+        'solar_returns': solar_return_keys,
+        'transits': transits_key,
+        'saturn_assessments': saturn_keys,
+    }
 
-    # Calculate period clusters (groups consecutive elevated-activity ages into multi-year periods)
-    # Build score dictionary for all ages
-    scores = {}
-    for age in range(start_age, end_age + 1):
-        snapshot = get_year_snapshot(timeline, age)
-        score, reasons = calculate_convergence_score(age, snapshot, timeline, simplified_mode)
-        scores[age] = {
-            'score': score,
-            'reasons': reasons,
-            'snapshot': snapshot
-        }
+    # Per-age snapshots of every active period (independent of scoring rules)
+    snapshots_key, snapshots = _run_stage(
+        stage_cache, 'snapshots',
+        timeline_keys,
+        (get_year_snapshot, time_lord_index),
+        lambda: {age: get_year_snapshot(timeline, age) for age in range(start_age, end_age + 1)}
+    )
 
-    # Identify period clusters (min_score=8 = notable threshold, gap_tolerance=2 years)
-    clusters = identify_period_clusters(scores, min_score=8, gap_tolerance=2)
-
-    # Classify each period's nature
-    for cluster in clusters:
-        cluster['nature'] = analyze_period_nature(cluster, scores)
-        cluster['duration'] = cluster['end'] - cluster['start'] + 1
-
-    # Categorize periods by nature
-    period_analysis = {
-        'clusters': clusters,
-        'by_nature': {
-            'challenging': [c for c in clusters if c['nature'] == 'challenging'],
-            'transformative': [c for c in clusters if c['nature'] == 'transformative'],
-            'favorable': [c for c in clusters if c['nature'] == 'favorable'],
-            'mixed': [c for c in clusters if c['nature'] == 'mixed']
-        },
-        'statistics': {
-            'total_periods': len(clusters),
-            'challenging_count': len([c for c in clusters if c['nature'] == 'challenging']),
-            'transformative_count': len([c for c in clusters if c['nature'] == 'transformative']),
-            'favorable_count': len([c for c in clusters if c['nature'] == 'favorable']),
-            'mixed_count': len([c for c in clusters if c['nature'] == 'mixed'])
+    # Convergence scoring - the only stage re-run when point values change
+    def calculate_scores():
+        # One score table for every age, shared by events and period clusters
+        scores = calculate_convergence_scores(
+            timeline, range(start_age, end_age + 1), snapshots, simplified_mode, convergence_points
+        )
+
+        # Calculate convergence events (needs complete timeline data)
+        convergence = identify_convergence_events(timeline, simplified_mode, convergence_points, scores)
+
+        # Identify period clusters (min_score = notable threshold, gap_tolerance=2 years)
+        clusters = identify_period_clusters(scores, min_score=CONVERGENCE_THRESHOLDS['notable'], gap_tolerance=2)
+
+        # Classify each period's nature
+        for cluster in clusters:
+            cluster['nature'] = analyze_period_nature(cluster, scores)
+            cluster['duration'] = cluster['end'] - cluster['start'] + 1
+
+        # Categorize periods by nature
+        period_analysis = {
+            'clusters': clusters,
+            'by_nature': {
+                'challenging': [c for c in clusters if c['nature'] == 'challenging'],
+                'transformative': [c for c in clusters if c['nature'] == 'transformative'],
+                'favorable': [c for c in clusters if c['nature'] == 'favorable'],
+                'mixed': [c for c in clusters if c['nature'] == 'mixed']
+            },
+            'statistics': {
+                'total_periods': len(clusters),
+                'challenging_count': len([c for c in clusters if c['nature'] == 'challenging']),
+                'transformative_count': len([c for c in clusters if c['nature'] == 'transformative']),
+                'favorable_count': len([c for c in clusters if c['nature'] == 'favorable']),
+                'mixed_count': len([c for c in clusters if c['nature'] == 'mixed'])
+            }
         }
-    }
+        return convergence, period_analysis
+
+    _, (convergence, period_analysis) = _run_stage(
+        stage_cache, 'scores',
+        dict(timeline_keys,
+             snapshots=snapshots_key,
+             simplified_mode=simplified_mode,
+             points=dict(CONVERGENCE_POINTS, **(convergence_points or {})),
+             thresholds=CONVERGENCE_THRESHOLDS),
+        (calculate_convergence_scores, _profection_overlays, identify_convergence_events,
+         identify_period_clusters, analyze_period_nature, detect_traditional_periods, get_year_snapshot),
+        calculate_scores
+    )
 
+    timeline['convergence'] = convergence
+    timeline['simplified_mode'] = simplified_mode
     timeline['period_analysis'] = period_analysis
 
     return timeline
@@ -995,36 +1198,25 @@ def get_year_snapshot(timeline: Dict[str, Any], age: int) -> Dict[str, Any]:
         'solar_return': None,
     }
 
+    index = get_timeline_index(timeline)
+
     # Find profection
-    for prof in timeline['profections']:
-        if prof['profection']['age'] == age:
-            snapshot['profection'] = prof
-            break
+    snapshot['profection'] = index.period('profection', age)
 
     # Find Fortune periods
     if timeline['zr_fortune']:
-        snapshot['fortune_l1'] = find_current_period(
-            timeline['zr_fortune']['l1_periods'], float(age)
-        )
-        snapshot['fortune_l2'] = find_current_period(
-            timeline['zr_fortune']['l2_periods'], float(age)
-        )
+        snapshot['fortune_l1'] = index.period('fortune_l1', float(age))
+        snapshot['fortune_l2'] = index.period('fortune_l2', float(age))
 
     # Find Spirit periods
     if timeline['zr_spirit']:
-        snapshot['spirit_l1'] = find_current_period(
-            timeline['zr_spirit']['l1_periods'], float(age)
-        )
-        snapshot['spirit_l2'] = find_current_period(
-            timeline['zr_spirit']['l2_periods'], float(age)
-        )
+        snapshot['spirit_l1'] = index.period('spirit_l1', float(age))
+        snapshot['spirit_l2'] = index.period('spirit_l2', float(age))
 
-    # Find Firdaria periods
+    # Find Firdaria periods (coverage ends at age 75)
     if timeline['firdaria']:
-        firdaria_data = find_active_periods(float(age), timeline['firdaria']['sect'])
-        if firdaria_data and not firdaria_data.get('beyond_firdaria'):
-            snapshot['firdaria_major'] = firdaria_data.get('major_period')
-            snapshot['firdaria_sub'] = firdaria_data.get('sub_period')
+        snapshot['firdaria_major'] = index.period('firdaria_major', float(age))
+        snapshot['firdaria_sub'] = index.period('firdaria_sub', float(age))
 
     # Find progressions
     if timeline['progressions'] and age in timeline['progressions']:
@@ -1253,6 +1445,8 @@ def main():
     parser.add_argument('--include-progressions', action='store_true', help='Include secondary progressions')
     parser.add_argument('--include-sr', action='store_true', help='Include solar returns')
     parser.add_argument('--current-date', help='Date for current transits (YYYY-MM-DD or "today")')
+    parser.add_argument('--stage-cache', nargs='?', const='', metavar='DIR',
+                       help='Reuse unchanged stages from a cache directory (default: profiles/<name>/cache/life_arc)')
     parser.add_argument('--list-profiles', action='store_true', help='List available profiles')
 
     args = parser.parse_args()
@@ -1283,6 +1477,10 @@ def main():
         args.current_date = datetime.now().strftime('%Y-%m-%d')
 
     try:
+        stage_cache = None
+        if args.stage_cache is not None:
+            stage_cache = StageCache(args.stage_cache or load_profile(args.profile).profile_dir / 'cache' / 'life_arc')
+
         # Generate timeline
         timeline = generate_life_arc_timeline(
             args.profile,
@@ -1292,7 +1490,8 @@ def main():
             include_spirit=not args.no_spirit,
             include_progressions=args.include_progressions,
             include_solar_returns=args.include_sr,
-            current_date=args.current_date
+            current_date=args.current_date,
+            stage_cache=stage_cache
         )
 
         # Format output based on format choice
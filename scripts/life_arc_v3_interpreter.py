@@ -15,10 +15,10 @@ def load_timeline(timeline_path):
         return json.load(f)
 
 def load_seed_data(seed_path):
-    """Load seed data YAML"""
-    import yaml
-    with open(seed_path, 'r') as f:
-        return yaml.safe_load(f)
+    """Load seed data YAML (via its binary sidecar when fresh)"""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from seed_data_binary import load_seed_file
+    return load_seed_file(seed_path)
 
 def generate_process_file(timeline, seed_data, profile_name):
     """Generate technical process markdown file"""
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Natal Target Index
+Sorted index of natal aspect points (natal longitude ± aspect angle) for one or many charts.
+
+Checking a transiting planet against a natal chart the direct way compares it
+with every natal planet for every aspect type. The index instead stores every
+aspect point once, sorted by longitude, so one bisect over the window
+[longitude - orb, longitude + orb] returns every natal planet the body aspects -
+across ALL charts added to the index. Matching a sky snapshot against hundreds
+of profiles therefore costs one range query per transiting planet.
+
+query_many answers a whole array of moving-body longitudes at once (numpy
+searchsorted over the ring unrolled to -360..720°), and profile_index keeps
+one index per natal chart for the transit, progression and solar return
+aspect finders. is_applying tells applying from separating by whether the
+moving body's relative speed closes the gap to the aspect point.
+
+Usage:
+    python natal_target_index.py --profile darren --longitude 123.4 --orb 2
+    python natal_target_index.py --longitude 123.4 --orb 1      # All profiles
+"""
+
+import argparse
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+import numpy as np
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from profile_loader import load_profile, list_profiles
+
+# Constants
+ASPECT_ANGLES = {
+    'conjunction': 0,
+    'sextile': 60,
+    'square': 90,
+    'trine': 120,
+    'opposition': 180
+}
+
+
+class NatalTargetIndex:
+    """Sorted aspect points of one or more natal charts."""
+
+    def __init__(self, aspect_angles: Optional[Dict[str, float]] = None):
+        self.aspect_angles = ASPECT_ANGLES if aspect_angles is None else aspect_angles
+        self._entries = []
+        self._longitudes = []
+        self._ring = None
+        self._sorted = True
+
+    def add_chart(self, key: str, planets: List[Dict[str, Any]]):
+        """
+        Add every aspect point of a natal chart.
+
+        Args:
+            key: Chart identifier returned with each hit (e.g. profile name)
+            planets: Natal planets with 'name' and 'longitude'
+        """
+        for natal_order, planet in enumerate(planets):
+            for aspect_order, (aspect_type, angle) in enumerate(self.aspect_angles.items()):
+                # Conjunction and opposition have a single aspect point
+                offsets = {angle % 360, -angle % 360}
+                for offset in sorted(offsets):
+                    self._entries.append({
+                        'target': (planet['longitude'] + offset) % 360,
+                        'key': key,
+                        'natal_planet': planet['name'],
+                        'natal_longitude': planet['longitude'],
+                        'aspect_type': aspect_type,
+                        'order': (natal_order, aspect_order),
+                    })
+        self._sorted = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _ensure_sorted(self):
+        if not self._sorted:
+            self._entries.sort(key=lambda e: e['target'])
+            self._longitudes = [e['target'] for e in self._entries]
+            self._ring = None
+            self._sorted = True
+
+    def _range(self, low: float, high: float) -> List[Dict[str, Any]]:
+        return self._entries[bisect_left(self._longitudes, low):bisect_right(self._longitudes, high)]
+
+    def query(self, longitude: float, orb: float) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        All aspect points within orb of an ecliptic longitude.
+
+        Args:
+            longitude: Transiting (or progressed) longitude, 0-360
+            orb: Maximum distance in degrees
+
+        Returns:
+            List of (entry, orb) where entry has 'key', 'natal_planet',
+            'natal_longitude', 'aspect_type', 'target' and 'order'
+        """
+        self._ensure_sorted()
+        longitude %= 360
+        low, high = longitude - orb, longitude + orb
+
+        # The window may wrap through 0° Aries
+        candidates = self._range(max(low, 0.0), min(high, 360.0))
+        if low < 0:
+            candidates += self._range(low + 360, 360.0)
+        if high > 360:
+            candidates += self._range(0.0, high - 360)
+
+        hits = []
+        for entry in candidates:
+            distance = abs(longitude - entry['target'])
+            distance = min(distance, 360 - distance)
+            if distance <= orb:
+                hits.append((entry, distance))
+        return hits
+
+
+    def query_many(self, longitudes: Sequence[float], orb: float) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Batched query: aspect points within orb of each of many longitudes.
+
+        Args:
+            longitudes: Moving-body longitudes (any array-like, degrees)
+            orb: Maximum distance in degrees (below 180)
+
+        Returns:
+            One list of (entry, orb) per longitude, as query() returns
+        """
+        self._ensure_sorted()
+        if self._ring is None:
+            # Each target at -360, 0 and +360 so every window is one contiguous slice
+            targets = np.asarray(self._longitudes, dtype=np.float64)
+            self._ring = np.concatenate([targets - 360.0, targets, targets + 360.0])
+
+        longitudes = np.mod(np.atleast_1d(np.asarray(longitudes, dtype=np.float64)), 360.0)
+        lows = np.searchsorted(self._ring, longitudes - orb, side='left')
+        highs = np.searchsorted(self._ring, longitudes + orb, side='right')
+
+        n = len(self._entries)
+        results = []
+        for longitude, low, high in zip(longitudes.tolist(), lows.tolist(), highs.tolist()):
+            results.append([
+                (self._entries[j % n], abs(longitude - float(self._ring[j])))
+                for j in range(low, high)
+            ])
+        return results
+
+
+def is_applying(longitude: float, target: float, relative_speed: float) -> bool:
+    """
+    Whether a moving point is applying to an aspect point.
+
+    Args:
+        longitude: Moving point's longitude
+        target: Aspect point (natal longitude ± aspect angle)
+        relative_speed: Moving point's speed minus the natal point's (deg/day or deg/year)
+
+    Returns:
+        True when the motion shrinks the orb (exact or separating otherwise)
+    """
+    offset = (longitude - target + 180.0) % 360.0 - 180.0
+    return offset * relative_speed < 0
+
+
+_profile_indexes = {}
+
+
+def profile_index(
+    profile,
+    traditional_only: bool = False,
+    aspect_angles: Optional[Dict[str, float]] = None
+) -> NatalTargetIndex:
+    """
+    Index of one profile's natal planets, built once per natal chart.
+
+    Cached on the planets' names and longitudes (so edited seed data gets a
+    fresh index) and the aspect set.
+
+    Args:
+        profile: Loaded Profile
+        traditional_only: Index the seven traditional planets only
+        aspect_angles: Aspect set (default ASPECT_ANGLES)
+    """
+    planets = profile.get_planets(traditional_only=traditional_only)
+    aspect_angles = ASPECT_ANGLES if aspect_angles is None else aspect_angles
+    key = (tuple((p['name'], p['longitude']) for p in planets), tuple(aspect_angles.items()))
+
+    index = _profile_indexes.get(key)
+    if index is None:
+        index = NatalTargetIndex(aspect_angles)
+        index.add_chart(profile.name, planets)
+        _profile_indexes[key] = index
+    return index
+
+
+def build_profile_index(profile_names: List[str]) -> NatalTargetIndex:
+    """Index the natal planets of several profiles (keyed by profile name)."""
+    index = NatalTargetIndex()
+    for profile_name in profile_names:
+        profile = load_profile(profile_name)
+        index.add_chart(profile_name, profile.get_planets(traditional_only=False))
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query natal aspect points near a longitude')
+    parser.add_argument('--profile', help='Profile name (default: all profiles)')
+    parser.add_argument('--longitude', type=float, required=True, help='Ecliptic longitude (0-360)')
+    parser.add_argument('--orb', type=float, default=2.0, help='Orb in degrees (default 2°)')
+
+    args = parser.parse_args()
+
+    try:
+        profile_names = [args.profile] if args.profile else list_profiles()
+        index = build_profile_index(profile_names)
+        hits = index.query(args.longitude, args.orb)
+
+        print(f"\n{len(index)} aspect points from {len(profile_names)} profile(s)")
+        print(f"{len(hits)} within {args.orb}° of {args.longitude:.2f}°\n")
+        for entry, distance in sorted(hits, key=lambda h: h[1]):
+            print(f"  {entry['key']:15} {entry['aspect_type']:12} natal {entry['natal_planet']:10} orb {distance:.2f}°")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,21 +9,36 @@ Converts markdown synthesis files to professional PDF format with:
 - Full introduction section
 - Main report content
 
+Unchanged reports are copied from the render cache (render_cache.py) instead
+of being rendered again; --no-cache always renders.
+
 Usage:
     python scripts/pdf_generator.py input.md --seed-data profiles/Name/seed_data/seed_data.json --report-type natal
     python scripts/pdf_generator.py input.md --seed-data seed_data.json --report-type life_arc
     python scripts/pdf_generator.py input.md --seed-data seed_data.json --report-type transit_short
+    python scripts/pdf_generator.py input.md --seed-data seed_data.json --report-type natal --no-cache
 """
 
 import sys
 import argparse
+import hashlib
 import json
 import yaml
 import re
 from pathlib import Path
 from datetime import datetime
 import markdown
-from weasyprint import HTML, CSS
+from weasyprint import HTML, CSS, __version__ as WEASYPRINT_VERSION
+try:
+    from weasyprint.text.fonts import FontConfiguration  # WeasyPrint 53+
+except ImportError:
+    from weasyprint.fonts import FontConfiguration
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from seed_data_binary import open_fresh_sidecar
+from render_cache import RenderCache
+from stage_cache import file_fingerprint
 
 
 # ============================================================================
@@ -47,12 +62,27 @@ USE_CUSTOM_ZODIAC_FONT = False
 
 # ============================================================================
 
+CSS_DIR = Path(__file__).parent / 'css'
+
+# Part of every render cache key; bump when the PDF layout changes in a way
+# the source fingerprint of this file would not catch (e.g. a WeasyPrint upgrade)
+GENERATOR_VERSION = '2.0'
+
+# Report-type stylesheet, applied after base.css
+REPORT_TYPE_CSS = {
+    'natal': 'chart_based.css',
+    'life_arc': 'timeline_based.css',
+    'transit_short': 'movement_based.css',
+    'transit_long': 'movement_based.css'
+}
+
 
 def load_seed_data(seed_data_path: Path) -> dict:
     """
     Load seed data from JSON or YAML file.
 
-    Tries YAML first (common format), then JSON.
+    Uses the fresh binary sidecar of a YAML file when present, then tries
+    YAML (common format), then JSON.
 
     Args:
         seed_data_path: Path to seed_data.json or .yaml file
@@ -63,6 +93,11 @@ def load_seed_data(seed_data_path: Path) -> dict:
     if not seed_data_path.exists():
         raise FileNotFoundError(f"Seed data file not found: {seed_data_path}")
 
+    if seed_data_path.suffix in ('.yaml', '.yml'):
+        binary = open_fresh_sidecar(seed_data_path)
+        if binary is not None:
+            return binary.to_dict()
+
     with open(seed_data_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
@@ -625,44 +660,189 @@ def build_full_html_with_front_matter(md_content: str, seed_data: dict, report_t
     return full_html
 
 
-def load_css_for_report_type(report_type: str, css_dir: Path) -> list:
+def css_files_for_report_type(report_type: str, css_dir: Path) -> list:
     """
-    Load CSS files based on report type.
+    CSS files applied to a report type, in cascade order.
 
     Args:
         report_type: One of 'natal', 'life_arc', 'transit_short', 'transit_long'
         css_dir: Path to CSS directory (scripts/css/)
 
     Returns:
-        List of CSS objects to apply
+        List of existing CSS file paths (base.css first)
     """
-    css_objects = []
+    css_files = []
 
     # Always load base.css first
     base_css_path = css_dir / 'base.css'
     if base_css_path.exists():
-        css_objects.append(CSS(filename=str(base_css_path)))
+        css_files.append(base_css_path)
     else:
         print(f"⚠️  Warning: base.css not found at {base_css_path}")
 
     # Load report-type-specific CSS
-    type_css_map = {
-        'natal': 'chart_based.css',
-        'life_arc': 'timeline_based.css',
-        'transit_short': 'movement_based.css',
-        'transit_long': 'movement_based.css'
-    }
-
-    if report_type in type_css_map:
-        type_css_path = css_dir / type_css_map[report_type]
+    if report_type in REPORT_TYPE_CSS:
+        type_css_path = css_dir / REPORT_TYPE_CSS[report_type]
         if type_css_path.exists():
-            css_objects.append(CSS(filename=str(type_css_path)))
+            css_files.append(type_css_path)
         else:
-            print(f"⚠️  Warning: {type_css_map[report_type]} not found at {type_css_path}")
+            print(f"⚠️  Warning: {REPORT_TYPE_CSS[report_type]} not found at {type_css_path}")
     else:
         print(f"⚠️  Warning: Unknown report type '{report_type}', using base.css only")
 
-    return css_objects
+    return css_files
+
+
+def load_css_for_report_type(report_type: str, css_dir: Path, font_config: FontConfiguration = None) -> list:
+    """
+    Load CSS files based on report type.
+
+    Args:
+        report_type: One of 'natal', 'life_arc', 'transit_short', 'transit_long'
+        css_dir: Path to CSS directory (scripts/css/)
+        font_config: Font configuration that resolves @font-face rules
+            (pass the same one to render_pdf)
+
+    Returns:
+        List of CSS objects to apply
+    """
+    return [
+        CSS(filename=str(css_path), font_config=font_config)
+        for css_path in css_files_for_report_type(report_type, css_dir)
+    ]
+
+
+def front_matter_fields(seed_data: dict, report_type: str) -> dict:
+    """
+    The seed data the front matter pages (title page, chart overview) are built from.
+
+    Only these fields go into the render cache key, so regenerating seed data
+    (new generated_at, recalculated sections the PDF never shows) does not
+    invalidate cached reports.
+
+    Args:
+        seed_data: Seed data dictionary
+        report_type: Report type
+
+    Returns:
+        JSON-serializable dict of the fields build_title_page and
+        build_chart_overview_page read
+    """
+    metadata = seed_data.get('metadata', {})
+    chart_framework = seed_data.get('chart_framework', {})
+    fields = {
+        'birth_data': {
+            key: seed_data.get('birth_data', {}).get(key)
+            for key in ('date', 'time', 'location', 'latitude', 'longitude')
+        },
+        'profile_name': metadata.get('profile_name'),
+        'output_mode': metadata.get('output_mode'),
+        'ascendant': chart_framework.get('ascendant', {}).get('sign'),
+        'planets': [
+            {'name': p.get('name'), 'sign': p.get('sign')}
+            for p in seed_data.get('planets', []) if p.get('name') in ('Sun', 'Moon')
+        ],
+    }
+
+    if report_type == 'natal':
+        houses = seed_data.get('houses', [])
+        fields['sect'] = chart_framework.get('sect', {}).get('type')
+        fields['chart_ruler'] = houses[0].get('ruler') if houses else None
+        fields['planets'] = [
+            {
+                'name': p.get('name'),
+                'sign': p.get('sign'),
+                'house': p.get('house'),
+                'angular': p.get('dignities', {}).get('accidental', {}).get('angular'),
+                'domicile': p.get('dignities', {}).get('essential', {}).get('domicile'),
+                'exaltation': p.get('dignities', {}).get('essential', {}).get('exaltation'),
+            }
+            for p in seed_data.get('planets', [])
+        ]
+        fields['stelliums'] = seed_data.get('stelliums', [])
+        fields['aspects'] = [
+            [a.get('planet_1'), a.get('planet_2'), a.get('aspect_type'), a.get('orb')]
+            for a in seed_data.get('aspects', [])
+            if a.get('orb', 99) < 3.0 and a.get('traditional', False)
+        ]
+    elif report_type == 'life_arc':
+        fields['life_arc_data'] = metadata.get('life_arc_data')
+        fields['progression_themes'] = metadata.get('progression_themes')
+
+    return fields
+
+
+def render_cache_key(md_content: str, seed_data: dict, report_type: str, title: str, css_files: list) -> str:
+    """
+    Content address of a rendered report.
+
+    Covers the markdown, the front matter seed fields, title and report
+    type, the CSS file contents, the generator (version, this file's source,
+    WeasyPrint version) and the render date - the title page prints the
+    generation date and the life arc overview the current age, so a cached
+    PDF is reused only on the day it was made.
+
+    Args:
+        md_content: Raw markdown content
+        seed_data: Seed data dictionary
+        report_type: Report type
+        title: Document title for PDF metadata
+        css_files: Stylesheet paths from css_files_for_report_type
+    """
+    return RenderCache.key({
+        'markdown': hashlib.sha256(md_content.encode('utf-8')).hexdigest(),
+        'front_matter': front_matter_fields(seed_data, report_type),
+        'report_type': report_type,
+        'title': title,
+        'css': [[Path(path).name, file_fingerprint(path)] for path in css_files],
+        'generator': [GENERATOR_VERSION, file_fingerprint(__file__), WEASYPRINT_VERSION],
+        'render_date': datetime.now().strftime('%Y-%m-%d'),
+    })
+
+
+def render_pdf(
+    md_content: str,
+    seed_data: dict,
+    report_type: str,
+    title: str,
+    pdf_path,
+    css_objects: list,
+    font_config: FontConfiguration = None,
+    cache: RenderCache = None,
+    cache_key: str = None
+):
+    """
+    Render markdown plus front matter to a PDF with already-parsed stylesheets.
+
+    Args:
+        md_content: Raw markdown content
+        seed_data: Seed data dictionary
+        report_type: Report type
+        title: Document title for PDF metadata
+        pdf_path: Output PDF path (None returns the PDF as bytes)
+        css_objects: Stylesheets from load_css_for_report_type
+        font_config: The font configuration the stylesheets were parsed with
+        cache: Render cache to store the PDF and HTML in (optional)
+        cache_key: Key from render_cache_key (required with cache)
+
+    Returns:
+        Path to generated PDF, or the PDF bytes when pdf_path is None
+    """
+    # Build complete HTML with front matter
+    full_html = build_full_html_with_front_matter(md_content, seed_data, report_type, title)
+
+    # Generate PDF using external CSS files
+    pdf_bytes = HTML(string=full_html).write_pdf(
+        str(pdf_path) if pdf_path is not None else None,
+        stylesheets=css_objects,
+        font_config=font_config
+    )
+    rendered = Path(pdf_path) if pdf_path is not None else pdf_bytes
+
+    if cache is not None and cache_key is not None:
+        cache.store(cache_key, rendered, full_html)
+
+    return rendered
 
 
 def markdown_to_pdf(
@@ -670,17 +850,22 @@ def markdown_to_pdf(
     pdf_path: str = None,
     seed_data_path: str = None,
     title: str = "Astrology Report",
-    report_type: str = "natal"
+    report_type: str = "natal",
+    use_cache: bool = True
 ) -> str:
     """
     Convert markdown file to professional PDF with front matter.
 
+    Unchanged reports (same markdown, front matter fields, CSS and generator)
+    are copied from the render cache instead of being rendered again.
+
     Args:
         markdown_path: Path to markdown file
         pdf_path: Output PDF path (defaults to same name with .pdf extension)
         seed_data_path: Path to seed_data.json or .yaml file (REQUIRED for front matter)
         title: Document title for PDF metadata
         report_type: Report type ('natal', 'life_arc', 'transit_short', 'transit_long')
+        use_cache: Reuse and fill the render cache (render_cache.py)
 
     Returns:
         Path to generated PDF
@@ -702,28 +887,30 @@ def markdown_to_pdf(
 
     seed_data = load_seed_data(Path(seed_data_path))
 
-    # Determine CSS directory (scripts/css/ relative to this file)
-    script_dir = Path(__file__).parent
-    css_dir = script_dir / 'css'
+    # CSS files (scripts/css/) based on report type
+    css_files = css_files_for_report_type(report_type, CSS_DIR)
 
-    # Load CSS files based on report type
-    css_objects = load_css_for_report_type(report_type, css_dir)
-
-    if not css_objects:
-        raise FileNotFoundError(f"No CSS files found in {css_dir}")
+    if not css_files:
+        raise FileNotFoundError(f"No CSS files found in {CSS_DIR}")
 
     # Read markdown content
     with open(markdown_path, 'r', encoding='utf-8') as f:
         md_content = f.read()
 
-    # Build complete HTML with front matter
-    full_html = build_full_html_with_front_matter(md_content, seed_data, report_type, title)
+    cache = RenderCache() if use_cache else None
+    cache_key = None
+    if cache is not None:
+        cache_key = render_cache_key(md_content, seed_data, report_type, title, css_files)
+        if cache.fetch(cache_key, pdf_path) is not None:
+            print(f"✅ PDF generated (unchanged, from render cache): {pdf_path}")
+            print(f"   Size: {pdf_path.stat().st_size / 1024:.1f} KB")
+            return str(pdf_path)
 
-    # Generate PDF using external CSS files
-    HTML(string=full_html).write_pdf(
-        pdf_path,
-        stylesheets=css_objects
-    )
+    font_config = FontConfiguration()
+    css_objects = [CSS(filename=str(path), font_config=font_config) for path in css_files]
+
+    render_pdf(md_content, seed_data, report_type, title, pdf_path, css_objects, font_config,
+               cache=cache, cache_key=cache_key)
 
     print(f"✅ PDF generated: {pdf_path}")
     print(f"   Report type: {report_type}")
@@ -764,6 +951,12 @@ def main():
         help='Report type determines CSS styling and front matter (default: natal)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always render (do not read or fill the render cache)'
+    )
+
     args = parser.parse_args()
 
     try:
@@ -772,7 +965,8 @@ def main():
             args.pdf_file,
             args.seed_data,
             args.title,
-            args.report_type
+            args.report_type,
+            use_cache=not args.no_cache
         )
         print(f"\n✨ Success! PDF ready at: {pdf_path}")
 
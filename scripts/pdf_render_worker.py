@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+PDF Render Worker
+Persistent PDF renderer that keeps WeasyPrint, parsed CSS and fonts warm between reports.
+
+pdf_generator.markdown_to_pdf pays WeasyPrint's import, the CSS parse of
+base.css plus the report-type stylesheet, and font setup on every call,
+which dominates small reports. PdfRenderer keeps one FontConfiguration and
+the parsed stylesheets per report type (re-parsed only when a CSS file
+changes on disk) and caches loaded seed data by file modification time.
+Unchanged reports come straight from the render cache (render_cache.py)
+unless it is turned off (--no-cache).
+
+Use PdfRenderer directly for in-process batches, or run it as a local
+server (--serve) and send batches of jobs over a socket from any process.
+Jobs are rendered one at a time (WeasyPrint is not thread-safe).
+
+The server listens on a Unix socket in ~/.astrology_pdf_worker/ (directory
+0700, socket 0600). Requests are authenticated with PDF_WORKER_AUTHKEY when
+set, otherwise with a random key the server writes to
+~/.astrology_pdf_worker/authkey (0600) on first start; clients of the same
+user read it from there. Relative paths in jobs are resolved by the client.
+
+Job (dict or JSON object):
+    markdown:      Markdown file path (or markdown_text: the content itself)
+    seed_data:     Seed data path (.yaml/.json) or an already-loaded dict
+    report_type:   natal | life_arc | transit_short | transit_long (default natal)
+    title:         PDF title (default 'Astrology Report')
+    output:        PDF path (default: markdown path with .pdf; without either,
+                   the result carries the PDF bytes as 'pdf')
+
+Usage:
+    python pdf_render_worker.py --serve
+    python pdf_render_worker.py --jobs jobs.json              # Uses the server if running
+    python pdf_render_worker.py --jobs jobs.json --in-process
+    python pdf_render_worker.py --jobs jobs.json --no-cache    # Render even unchanged reports
+    python pdf_render_worker.py --ping
+    python pdf_render_worker.py --shutdown
+"""
+
+import argparse
+import json
+import os
+import secrets
+import sys
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from pdf_generator import (
+    CSS_DIR,
+    FontConfiguration,
+    css_files_for_report_type,
+    load_css_for_report_type,
+    load_seed_data,
+    render_cache_key,
+    render_pdf,
+)
+from render_cache import RenderCache
+
+# Constants
+WORKER_DIR = Path.home() / '.astrology_pdf_worker'
+DEFAULT_ADDRESS = str(WORKER_DIR / 'worker.sock')
+AUTHKEY_FILE = WORKER_DIR / 'authkey'
+PATH_FIELDS = ('markdown', 'output', 'seed_data')
+
+
+class PdfRenderer:
+    """WeasyPrint renderer with warm stylesheets, fonts and seed data."""
+
+    def __init__(self, css_dir: Path = CSS_DIR, cache: Optional[RenderCache] = None):
+        """
+        Args:
+            css_dir: Directory holding base.css and the report-type stylesheets
+            cache: Render cache for unchanged reports (None renders every job)
+        """
+        self.css_dir = Path(css_dir)
+        self.cache = cache
+        self.font_config = FontConfiguration()
+        self._stylesheets = {}
+        self._seed_data = {}
+
+    def stylesheets(self, report_type: str) -> Tuple[list, bool]:
+        """
+        Parsed stylesheets for a report type.
+
+        Returns:
+            (css_objects, warm) where warm is False when they were just parsed
+        """
+        css_files = css_files_for_report_type(report_type, self.css_dir)
+        signature = tuple((str(path), path.stat().st_mtime_ns) for path in css_files)
+
+        cached = self._stylesheets.get(report_type)
+        if cached is not None and cached[0] == signature:
+            return cached[1], True
+
+        if cached is not None:
+            # A stylesheet changed: start from a clean font configuration so
+            # stale @font-face rules do not linger, and re-parse everything
+            self.font_config = FontConfiguration()
+            self._stylesheets.clear()
+
+        css_objects = load_css_for_report_type(report_type, self.css_dir, self.font_config)
+        if not css_objects:
+            raise FileNotFoundError(f"No CSS files found in {self.css_dir}")
+        self._stylesheets[report_type] = (signature, css_objects)
+        return css_objects, False
+
+    @property
+    def warm_report_types(self) -> List[str]:
+        """Report types whose stylesheets are parsed and ready."""
+        return sorted(self._stylesheets)
+
+    def seed_data(self, source: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+        """Seed data from a dict, or from a file (cached until the file changes)."""
+        if isinstance(source, dict):
+            return source
+
+        path = Path(source)
+        mtime = path.stat().st_mtime_ns
+        cached = self._seed_data.get(str(path))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        seed_data = load_seed_data(path)
+        self._seed_data[str(path)] = (mtime, seed_data)
+        return seed_data
+
+    def render(self, job: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Render one job.
+
+        Args:
+            job: Render job
+            use_cache: Look up and store the result in the render cache
+
+        Returns:
+            {'output', 'report_type', 'warm', 'cached', 'seconds', 'size_kb', 'error'}
+            plus 'pdf' (bytes) for jobs without an output path
+        """
+        started = time.perf_counter()
+        report_type = job.get('report_type', 'natal')
+        result = {'output': None, 'report_type': report_type, 'warm': None, 'cached': False,
+                  'size_kb': None, 'error': None}
+
+        try:
+            if 'markdown_text' in job:
+                md_content = job['markdown_text']
+                output = job.get('output')
+            else:
+                markdown_path = Path(job['markdown'])
+                output = job.get('output') or markdown_path.with_suffix('.pdf')
+                result['output'] = str(output)
+                with open(markdown_path, 'r', encoding='utf-8') as f:
+                    md_content = f.read()
+
+            if job.get('seed_data') is None:
+                raise ValueError("seed_data is required for front matter generation")
+            seed_data = self.seed_data(job['seed_data'])
+            title = job.get('title', 'Astrology Report')
+
+            rendered = None
+            cache = self.cache if use_cache else None
+            cache_key = None
+            if cache is not None:
+                css_files = css_files_for_report_type(report_type, self.css_dir)
+                cache_key = render_cache_key(md_content, seed_data, report_type, title, css_files)
+                rendered = cache.fetch(cache_key, output)
+                result['cached'] = rendered is not None
+
+            if rendered is None:
+                css_objects, result['warm'] = self.stylesheets(report_type)
+                rendered = render_pdf(
+                    md_content, seed_data, report_type, title,
+                    output, css_objects, self.font_config,
+                    cache=cache, cache_key=cache_key
+                )
+            if output is None:
+                result['pdf'] = rendered
+                result['size_kb'] = round(len(rendered) / 1024, 1)
+            else:
+                result['output'] = str(rendered)
+                result['size_kb'] = round(rendered.stat().st_size / 1024, 1)
+
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+
+        result['seconds'] = time.perf_counter() - started
+        return result
+
+    def render_batch(self, jobs: List[Dict[str, Any]], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Render jobs in order.
+
+        Args:
+            jobs: Render jobs
+            use_cache: False renders every job, even unchanged ones
+
+        Returns:
+            {'results': [...], 'wall_seconds': float}
+        """
+        started = time.perf_counter()
+        results = [self.render(job, use_cache) for job in jobs]
+        return {'results': results, 'wall_seconds': time.perf_counter() - started}
+
+
+def parse_address(address: str) -> Union[str, Tuple[str, int]]:
+    """'host:port' to a TCP address; anything else is a Unix socket path."""
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def _private_dir(path: Path):
+    """Create a directory only the current user can enter."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    os.chmod(path, 0o700)
+
+
+def load_authkey(create: bool = False) -> bytes:
+    """
+    The worker's authentication key.
+
+    PDF_WORKER_AUTHKEY wins when set. Otherwise the key lives in AUTHKEY_FILE
+    (mode 0600); with create=True (the server) a random key is written there
+    if none exists yet.
+
+    Raises:
+        FileNotFoundError: No key configured and create is False
+    """
+    key = os.environ.get('PDF_WORKER_AUTHKEY')
+    if key:
+        return key.encode()
+
+    if not AUTHKEY_FILE.exists():
+        if not create:
+            raise FileNotFoundError(f"No worker key at {AUTHKEY_FILE} (is the worker running?)")
+        _private_dir(AUTHKEY_FILE.parent)
+        fd = os.open(AUTHKEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(secrets.token_hex(32))
+
+    return AUTHKEY_FILE.read_text().strip().encode()
+
+
+def _open_listener(address: str, authkey: bytes) -> Listener:
+    """Listener on a TCP address, or on a Unix socket only the current user can connect to."""
+    parsed = parse_address(address)
+    if isinstance(parsed, tuple):
+        return Listener(parsed, authkey=authkey)
+
+    socket_path = Path(parsed)
+    _private_dir(socket_path.parent)
+    if socket_path.exists():
+        # Left behind by a worker that did not shut down cleanly
+        try:
+            send_request({'command': 'ping'}, address)
+            raise RuntimeError(f"A worker is already listening on {address}")
+        except (ConnectionRefusedError, FileNotFoundError, OSError, EOFError, AuthenticationError):
+            socket_path.unlink(missing_ok=True)
+
+    old_umask = os.umask(0o177)
+    try:
+        listener = Listener(str(socket_path), family='AF_UNIX', authkey=authkey)
+    finally:
+        os.umask(old_umask)
+    os.chmod(socket_path, 0o600)
+    return listener
+
+
+def handle_request(renderer: PdfRenderer, request: Any) -> Tuple[Dict[str, Any], bool]:
+    """
+    Answer one request.
+
+    Returns:
+        (reply, stop) - stop is True for a shutdown request
+    """
+    if not isinstance(request, dict):
+        return {'error': f"Bad request: expected a dict, got {type(request).__name__}"}, False
+
+    command = request.get('command')
+    if command == 'render':
+        jobs = request.get('jobs', [])
+        if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+            return {'error': "Bad request: 'jobs' must be a list of dicts"}, False
+        use_cache = request.get('use_cache', True)
+        if not isinstance(use_cache, bool):
+            return {'error': "Bad request: 'use_cache' must be true or false"}, False
+        return renderer.render_batch(jobs, use_cache), False
+    if command == 'ping':
+        return {'status': 'ok', 'pid': os.getpid(), 'warm_report_types': renderer.warm_report_types}, False
+    if command == 'shutdown':
+        return {'status': 'stopping'}, True
+    return {'error': f"Unknown command: {command}"}, False
+
+
+def serve(address: str = DEFAULT_ADDRESS, renderer: Optional[PdfRenderer] = None):
+    """
+    Run the render worker until a shutdown request arrives.
+
+    Requests are dicts: {'command': 'render', 'jobs': [...], 'use_cache': bool},
+    {'command': 'ping'} or {'command': 'shutdown'}. Malformed requests get
+    an error reply; unauthenticated or broken connections are dropped.
+    """
+    renderer = renderer or PdfRenderer(cache=RenderCache())
+    listener = _open_listener(address, load_authkey(create=True))
+    print(f"PDF render worker listening on {address}")
+    try:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, OSError, EOFError):
+                continue
+
+            with conn:
+                try:
+                    request = conn.recv()
+                except Exception:
+                    continue
+                try:
+                    reply, stop = handle_request(renderer, request)
+                except Exception as e:
+                    reply, stop = {'error': f"{type(e).__name__}: {e}"}, False
+                try:
+                    conn.send(reply)
+                except OSError:
+                    pass
+                if stop:
+                    return
+    finally:
+        listener.close()
+
+
+def send_request(request: Dict[str, Any], address: str = DEFAULT_ADDRESS) -> Dict[str, Any]:
+    """Send one request to a running worker and return its reply."""
+    with Client(parse_address(address), authkey=load_authkey()) as conn:
+        conn.send(request)
+        return conn.recv()
+
+
+def resolve_job_paths(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a job with its file paths made absolute (relative to this process's directory)."""
+    resolved = dict(job)
+    for field in PATH_FIELDS:
+        value = resolved.get(field)
+        if isinstance(value, (str, Path)):
+            resolved[field] = str(Path(value).expanduser().resolve())
+    return resolved
+
+
+def render_jobs(
+    jobs: List[Dict[str, Any]],
+    address: Optional[str] = DEFAULT_ADDRESS,
+    renderer: Optional[PdfRenderer] = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Render a batch on the running worker, or in-process when none is reachable.
+
+    Args:
+        jobs: Render jobs
+        address: Worker address (None renders in-process)
+        renderer: In-process renderer to reuse across calls
+        use_cache: False renders every job, on the worker too
+
+    Returns:
+        {'results': [...], 'wall_seconds': float, 'worker': 'remote' | 'in-process'}
+    """
+    jobs = [resolve_job_paths(job) for job in jobs]
+
+    if address is not None:
+        try:
+            batch = send_request({'command': 'render', 'jobs': jobs, 'use_cache': use_cache}, address)
+            if 'error' in batch:
+                raise RuntimeError(f"Worker rejected the batch: {batch['error']}")
+            batch['worker'] = 'remote'
+            return batch
+        except (ConnectionRefusedError, FileNotFoundError):
+            pass
+
+    batch = (renderer or PdfRenderer(cache=RenderCache())).render_batch(jobs, use_cache)
+    batch['worker'] = 'in-process'
+    return batch
+
+
+def format_batch_summary(batch: Dict[str, Any]) -> str:
+    """Format per-job timing and failures for display."""
+    output = []
+    output.append(f"\n{'='*80}")
+    output.append(f"PDF RENDER BATCH ({batch['worker']})")
+    output.append(f"{'='*80}")
+
+    for result in batch['results']:
+        if result['error']:
+            status = "FAILED"
+        elif result['cached']:
+            status = "cached"
+        else:
+            status = "warm" if result['warm'] else "cold"
+        target = result['output'] or ('-' if result['error'] else '(bytes)')
+        output.append(f"{result['report_type']:14} {result['seconds']:7.2f}s  {status:6}  {target}")
+
+    failed = [r for r in batch['results'] if r['error']]
+    output.append(f"\nJobs: {len(batch['results'])}  Wall time: {batch['wall_seconds']:.2f}s")
+    if failed:
+        output.append(f"\n❌ {len(failed)} job(s) failed:")
+        for result in failed:
+            output.append(f"   {result['output'] or result['report_type']}: {result['error']}")
+
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm PDF render worker')
+    parser.add_argument('--serve', action='store_true', help='Run the worker in the foreground')
+    parser.add_argument('--jobs', help='JSON file with a list of render jobs')
+    parser.add_argument('--in-process', action='store_true', help='Render --jobs here instead of on the worker')
+    parser.add_argument('--ping', action='store_true', help='Check that the worker is running')
+    parser.add_argument('--shutdown', action='store_true', help='Stop the worker')
+    parser.add_argument('--no-cache', action='store_true', help='Render every job (skip the render cache)')
+    parser.add_argument('--address', default=DEFAULT_ADDRESS,
+                        help=f'Unix socket path or host:port (default {DEFAULT_ADDRESS})')
+
+    args = parser.parse_args()
+
+    try:
+        cache = None if args.no_cache else RenderCache()
+        if args.serve:
+            serve(args.address, PdfRenderer(cache=cache))
+        elif args.ping or args.shutdown:
+            reply = send_request({'command': 'ping' if args.ping else 'shutdown'}, args.address)
+            print(json.dumps(reply, indent=2))
+        elif args.jobs:
+            with open(args.jobs, 'r', encoding='utf-8') as f:
+                jobs = json.load(f)
+            batch = render_jobs(jobs, None if args.in_process else args.address, PdfRenderer(cache=cache),
+                                use_cache=not args.no_cache)
+            print(format_batch_summary(batch))
+            if any(r['error'] for r in batch['results']):
+                sys.exit(1)
+        else:
+            parser.error("one of --serve, --jobs, --ping or --shutdown is required")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,28 @@
 """
 Profile Loader Utility
 Manages loading and accessing astrology profiles.
+
+load_profile() serves profiles from a process-wide LRU cache, so the many
+calculators that call it for the same profile share one parsed
+master_seed_data.yaml. Entries are keyed on the seed file's mtime and size and
+reload automatically when the file changes; seed_data_generator also calls
+invalidate() after writing. Cached seed data is shared - treat it as read-only.
+
+When a fresh master_seed_data.bin sidecar exists (see seed_data_binary.py),
+the get_* accessors decode only the section they need instead of parsing
+the whole YAML.
 """
 
-import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from seed_data_binary import open_fresh_sidecar, load_seed_file
+
+# Maximum number of profiles kept in the process-wide cache
+MAX_CACHED_PROFILES = 64
+
+_profile_cache = OrderedDict()
+_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
 
 
 class Profile:
@@ -25,15 +42,29 @@ class Profile:
         # Load seed data if available
         self.seed_data_path = self.seed_data_dir / "master_seed_data.yaml"
         self._seed_data = None
+        self._binary = None
+        self._binary_checked = False
 
     @property
     def seed_data(self) -> Optional[Dict[str, Any]]:
         """Load and cache seed data."""
         if self._seed_data is None and self.seed_data_path.exists():
-            with open(self.seed_data_path, 'r') as f:
-                self._seed_data = yaml.safe_load(f)
+            self._seed_data = load_seed_file(self.seed_data_path)
         return self._seed_data
 
+    def _get_section(self, name: str, default: Any = None) -> Any:
+        """One top-level section, decoded alone from the binary sidecar when fresh."""
+        if self._seed_data is None and not self._binary_checked:
+            self._binary_checked = True
+            if self.seed_data_path.exists():
+                self._binary = open_fresh_sidecar(self.seed_data_path)
+
+        if self._seed_data is None and self._binary is not None:
+            return self._binary.get_section(name, default)
+        if self.seed_data:
+            return self.seed_data.get(name, default)
+        return default
+
     def get_seed_data_path(self, filename: str = "master_seed_data.yaml") -> Path:
         """Get path to seed data file."""
         return self.seed_data_dir / filename
@@ -44,63 +75,45 @@ class Profile:
 
     def get_birth_data(self) -> Optional[Dict[str, Any]]:
         """Get birth data from seed data."""
-        if self.seed_data:
-            return self.seed_data.get('birth_data')
-        return None
+        return self._get_section('birth_data')
 
     def get_chart_framework(self) -> Optional[Dict[str, Any]]:
         """Get chart framework (ascendant, MC, sect, etc.)."""
-        if self.seed_data:
-            return self.seed_data.get('chart_framework')
-        return None
+        return self._get_section('chart_framework')
 
     def get_planets(self, traditional_only: bool = False) -> List[Dict[str, Any]]:
         """Get planet data, optionally filtered to traditional planets only."""
-        if self.seed_data:
-            planets = self.seed_data.get('planets', [])
-            if traditional_only:
-                return [p for p in planets if p.get('traditional', False)]
-            return planets
-        return []
+        planets = self._get_section('planets', [])
+        if traditional_only:
+            return [p for p in planets if p.get('traditional', False)]
+        return planets
 
     def get_houses(self) -> List[Dict[str, Any]]:
         """Get house data with rulers."""
-        if self.seed_data:
-            return self.seed_data.get('houses', [])
-        return []
+        return self._get_section('houses', [])
 
     def get_aspects(self, traditional_only: bool = False) -> List[Dict[str, Any]]:
         """Get aspect data, optionally filtered to traditional aspects only."""
-        if self.seed_data:
-            aspects = self.seed_data.get('aspects', [])
-            if traditional_only:
-                return [a for a in aspects if a.get('traditional', False)]
-            return aspects
-        return []
+        aspects = self._get_section('aspects', [])
+        if traditional_only:
+            return [a for a in aspects if a.get('traditional', False)]
+        return aspects
 
     def get_lots(self) -> List[Dict[str, Any]]:
         """Get Hermetic lots data."""
-        if self.seed_data:
-            return self.seed_data.get('lots', [])
-        return []
+        return self._get_section('lots', [])
 
     def get_nodes(self) -> Optional[Dict[str, Any]]:
         """Get lunar nodes data."""
-        if self.seed_data:
-            return self.seed_data.get('lunar_nodes')
-        return None
+        return self._get_section('lunar_nodes')
 
     def get_elemental_balance(self) -> Optional[Dict[str, int]]:
         """Get elemental balance counts."""
-        if self.seed_data:
-            return self.seed_data.get('elemental_balance')
-        return None
+        return self._get_section('elemental_balance')
 
     def get_modality_balance(self) -> Optional[Dict[str, int]]:
         """Get modality balance counts."""
-        if self.seed_data:
-            return self.seed_data.get('modality_balance')
-        return None
+        return self._get_section('modality_balance')
 
     def __repr__(self):
         return f"Profile(name='{self.name}', dir='{self.profile_dir}')"
@@ -122,9 +135,58 @@ def list_profiles(base_dir: str = "profiles") -> List[str]:
     return sorted(profile_names)
 
 
+def _seed_file_stamp(seed_path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a seed data file, or None if it does not exist."""
+    try:
+        stat = seed_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def load_profile(name: str, base_dir: str = "profiles") -> Profile:
-    """Load a profile by name."""
-    return Profile(name, base_dir)
+    """
+    Load a profile by name.
+
+    Returns the cached Profile when its master_seed_data.yaml is unchanged
+    (same mtime and size); otherwise loads it fresh and caches it, evicting
+    the least recently used profile beyond MAX_CACHED_PROFILES.
+    """
+    key = (name, str(Path(base_dir).resolve()))
+    stamp = _seed_file_stamp(Path(base_dir) / name / "seed_data" / "master_seed_data.yaml")
+
+    cached = _profile_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        _profile_cache.move_to_end(key)
+        _cache_stats['hits'] += 1
+        return cached[1]
+
+    _cache_stats['misses'] += 1
+    profile = Profile(name, base_dir)
+    _profile_cache[key] = (stamp, profile)
+    _profile_cache.move_to_end(key)
+
+    while len(_profile_cache) > MAX_CACHED_PROFILES:
+        _profile_cache.popitem(last=False)
+        _cache_stats['evictions'] += 1
+
+    return profile
+
+
+def invalidate(name: Optional[str] = None):
+    """
+    Drop cached profiles so the next load_profile() re-reads the seed data.
+
+    Args:
+        name: Profile to drop (from every base directory), or None for all
+    """
+    for key in [k for k in _profile_cache if name is None or k[0] == name]:
+        del _profile_cache[key]
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Profile cache counters: hits, misses, evictions and current size."""
+    return dict(_cache_stats, size=len(_profile_cache), max_size=MAX_CACHED_PROFILES)
 
 
 def get_default_profile(base_dir: str = "profiles") -> Optional[Profile]:
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Progressed Ephemeris
+Per-profile table of secondary progressed positions, sampled hourly and interpolated for any age.
+
+Secondary progressions map age to birth_jd + age days, so a whole life of
+progressions is only ~100 days of ephemeris. This module samples the
+traditional planets over those days once per profile at one-hour steps
+(about two weeks of age per row), writes the table to
+profiles/<name>/cache/progressed_ephemeris.bin and memory maps it on later
+runs. Positions for any fractional age come from cubic Hermite interpolation
+on longitude and speed, which reproduces the ephemeris to well below an
+arcsecond (rows on whole hours, e.g. integer ages, are returned exactly).
+
+The table is rebuilt automatically when the birth moment changes.
+
+File layout (little-endian):
+    Header:  magic 'PROGEPH1', version, row count, birth_jd, jd_end
+    Records: PROGRESSED_DTYPE rows at birth_jd + k / 24
+
+Usage:
+    python progressed_ephemeris.py --profile darren --build
+    python progressed_ephemeris.py --profile darren --age 36.5
+"""
+
+import argparse
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Any, Optional, Sequence, Union
+import numpy as np
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from ephemeris_sampler import sample_positions, format_samples
+
+# Constants
+TRADITIONAL_PLANETS = [swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN]
+PLANET_NAMES = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn']
+
+ROWS_PER_DAY = 24       # Hourly in ephemeris time = ~15 days of age per row
+MAX_AGE = 120           # Years of life covered by the table
+CACHE_FILENAME = 'progressed_ephemeris.bin'
+
+MAGIC = b'PROGEPH1'
+VERSION = 1
+HEADER_FORMAT = '<8sIIdd'
+
+PROGRESSED_DTYPE = np.dtype([
+    ('longitude', '<f8', (len(TRADITIONAL_PLANETS),)),
+    ('latitude', '<f8', (len(TRADITIONAL_PLANETS),)),
+    ('speed', '<f8', (len(TRADITIONAL_PLANETS),)),   # deg/day of ephemeris = deg/year of age
+])
+
+_ephemerides = {}
+
+
+def calculate_progressed_table(birth_jd: float, max_age: int = MAX_AGE) -> np.ndarray:
+    """
+    Sample the traditional planets from birth to birth + max_age days.
+
+    Args:
+        birth_jd: Julian Day of birth (UT)
+        max_age: Last covered age in years
+
+    Returns:
+        PROGRESSED_DTYPE rows, one per hour of ephemeris time
+    """
+    jds = birth_jd + np.arange(max_age * ROWS_PER_DAY + 1) / ROWS_PER_DAY
+    samples = sample_positions(TRADITIONAL_PLANETS, jds)
+
+    table = np.empty(len(jds), dtype=PROGRESSED_DTYPE)
+    table['longitude'] = samples['longitude']
+    table['latitude'] = samples['latitude']
+    table['speed'] = samples['speed']
+    return table
+
+
+def build_progressed_ephemeris(
+    birth_jd: float,
+    path: Union[str, Path],
+    max_age: int = MAX_AGE
+) -> 'ProgressedEphemeris':
+    """
+    Sample a progressed ephemeris and write it to disk.
+
+    Args:
+        birth_jd: Julian Day of birth (UT)
+        path: Output file
+        max_age: Last covered age in years
+
+    Returns:
+        ProgressedEphemeris over the written file
+    """
+    table = calculate_progressed_table(birth_jd, max_age)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(table), birth_jd, birth_jd + max_age))
+        f.write(table.tobytes())
+    temp_path.replace(path)
+
+    return ProgressedEphemeris.load(path)
+
+
+class ProgressedEphemeris:
+    """Hourly progressed positions for one birth moment (memory-mapped, or built in memory)."""
+
+    def __init__(self, table: np.ndarray, birth_jd: float, path: Optional[Path] = None):
+        """
+        Args:
+            table: PROGRESSED_DTYPE rows at birth_jd + k / ROWS_PER_DAY
+            birth_jd: Julian Day of birth (UT)
+            path: Backing file, if any
+        """
+        self.table = table
+        self.birth_jd = birth_jd
+        self.path = path
+        self.max_age = (len(table) - 1) / ROWS_PER_DAY
+        self._longitude = np.asarray(table['longitude'])
+        self._latitude = np.asarray(table['latitude'])
+        self._speed = np.asarray(table['speed'])
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ProgressedEphemeris':
+        """Memory-map a table written by build_progressed_ephemeris."""
+        path = Path(path)
+        with open(path, 'rb') as f:
+            header = f.read(struct.calcsize(HEADER_FORMAT))
+        magic, version, count, birth_jd, _ = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a progressed ephemeris file: {path}")
+
+        table = np.memmap(path, dtype=PROGRESSED_DTYPE, mode='r',
+                          offset=struct.calcsize(HEADER_FORMAT), shape=(count,))
+        return cls(table, birth_jd, path)
+
+    @classmethod
+    def for_birth(cls, birth_jd: float, max_age: int = MAX_AGE) -> 'ProgressedEphemeris':
+        """Table sampled in memory (not written to disk)."""
+        return cls(calculate_progressed_table(birth_jd, max_age), birth_jd)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def sample(self, ages: Union[float, Sequence[float], np.ndarray]) -> Dict[str, Any]:
+        """
+        Progressed positions at any ages.
+
+        Ages inside the table are Hermite-interpolated; ages outside it
+        (before birth or past max_age) fall back to sample_positions.
+
+        Args:
+            ages: Ages in years (fractional allowed)
+
+        Returns:
+            Same layout as ephemeris_sampler.sample_positions, with
+            'jd' = birth_jd + ages
+        """
+        ages = np.atleast_1d(np.asarray(ages, dtype=np.float64))
+        n_bodies = len(TRADITIONAL_PLANETS)
+        longitude = np.empty((len(ages), n_bodies))
+        latitude = np.empty((len(ages), n_bodies))
+        speed = np.empty((len(ages), n_bodies))
+
+        inside = (ages >= 0) & (ages <= self.max_age)
+        if inside.any():
+            x = ages[inside] * ROWS_PER_DAY
+            i = np.minimum(np.floor(x).astype(np.int64), len(self.table) - 2)
+            t = (x - i)[:, None]
+            h = 1.0 / ROWS_PER_DAY
+
+            p0 = self._longitude[i]
+            p1 = self._longitude[i + 1]
+            delta = (p1 - p0 + 180.0) % 360.0 - 180.0
+            v0 = self._speed[i]
+            v1 = self._speed[i + 1]
+
+            # Cubic Hermite on the unwrapped longitude
+            t2 = t * t
+            t3 = t2 * t
+            longitude[inside] = (
+                p0
+                + (t3 - 2 * t2 + t) * v0 * h
+                + (-2 * t3 + 3 * t2) * delta
+                + (t3 - t2) * v1 * h
+            ) % 360.0
+            speed[inside] = v0 + (v1 - v0) * t
+            latitude[inside] = self._latitude[i] + (self._latitude[i + 1] - self._latitude[i]) * t
+
+        if not inside.all():
+            outside = sample_positions(TRADITIONAL_PLANETS, self.birth_jd + ages[~inside])
+            longitude[~inside] = outside['longitude']
+            latitude[~inside] = outside['latitude']
+            speed[~inside] = outside['speed']
+
+        return {
+            'jd': self.birth_jd + ages,
+            'bodies': list(TRADITIONAL_PLANETS),
+            'longitude': longitude,
+            'latitude': latitude,
+            'speed': speed,
+        }
+
+
+def get_progressed_ephemeris(
+    profile_dir: Union[str, Path],
+    birth_jd: float,
+    max_age: int = MAX_AGE
+) -> ProgressedEphemeris:
+    """
+    Progressed ephemeris for a profile, built on first use.
+
+    Loads profiles/<name>/cache/progressed_ephemeris.bin when it matches
+    the birth moment and span, otherwise (re)builds it. Falls back to an
+    in-memory table when the cache directory is not writable. Tables are
+    kept for the life of the process.
+
+    Args:
+        profile_dir: Profile directory (Profile.profile_dir)
+        birth_jd: Julian Day of birth (UT)
+        max_age: Last covered age in years
+    """
+    path = Path(profile_dir) / 'cache' / CACHE_FILENAME
+    key = (str(path), birth_jd, max_age)
+    ephemeris = _ephemerides.get(key)
+    if ephemeris is not None:
+        return ephemeris
+
+    ephemeris = None
+    if path.exists():
+        try:
+            ephemeris = ProgressedEphemeris.load(path)
+        except (OSError, ValueError, struct.error):
+            ephemeris = None
+        if ephemeris is not None and (ephemeris.birth_jd != birth_jd or ephemeris.max_age != max_age):
+            ephemeris = None
+
+    if ephemeris is None:
+        try:
+            ephemeris = build_progressed_ephemeris(birth_jd, path, max_age)
+        except OSError:
+            # Read-only profile directory: keep the table in memory only
+            ephemeris = ProgressedEphemeris.for_birth(birth_jd, max_age)
+
+    _ephemerides[key] = ephemeris
+    return ephemeris
+
+
+def main():
+    from profile_loader import load_profile
+    from secondary_progressions import birth_julian_day
+
+    parser = argparse.ArgumentParser(description='Build or query a profile\'s progressed ephemeris')
+    parser.add_argument('--profile', required=True, help='Profile name')
+    parser.add_argument('--build', action='store_true', help='Rebuild the table file')
+    parser.add_argument('--age', type=float, help='Show progressed positions at this age')
+    parser.add_argument('--max-age', type=int, default=MAX_AGE, help=f'Last covered age (default {MAX_AGE})')
+
+    args = parser.parse_args()
+
+    try:
+        profile = load_profile(args.profile)
+        birth_jd = birth_julian_day(profile)
+
+        if args.build:
+            path = profile.profile_dir / 'cache' / CACHE_FILENAME
+            ephemeris = build_progressed_ephemeris(birth_jd, path, args.max_age)
+            print(f"Wrote {len(ephemeris)} rows (ages 0-{args.max_age}) to {path}")
+
+        if args.age is not None:
+            ephemeris = get_progressed_ephemeris(profile.profile_dir, birth_jd, args.max_age)
+            for planet in format_samples(ephemeris.sample([args.age]), PLANET_NAMES):
+                retro = " R" if planet['retrograde'] else ""
+                print(f"{planet['name']:12} {planet['sign']:12} {planet['dms']:>10}{retro}")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Render Cache
+Content-addressed store for rendered PDFs and their intermediate HTML.
+
+pdf_generator computes one key per report from everything the PDF depends
+on (markdown, the seed-data fields the front matter uses, the CSS files, the
+generator version and the render date shown on the title page). A report
+whose inputs did not change is copied out of the cache instead of being
+re-rendered, and changing any input simply produces a new key.
+
+Entries are <key>.pdf plus <key>.html, written atomically. A hit refreshes
+the entry's modification time, so eviction removes entries unused for
+longer than max_age_days first, then the least recently used ones until the
+cache fits in max_bytes.
+
+Usage:
+    python render_cache.py                      # Show entries and size
+    python render_cache.py --evict --max-mb 200 --max-age-days 14
+    python render_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+# Constants
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / 'cache' / 'pdf_render'
+MAX_BYTES = 512 * 1024 * 1024     # 512 MB
+MAX_AGE_DAYS = 30
+
+
+class RenderCache:
+    """Rendered PDFs (and their HTML) keyed by a hash of their inputs."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_bytes: Optional[int] = MAX_BYTES,
+        max_age_days: Optional[float] = MAX_AGE_DAYS
+    ):
+        """
+        Args:
+            directory: Cache directory (created on first store)
+            max_bytes: Size limit enforced after each store (None = unlimited)
+            max_age_days: Entries unused for longer are evicted (None = keep)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.stats = {'hits': 0, 'misses': 0, 'evicted': 0}
+
+    @staticmethod
+    def key(inputs: Dict[str, Any]) -> str:
+        """Content address of a render: SHA-256 of its canonical JSON inputs."""
+        payload = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / f"{key}{suffix}"
+
+    def fetch(self, key: str, target: Optional[Union[str, Path]] = None) -> Optional[Union[Path, bytes]]:
+        """
+        Cached PDF for a key.
+
+        Args:
+            key: From RenderCache.key
+            target: Copy the PDF here (None returns the bytes)
+
+        Returns:
+            target path or PDF bytes on a hit, None on a miss
+        """
+        path = self._path(key, '.pdf')
+        try:
+            if target is None:
+                result = path.read_bytes()
+            else:
+                target = Path(target)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, target)
+                result = target
+            os.utime(path)
+        except OSError:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        return result
+
+    def html(self, key: str) -> Optional[str]:
+        """Intermediate HTML stored with a PDF, or None."""
+        try:
+            return self._path(key, '.html').read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def store(self, key: str, pdf: Union[str, Path, bytes], html: Optional[str] = None):
+        """
+        Add a rendered PDF (path or bytes) and its HTML, then evict over the limits.
+
+        A read-only cache location is ignored (the render itself succeeded).
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            pdf_bytes = pdf if isinstance(pdf, bytes) else Path(pdf).read_bytes()
+            if html is not None:
+                self._write(self._path(key, '.html'), html.encode('utf-8'))
+            # PDF last: its presence marks a complete entry
+            self._write(self._path(key, '.pdf'), pdf_bytes)
+        except OSError:
+            return
+        self.evict()
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(data)
+        temp_path.replace(path)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Complete entries, least recently used first: {'key', 'bytes', 'last_used'}."""
+        if not self.directory.exists():
+            return []
+        entries = []
+        for pdf_path in self.directory.glob('*.pdf'):
+            try:
+                stat = pdf_path.stat()
+            except OSError:
+                continue
+            html_path = pdf_path.with_suffix('.html')
+            size = stat.st_size + (html_path.stat().st_size if html_path.exists() else 0)
+            entries.append({'key': pdf_path.stem, 'bytes': size, 'last_used': stat.st_mtime})
+        entries.sort(key=lambda e: e['last_used'])
+        return entries
+
+    def remove(self, key: str):
+        """Delete one entry."""
+        for suffix in ('.pdf', '.html'):
+            self._path(key, suffix).unlink(missing_ok=True)
+
+    def evict(self, max_bytes: Optional[int] = None, max_age_days: Optional[float] = None) -> int:
+        """
+        Drop entries unused for too long, then least recently used ones over the size limit.
+
+        Args:
+            max_bytes: Size limit (default: the cache's)
+            max_age_days: Age limit in days (default: the cache's)
+
+        Returns:
+            Number of entries removed
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_age_days = self.max_age_days if max_age_days is None else max_age_days
+
+        entries = self.entries()
+        keep = []
+        removed = 0
+        cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+
+        for entry in entries:
+            if cutoff is not None and entry['last_used'] < cutoff:
+                self.remove(entry['key'])
+                removed += 1
+            else:
+                keep.append(entry)
+
+        if max_bytes is not None:
+            total = sum(entry['bytes'] for entry in keep)
+            for entry in keep:
+                if total <= max_bytes:
+                    break
+                self.remove(entry['key'])
+                total -= entry['bytes']
+                removed += 1
+
+        self.stats['evicted'] += removed
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry. Returns the number removed."""
+        entries = self.entries()
+        for entry in entries:
+            self.remove(entry['key'])
+        return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect, evict or clear the PDF render cache')
+    parser.add_argument('--dir', default=str(DEFAULT_CACHE_DIR), help='Cache directory')
+    parser.add_argument('--evict', action='store_true', help='Apply the size and age limits now')
+    parser.add_argument('--max-mb', type=float, default=MAX_BYTES / (1024 * 1024),
+                        help=f'Size limit in MB (default {MAX_BYTES // (1024 * 1024)})')
+    parser.add_argument('--max-age-days', type=float, default=MAX_AGE_DAYS,
+                        help=f'Evict entries unused for longer (default {MAX_AGE_DAYS})')
+    parser.add_argument('--clear', action='store_true', help='Delete all entries')
+
+    args = parser.parse_args()
+
+    try:
+        cache = RenderCache(args.dir, int(args.max_mb * 1024 * 1024), args.max_age_days)
+
+        if args.clear:
+            print(f"Deleted {cache.clear()} entries from {args.dir}")
+            return
+        if args.evict:
+            print(f"Evicted {cache.evict()} entries")
+
+        entries = cache.entries()
+        total = sum(entry['bytes'] for entry in entries)
+        print(f"\nRender cache: {args.dir} ({len(entries)} entries, {total / (1024 * 1024):.1f} MB)")
+        if entries:
+            oldest = (time.time() - entries[0]['last_used']) / 86400
+            print(f"  Least recently used: {oldest:.1f} days ago")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
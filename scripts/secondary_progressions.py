@@ -17,12 +17,17 @@ import argparse
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import swisseph as swe
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 from profile_loader import load_profile, list_profiles
+from aspect_solver import find_root, jd_to_datetime
+from ephemeris_sampler import format_samples, sign_indices
+from natal_target_index import is_applying, profile_index
+from progressed_ephemeris import get_progressed_ephemeris, ProgressedEphemeris
 
 # Constants
 SIGNS = [
@@ -42,6 +47,19 @@ PLANET_NAMES = {
 
 TRADITIONAL_PLANETS = [swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN]
 
+# Progressed points solved for exact events: the planets, then the angles
+ANGLE_NAMES = ['Ascendant', 'Midheaven']
+POINT_NAMES = [PLANET_NAMES[p] for p in TRADITIONAL_PLANETS] + ANGLE_NAMES
+
+# Signed aspect angles (waxing and waning sides of each aspect)
+EVENT_ASPECTS = [
+    ('conjunction', 0), ('sextile', 60), ('sextile', -60), ('square', 90), ('square', -90),
+    ('trine', 120), ('trine', -120), ('opposition', 180)
+]
+
+TROPICAL_YEAR = 365.24219   # Days per year of life, for calendar dates of progressed events
+EVENT_TOLERANCE = 1e-6      # Years (~30 seconds of life)
+
 
 def get_sign_from_longitude(longitude: float) -> tuple[str, float]:
     """Convert ecliptic longitude to sign and degree within sign."""
@@ -69,6 +87,21 @@ def calculate_julian_day(date_str: str, time_str: str, utc_offset: str) -> float
     return swe.julday(year, month, day, hour)
 
 
+def birth_julian_day(profile) -> float:
+    """Julian Day (UT) of a profile's birth moment."""
+    birth_data = profile.get_birth_data()
+    return calculate_julian_day(
+        birth_data['date'],
+        birth_data['time'],
+        birth_data['utc_offset']
+    )
+
+
+def progressed_ephemeris(profile) -> ProgressedEphemeris:
+    """The profile's hourly progressed ephemeris table (built and cached on first use)."""
+    return get_progressed_ephemeris(profile.profile_dir, birth_julian_day(profile))
+
+
 def calculate_progressed_positions(profile_name: str, age: float) -> Dict[str, Any]:
     """
     Calculate secondary progressed positions for given age.
@@ -83,46 +116,18 @@ def calculate_progressed_positions(profile_name: str, age: float) -> Dict[str, A
     profile = load_profile(profile_name)
     birth_data = profile.get_birth_data()
 
-    # Calculate birth Julian Day
-    birth_jd = calculate_julian_day(
-        birth_data['date'],
-        birth_data['time'],
-        birth_data['utc_offset']
-    )
-
     # Secondary progressions: 1 day = 1 year
-    # For age 36, we calculate positions 36 days after birth
-    progressed_jd = birth_jd + age
-
-    # Calculate progressed planet positions
-    progressed_planets = []
-
-    for planet_id in TRADITIONAL_PLANETS:
-        planet_name = PLANET_NAMES[planet_id]
-
-        # Calculate position at progressed date
-        position, _ = swe.calc_ut(progressed_jd, planet_id)
-        longitude = position[0]
-        speed = position[3]
-
-        sign, degree = get_sign_from_longitude(longitude)
-
-        # Determine house (using whole sign from natal Ascendant)
-        natal_asc_sign = profile.seed_data['chart_framework']['ascendant']['sign']
-        natal_asc_index = SIGNS.index(natal_asc_sign)
-        sign_index = SIGNS.index(sign)
-        house = ((sign_index - natal_asc_index) % 12) + 1
-
-        progressed_planets.append({
-            'name': planet_name,
-            'longitude': longitude,
-            'sign': sign,
-            'degree': degree,
-            'dms': f"{int(degree)}°{int((degree % 1) * 60)}'{int(((degree * 60) % 1) * 60)}\"",
-            'house': house,
-            'speed': speed,
-            'retrograde': speed < 0
-        })
+    # For age 36, we use positions 36 days after birth (from the progressed table)
+    samples = progressed_ephemeris(profile).sample([age])
+    progressed_planets = format_samples(samples, [PLANET_NAMES[p] for p in TRADITIONAL_PLANETS])
+
+    # Determine house (using whole sign from natal Ascendant)
+    natal_asc_sign = profile.seed_data['chart_framework']['ascendant']['sign']
+    natal_asc_index = SIGNS.index(natal_asc_sign)
+
+    for planet in progressed_planets:
+        sign_index = SIGNS.index(planet['sign'])
+        planet['house'] = ((sign_index - natal_asc_index) % 12) + 1
 
     return {
         'profile': profile_name,
@@ -148,44 +153,178 @@ def find_progressed_aspects_to_natal(profile_name: str, age: float, orb: float =
     profile = load_profile(profile_name)
     progressed = calculate_progressed_positions(profile_name, age)
 
-    aspects = []
-    aspect_angles = {
-        'conjunction': 0,
-        'sextile': 60,
-        'square': 90,
-        'trine': 120,
-        'opposition': 180
-    }
-
-    # Get natal planets
-    natal_planets = {p['name']: p['longitude'] for p in profile.get_planets(traditional_only=True)}
+    # Every progressed planet against the natal aspect points in one batched query
+    index = profile_index(profile, traditional_only=True)
+    prog_planets = progressed['progressed_planets']
+    hits = index.query_many([p['longitude'] for p in prog_planets], orb)
 
-    # Check each progressed planet against each natal planet
-    for prog_planet in progressed['progressed_planets']:
-        for natal_name, natal_long in natal_planets.items():
+    aspects = []
+    for prog_order, (prog_planet, planet_hits) in enumerate(zip(prog_planets, hits)):
+        for entry, distance in planet_hits:
             # Don't aspect planet to itself
-            if prog_planet['name'] == natal_name:
+            if entry['natal_planet'] == prog_planet['name']:
                 continue
+            aspects.append(((prog_order,) + entry['order'], {
+                'progressed_planet': prog_planet['name'],
+                'natal_planet': entry['natal_planet'],
+                'aspect_type': entry['aspect_type'],
+                'orb': distance,
+                # Natal points are fixed, so relative speed is the progressed speed (deg/year)
+                'applying': is_applying(prog_planet['longitude'], entry['target'], prog_planet['speed']),
+            }))
+
+    # Progressed planet, then natal planet, then aspect order
+    aspects.sort(key=lambda hit: hit[0])
+    aspects = [aspect for _, aspect in aspects]
+
+    return aspects
+
+
+class _ProgressedTracks:
+    """Longitudes of the progressed planets and angles as functions of age."""
+
+    def __init__(self, profile):
+        birth_data = profile.get_birth_data()
+        self.birth_jd = birth_julian_day(profile)
+        self.ephemeris = progressed_ephemeris(profile)
+        self.latitude = birth_data['latitude']
+        self.obliquity = swe.calc_ut(self.birth_jd, swe.ECL_NUT)[0][0]
+
+        framework = profile.seed_data['chart_framework']
+        self.natal_mc = framework['midheaven']['longitude']
+        self.natal_sun = float(self.ephemeris.sample([0.0])['longitude'][0, 0])
+
+    def longitudes(self, ages: np.ndarray) -> np.ndarray:
+        """
+        Progressed longitudes at many ages, columns in POINT_NAMES order.
 
-            # Calculate angular distance
-            diff = abs(prog_planet['longitude'] - natal_long)
-            if diff > 180:
-                diff = 360 - diff
+        Angles are progressed by solar arc in longitude: the MC advances by
+        the progressed Sun's arc and the Ascendant is the one rising with that
+        MC at the birth latitude.
+        """
+        samples = self.ephemeris.sample(ages)
+        planets = samples['longitude']
+        solar_arc = planets[:, 0] - self.natal_sun
+        mc = (self.natal_mc + solar_arc) % 360.0
 
-            # Check each aspect type
-            for aspect_name, aspect_angle in aspect_angles.items():
-                orb_diff = abs(diff - aspect_angle)
+        mc_rad = np.radians(mc)
+        armc = np.degrees(np.arctan2(np.sin(mc_rad) * np.cos(np.radians(self.obliquity)), np.cos(mc_rad))) % 360.0
+        asc = np.array([swe.houses_armc(a, self.latitude, self.obliquity, b'W')[1][0] for a in armc.tolist()])
 
-                if orb_diff <= orb:
+        return np.column_stack([planets, asc, mc])
+
+    def speeds(self, age: float) -> np.ndarray:
+        """Progressed speeds (degrees per year of age) at one age, POINT_NAMES order."""
+        step = 1e-3
+        before, after = self.longitudes(np.array([age - step, age + step]))
+        return ((after - before + 180.0) % 360.0 - 180.0) / (2 * step)
+
+    def longitude(self, col: int, age: float) -> float:
+        return float(self.longitudes(np.array([age]))[0, col])
+
+    def date(self, age: float) -> str:
+        """Calendar date (UT) on which the given age is reached."""
+        return jd_to_datetime(self.birth_jd + age * TROPICAL_YEAR).strftime('%Y-%m-%d')
+
+
+def find_progressed_events(
+    profile_name: str,
+    start_age: float = 0,
+    end_age: float = 100,
+    include_angles: bool = True
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Exact ages of progressed sign ingresses and aspect perfections.
+
+    The progressed planets and angles are sampled in one batch on the
+    progressed ephemeris grid (one row per ~15 days of age, fine enough
+    that no sign boundary or aspect is crossed twice between rows); every
+    bracketed crossing is then root-found on the interpolated longitude.
+    Retrograde re-entries and re-perfections are reported separately.
+
+    Args:
+        profile_name: Profile to use
+        start_age: First age (years, fractional allowed)
+        end_age: Last age
+        include_angles: Also solve the progressed Ascendant and Midheaven
+
+    Returns:
+        {
+            'ingresses': [{'age', 'date', 'point', 'body', 'old_sign',
+                           'new_sign', 'retrograde'}, ...],
+            'aspects': [{'age', 'date', 'progressed_planet', 'natal_planet',
+                         'aspect_type', 'retrograde'}, ...]
+        }
+        Each list sorted by age.
+    """
+    profile = load_profile(profile_name)
+    tracks = _ProgressedTracks(profile)
+
+    rows = np.arange(np.ceil(start_age * 24), np.floor(end_age * 24) + 1) / 24
+    ages = np.unique(np.concatenate([[float(start_age)], rows, [float(end_age)]]))
+    longitudes = tracks.longitudes(ages)
+
+    n_points = len(POINT_NAMES) if include_angles else len(TRADITIONAL_PLANETS)
+
+    # Natal targets: every traditional planet and both angles, at each aspect angle
+    framework = profile.seed_data['chart_framework']
+    natal_points = [(p['name'], p['longitude']) for p in profile.get_planets(traditional_only=True)]
+    natal_points += [('Ascendant', framework['ascendant']['longitude']),
+                     ('Midheaven', framework['midheaven']['longitude'])]
+
+    def solve(col: int, target: float, i: int) -> Tuple[float, bool]:
+        def offset(age: float) -> float:
+            return (tracks.longitude(col, age) - target + 180.0) % 360.0 - 180.0
+
+        a, b = float(ages[i]), float(ages[i + 1])
+        age = find_root(offset, a, b, offset(a), offset(b), tolerance=EVENT_TOLERANCE)
+        return age, bool(tracks.speeds(age)[col] < 0)
+
+    ingresses = []
+    aspects = []
+    for col in range(n_points):
+        name = POINT_NAMES[col]
+        track = longitudes[:, col]
+
+        signs = sign_indices(track)
+        for i in np.flatnonzero(signs[1:] != signs[:-1]).tolist():
+            entered = int(signs[i + 1])
+            # Direct motion crosses the entered sign's first degree, retrograde motion its last
+            boundary = 30.0 * entered if (entered - int(signs[i])) % 12 == 1 else 30.0 * (entered + 1)
+            age, retrograde = solve(col, boundary % 360.0, i)
+            ingresses.append({
+                'age': age,
+                'date': tracks.date(age),
+                'point': f'Progressed {name}',
+                'body': name,
+                'old_sign': SIGNS[int(signs[i])],
+                'new_sign': SIGNS[entered],
+                'retrograde': retrograde,
+            })
+
+        for natal_name, natal_longitude in natal_points:
+            if natal_name == name:
+                continue
+            for aspect_type, angle in EVENT_ASPECTS:
+                target = (natal_longitude + angle) % 360.0
+                offsets = (track - target + 180.0) % 360.0 - 180.0
+                crossings = np.flatnonzero(
+                    (np.sign(offsets[1:]) != np.sign(offsets[:-1])) & (np.abs(offsets[1:] - offsets[:-1]) < 180.0)
+                )
+                for i in crossings.tolist():
+                    age, retrograde = solve(col, target, i)
                     aspects.append({
-                        'progressed_planet': prog_planet['name'],
+                        'age': age,
+                        'date': tracks.date(age),
+                        'progressed_planet': name,
                         'natal_planet': natal_name,
-                        'aspect_type': aspect_name,
-                        'orb': orb_diff,
-                        'applying': True,  # Would need speed comparison for exact determination
+                        'aspect_type': aspect_type,
+                        'retrograde': retrograde,
                     })
 
-    return aspects
+    ingresses.sort(key=lambda e: e['age'])
+    aspects.sort(key=lambda e: e['age'])
+    return {'ingresses': ingresses, 'aspects': aspects}
 
 
 def track_progressed_moon_cycle(profile_name: str, start_age: int = 0, end_age: int = 100) -> List[Dict[str, Any]]:
@@ -194,40 +333,35 @@ def track_progressed_moon_cycle(profile_name: str, start_age: int = 0, end_age:
     Progressed Moon completes full zodiac cycle in ~27-28 years.
 
     Returns:
-        List of Moon sign changes with ages
+        List of Moon sign periods with exact (fractional) start/end ages
     """
     profile = load_profile(profile_name)
-    moon_cycles = []
+    start_sign = sign_indices(progressed_ephemeris(profile).sample([start_age])['longitude'][:, 1])[0]
+    ingresses = [
+        e for e in find_progressed_events(profile_name, start_age, end_age, include_angles=False)['ingresses']
+        if e['body'] == 'Moon'
+    ]
 
-    current_sign = None
+    moon_cycles = []
+    current_sign = SIGNS[int(start_sign)]
     sign_start_age = start_age
-
-    # Check Moon position every 2.3 years (average time in each sign)
-    for age in range(start_age, end_age + 1):
-        progressed = calculate_progressed_positions(profile_name, float(age))
-        moon = next(p for p in progressed['progressed_planets'] if p['name'] == 'Moon')
-
-        if moon['sign'] != current_sign:
-            if current_sign is not None:
-                # Record completed period
-                moon_cycles.append({
-                    'sign': current_sign,
-                    'start_age': sign_start_age,
-                    'end_age': age,
-                    'duration': age - sign_start_age
-                })
-
-            current_sign = moon['sign']
-            sign_start_age = age
-
-    # Add final period
-    if current_sign is not None:
+    for ingress in ingresses:
         moon_cycles.append({
             'sign': current_sign,
-            'start_age': sign_start_age,
-            'end_age': end_age,
-            'duration': end_age - sign_start_age
+            'start_age': round(sign_start_age, 2),
+            'end_age': round(ingress['age'], 2),
+            'duration': round(ingress['age'] - sign_start_age, 2)
         })
+        current_sign = ingress['new_sign']
+        sign_start_age = ingress['age']
+
+    # Add final period
+    moon_cycles.append({
+        'sign': current_sign,
+        'start_age': round(sign_start_age, 2),
+        'end_age': end_age,
+        'duration': round(end_age - sign_start_age, 2)
+    })
 
     return moon_cycles
 
@@ -275,8 +409,8 @@ def format_moon_cycle(moon_cycles: List[Dict[str, Any]]) -> str:
     output.append(f"{'-'*80}")
 
     for cycle in moon_cycles:
-        output.append(f"Ages {cycle['start_age']}-{cycle['end_age']}: "
-                     f"{cycle['sign']} ({cycle['duration']} years)")
+        output.append(f"Ages {cycle['start_age']:.2f}-{cycle['end_age']:.2f}: "
+                     f"{cycle['sign']} ({cycle['duration']:.2f} years)")
 
     return "\n".join(output)
 
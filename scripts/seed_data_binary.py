@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Seed Data Binary
+Compiled binary sidecar for master_seed_data.yaml with lazy section loading.
+
+master_seed_data.yaml stays the human-editable source of truth, but parsing it
+with PyYAML's pure-Python loader dominates startup in short runs. The seed
+data generator therefore also writes master_seed_data.bin next to it:
+
+    Header:         magic 'SEEDBIN1', version, section count,
+                    YAML mtime_ns, YAML size, YAML SHA-256
+    Section table:  name (32 bytes, UTF-8), offset, length - one per top-level key
+    Sections:       compact JSON, one blob per top-level key, in YAML key order
+
+Readers decode only the sections they ask for. A sidecar is fresh when the
+YAML's mtime and size match the header, or (after a checkout or copy that
+touched the mtime) when the YAML's SHA-256 still matches. Stale or missing
+sidecars are ignored and rebuilt on the next YAML load.
+
+Usage:
+    python seed_data_binary.py --profile darren            # (Re)build sidecar
+    python seed_data_binary.py --profile darren --info     # Show sections and freshness
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+import yaml
+
+# Constants
+MAGIC = b'SEEDBIN1'
+VERSION = 1
+HEADER_FORMAT = '<8sHHqq32s'
+SECTION_FORMAT = '<32sII'
+
+
+def sidecar_path(yaml_path: Union[str, Path]) -> Path:
+    """Binary sidecar path for a seed data YAML file (same name, .bin suffix)."""
+    return Path(yaml_path).with_suffix('.bin')
+
+
+def _yaml_fingerprint(yaml_path: Path) -> Dict[str, Any]:
+    stat = yaml_path.stat()
+    content = yaml_path.read_bytes()
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': hashlib.sha256(content).digest(),
+    }
+
+
+def write_seed_binary(seed_data: Dict[str, Any], yaml_path: Union[str, Path]) -> Path:
+    """
+    Write the binary sidecar for a seed data YAML file.
+
+    Must be called after the YAML itself is written, since the sidecar records
+    the YAML's mtime, size and hash. Written atomically (temp file + rename).
+
+    Args:
+        seed_data: Seed data dictionary (as written to / loaded from the YAML)
+        yaml_path: Path of the YAML source
+
+    Returns:
+        Path of the sidecar
+
+    Raises:
+        ValueError: If a section cannot be stored losslessly
+    """
+    yaml_path = Path(yaml_path)
+    fingerprint = _yaml_fingerprint(yaml_path)
+
+    blobs = []
+    for name, value in seed_data.items():
+        blob = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        # JSON turns tuples into lists and non-string keys into strings - refuse lossy sections
+        if json.loads(blob) != value:
+            raise ValueError(f"Section '{name}' does not round-trip through the seed binary")
+        blobs.append((name, blob))
+
+    offset = struct.calcsize(HEADER_FORMAT) + len(blobs) * struct.calcsize(SECTION_FORMAT)
+    table = []
+    for name, blob in blobs:
+        encoded_name = name.encode('utf-8')
+        if len(encoded_name) > 32:
+            raise ValueError(f"Section name too long for seed binary: {name}")
+        table.append(struct.pack(SECTION_FORMAT, encoded_name, offset, len(blob)))
+        offset += len(blob)
+
+    path = sidecar_path(yaml_path)
+    temp_path = path.with_suffix(f'.bin.{os.getpid()}.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(
+            HEADER_FORMAT, MAGIC, VERSION, len(blobs),
+            fingerprint['mtime_ns'], fingerprint['size'], fingerprint['sha256']
+        ))
+        f.write(b''.join(table))
+        for _, blob in blobs:
+            f.write(blob)
+    temp_path.replace(path)
+
+    return path
+
+
+class SeedDataBinary:
+    """Reader for a seed data sidecar; decodes sections on first access."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._data = self.path.read_bytes()
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        magic, version, count, self.source_mtime_ns, self.source_size, self.source_sha256 = \
+            struct.unpack_from(HEADER_FORMAT, self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a seed data binary: {self.path}")
+
+        self._table = {}
+        for i in range(count):
+            name, offset, length = struct.unpack_from(
+                SECTION_FORMAT, self._data, header_size + i * struct.calcsize(SECTION_FORMAT)
+            )
+            self._table[name.rstrip(b'\0').decode('utf-8')] = (offset, length)
+        self._decoded = {}
+
+    @property
+    def section_names(self) -> List[str]:
+        return list(self._table)
+
+    def section_size(self, name: str) -> int:
+        """Encoded size of a section in bytes (0 if absent)."""
+        return self._table.get(name, (0, 0))[1]
+
+    def is_fresh(self, yaml_path: Union[str, Path]) -> bool:
+        """True if the sidecar still matches the YAML source."""
+        yaml_path = Path(yaml_path)
+        try:
+            stat = yaml_path.stat()
+        except OSError:
+            return False
+        if stat.st_mtime_ns == self.source_mtime_ns and stat.st_size == self.source_size:
+            return True
+        if stat.st_size != self.source_size:
+            return False
+        return hashlib.sha256(yaml_path.read_bytes()).digest() == self.source_sha256
+
+    def has_section(self, name: str) -> bool:
+        return name in self._table
+
+    def get_section(self, name: str, default: Any = None) -> Any:
+        """Decode (once) and return one top-level section."""
+        if name not in self._table:
+            return default
+        if name not in self._decoded:
+            offset, length = self._table[name]
+            self._decoded[name] = json.loads(self._data[offset:offset + length])
+        return self._decoded[name]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode every section, in the YAML's key order."""
+        return {name: self.get_section(name) for name in self._table}
+
+
+def open_fresh_sidecar(yaml_path: Union[str, Path]) -> Optional[SeedDataBinary]:
+    """Open the sidecar for a YAML file if it exists and is fresh, else None."""
+    path = sidecar_path(yaml_path)
+    if not path.exists():
+        return None
+    try:
+        binary = SeedDataBinary(path)
+    except (ValueError, struct.error):
+        return None
+    return binary if binary.is_fresh(yaml_path) else None
+
+
+def load_seed_file(yaml_path: Union[str, Path], refresh: bool = True) -> Dict[str, Any]:
+    """
+    Load full seed data, from the sidecar when fresh, otherwise from the YAML.
+
+    Args:
+        yaml_path: Path of master_seed_data.yaml
+        refresh: Rebuild a missing or stale sidecar after parsing the YAML
+
+    Returns:
+        Seed data dictionary
+    """
+    binary = open_fresh_sidecar(yaml_path)
+    if binary is not None:
+        return binary.to_dict()
+
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        seed_data = yaml.safe_load(f)
+
+    if refresh and isinstance(seed_data, dict):
+        try:
+            write_seed_binary(seed_data, yaml_path)
+        except (OSError, TypeError, ValueError):
+            # Read-only directory or non-JSON values: keep using the YAML
+            pass
+
+    return seed_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or inspect the binary seed data sidecar')
+    parser.add_argument('--profile', required=True, help='Profile name')
+    parser.add_argument('--info', action='store_true', help='Show sections and freshness only')
+
+    args = parser.parse_args()
+
+    try:
+        yaml_path = Path('profiles') / args.profile / 'seed_data' / 'master_seed_data.yaml'
+        if not yaml_path.exists():
+            raise FileNotFoundError(f"Seed data not found: {yaml_path}")
+
+        if not args.info:
+            with open(yaml_path, 'r', encoding='utf-8') as f:
+                write_seed_binary(yaml.safe_load(f), yaml_path)
+
+        binary = SeedDataBinary(sidecar_path(yaml_path))
+        print(f"\nSidecar: {binary.path} ({binary.path.stat().st_size} bytes)")
+        print(f"Fresh: {'yes' if binary.is_fresh(yaml_path) else 'NO (stale - rebuild)'}")
+        print(f"Sections ({len(binary.section_names)}):")
+        for name in binary.section_names:
+            print(f"  {name:25} {binary.section_size(name):8} bytes")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
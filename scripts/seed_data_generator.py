@@ -10,12 +10,22 @@ Usage:
 """
 
 import argparse
+import os
 import swisseph as swe
 import yaml
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+import sys
 import pytz
 
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from ephemeris_sampler import sample_positions
+from fixed_stars import MAJOR_STARS, star_index
+from profile_loader import invalidate as invalidate_profile
+from seed_data_binary import write_seed_binary
+
 # Constants
 PLANETS = {
     'Sun': swe.SUN,
@@ -35,6 +45,8 @@ PLANETS = {
 TRADITIONAL_PLANETS = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn']
 MODERN_PLANETS = ['Uranus', 'Neptune', 'Pluto', 'Chiron', 'Lilith']
 
+_ephemeris_initialized = False
+
 SIGNS = [
     'Aries', 'Taurus', 'Gemini', 'Cancer',
     'Leo', 'Virgo', 'Libra', 'Scorpio',
@@ -166,12 +178,26 @@ def get_sign_and_degree(longitude):
     return SIGNS[sign_num], degree
 
 
+@lru_cache(maxsize=None)
+def get_timezone(timezone_str):
+    """Resolve a timezone name once per process (bulk runs repeat the same few zones)."""
+    return pytz.timezone(timezone_str) if timezone_str not in ['UTC', 'GMT'] else pytz.UTC
+
+
+def init_ephemeris():
+    """Point Swiss Ephemeris at the project's ephemeris directory (once per process)."""
+    global _ephemeris_initialized
+    if not _ephemeris_initialized:
+        swe.set_ephe_path(str(Path(__file__).parent.parent / 'ephemeris'))
+        _ephemeris_initialized = True
+
+
 def calculate_julian_day(date_str, time_str, timezone_str):
     """Calculate Julian day number from date, time, and timezone."""
     dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
 
     # Convert to UTC
-    tz = pytz.timezone(timezone_str) if timezone_str not in ['UTC', 'GMT'] else pytz.UTC
+    tz = get_timezone(timezone_str)
     dt_local = tz.localize(dt)
     dt_utc = dt_local.astimezone(pytz.UTC)
 
@@ -235,10 +261,13 @@ def calculate_planets(jd, include_chiron=False, include_lilith=False):
         # Remove Lilith if not enabled
         planets_to_calculate = {k: v for k, v in planets_to_calculate.items() if k != 'Lilith'}
 
-    for name, planet_id in planets_to_calculate.items():
-        result = swe.calc_ut(jd, planet_id)
-        longitude = result[0][0]
-        speed = result[0][3]
+    names = list(planets_to_calculate)
+    # Natal positions always come from live Swiss Ephemeris, not the Chebyshev cache
+    samples = sample_positions(list(planets_to_calculate.values()), [jd], use_cache=False)
+
+    for col, name in enumerate(names):
+        longitude = float(samples['longitude'][0, col])
+        speed = float(samples['speed'][0, col])
 
         sign, degree = get_sign_and_degree(longitude)
 
@@ -1038,121 +1067,84 @@ def calculate_antiscia(planet_data):
 
 def calculate_fixed_stars(jd, planet_data, house_data):
     """
-    Calculate major fixed stars and check for conjunctions to planets/angles.
+    Calculate fixed star positions and check for conjunctions to planets/angles.
 
-    Uses Swiss Ephemeris fixstar_ut() for precise fixed star positions.
+    Uses the precessed catalog in fixed_stars.py (one sorted longitude index
+    per birth moment). Lists the five major stars (Royal Stars + Algol) plus
+    any other catalog star with a conjunction.
     Only reports conjunctions within 1° orb (traditional).
     """
-    # Major 5 fixed stars (Royal Stars + important traditional stars)
-    FIXED_STARS = {
-        'Regulus': {
-            'traditional_name': 'Cor Leonis (Heart of the Lion)',
-            'nature': 'Success, royalty, honor, leadership',
-            'magnitude': 1.4
-        },
-        'Spica': {
-            'traditional_name': 'Spica Virginis (Ear of Wheat)',
-            'nature': 'Gifts, protection, success through skill',
-            'magnitude': 1.0
-        },
-        'Algol': {
-            'traditional_name': "Caput Medusae (Medusa's Head)",
-            'nature': 'Violence, danger, challenges (use with caution)',
-            'magnitude': 2.1
-        },
-        'Antares': {
-            'traditional_name': 'Cor Scorpii (Heart of Scorpion)',
-            'nature': 'Conflict, courage, obsession',
-            'magnitude': 1.0
-        },
-        'Aldebaran': {
-            'traditional_name': 'Oculus Tauri (Eye of the Bull)',
-            'nature': 'Honor, integrity, achievement',
-            'magnitude': 0.9
-        }
-    }
-
     ORB = 1.0  # Traditional 1° orb for fixed stars
 
-    fixed_star_data = []
-    conjunctions = []
-
-    # Calculate each fixed star position
-    for star_name, star_info in FIXED_STARS.items():
-        try:
-            result = swe.fixstar_ut(star_name, jd)
-            star_lon = result[0][0]
-            star_sign, star_degree = get_sign_and_degree(star_lon)
-
-            star_data = {
-                'name': star_name,
-                'traditional_name': star_info['traditional_name'],
-                'nature': star_info['nature'],
-                'magnitude': star_info['magnitude'],
-                'position': {
-                    'sign': star_sign,
-                    'degree': round(star_degree, 4),
-                    'longitude': round(star_lon, 4),
-                    'dms': decimal_to_dms(star_degree)
-                },
-                'conjunctions': []
-            }
+    index = star_index(jd)
 
-            # Check conjunctions to planets
-            for planet in planet_data:
-                orb = abs(star_lon - planet['longitude'])
-                if orb > 180:
-                    orb = 360 - orb
-
-                if orb <= ORB:
-                    conjunction_data = {
-                        'type': 'planet',
-                        'body': planet['name'],
-                        'orb': round(orb, 2),
-                        'applying': planet['longitude'] < star_lon
-                    }
-                    star_data['conjunctions'].append(conjunction_data)
-
-                    conjunctions.append({
-                        'star': star_name,
-                        'planet': planet['name'],
-                        'orb': round(orb, 2),
-                        'nature': star_info['nature']
-                    })
-
-            # Check conjunctions to angles (ASC, MC, DSC, IC)
-            angles = {
-                'Ascendant': house_data['ascendant']['longitude'],
-                'Midheaven': house_data['midheaven']['longitude'],
-                'Descendant': (house_data['ascendant']['longitude'] + 180) % 360,
-                'IC': (house_data['midheaven']['longitude'] + 180) % 360
-            }
-
-            for angle_name, angle_lon in angles.items():
-                orb = abs(star_lon - angle_lon)
-                if orb > 180:
-                    orb = 360 - orb
+    # Planets first, then angles (ASC, MC, DSC, IC)
+    points = {planet['name']: planet['longitude'] for planet in planet_data}
+    angles = {
+        'Ascendant': house_data['ascendant']['longitude'],
+        'Midheaven': house_data['midheaven']['longitude'],
+        'Descendant': (house_data['ascendant']['longitude'] + 180) % 360,
+        'IC': (house_data['midheaven']['longitude'] + 180) % 360
+    }
+    contacts = index.contacts({**points, **angles}, orb=ORB)
 
-                if orb <= ORB:
-                    conjunction_data = {
-                        'type': 'angle',
-                        'body': angle_name,
-                        'orb': round(orb, 2)
-                    }
-                    star_data['conjunctions'].append(conjunction_data)
+    by_star = {}
+    for contact in contacts:
+        by_star.setdefault(contact['star'], []).append(contact)
+    listed = MAJOR_STARS + [name for name in index.names if name in by_star and name not in MAJOR_STARS]
 
-                    conjunctions.append({
-                        'star': star_name,
-                        'angle': angle_name,
-                        'orb': round(orb, 2),
-                        'nature': star_info['nature']
-                    })
+    fixed_star_data = []
+    conjunctions = []
 
-            fixed_star_data.append(star_data)
+    for star_name in listed:
+        star = index.position(star_name)
+        star_lon = star['longitude']
+        star_sign, star_degree = get_sign_and_degree(star_lon)
+
+        star_data = {
+            'name': star_name,
+            'traditional_name': star['traditional_name'],
+            'nature': star['nature'],
+            'magnitude': star['magnitude'],
+            'position': {
+                'sign': star_sign,
+                'degree': round(star_degree, 4),
+                'longitude': round(star_lon, 4),
+                'dms': decimal_to_dms(star_degree)
+            },
+            'conjunctions': []
+        }
 
-        except Exception as e:
-            print(f"Warning: Could not calculate {star_name}: {e}")
-            continue
+        for contact in by_star.get(star_name, []):
+            orb = round(contact['orb'], 2)
+            if contact['point'] in angles:
+                star_data['conjunctions'].append({
+                    'type': 'angle',
+                    'body': contact['point'],
+                    'orb': orb
+                })
+                conjunctions.append({
+                    'star': star_name,
+                    'angle': contact['point'],
+                    'orb': orb,
+                    'nature': star['nature']
+                })
+            else:
+                star_data['conjunctions'].append({
+                    'type': 'planet',
+                    'body': contact['point'],
+                    'orb': orb,
+                    # Planet still short of the star's longitude
+                    'applying': (contact['point_longitude'] - star_lon + 180) % 360 - 180 < 0
+                })
+                conjunctions.append({
+                    'star': star_name,
+                    'planet': contact['point'],
+                    'orb': orb,
+                    'nature': star['nature']
+                })
+
+        fixed_star_data.append(star_data)
 
     return {
         'stars': fixed_star_data,
@@ -1427,8 +1419,7 @@ def calculate_aspect_dynamics(aspects, planet_data):
 def generate_seed_data(args):
     """Main function to generate complete seed data."""
     # Initialize Swiss Ephemeris with project's ephemeris directory
-    ephe_path = str(Path(__file__).parent.parent / 'ephemeris')
-    swe.set_ephe_path(ephe_path)
+    init_ephemeris()
 
     # Read profile settings to determine what to calculate
     settings = read_profile_settings(args.name)
@@ -1534,6 +1525,26 @@ def generate_seed_data(args):
     return seed_data
 
 
+def save_seed_data(seed_data, output_path, profile_name):
+    """Write seed data YAML plus its binary sidecar, and drop any cached copy of the profile."""
+    output_path = Path(output_path)
+
+    # Create directories if needed
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to YAML atomically (temp file + rename), so readers never see a partial file
+    temp_path = output_path.with_name(f'{output_path.name}.{os.getpid()}.tmp')
+    with open(temp_path, 'w') as f:
+        yaml.dump(seed_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    os.replace(temp_path, output_path)
+
+    # Compiled sidecar for fast section loading (the YAML stays the source of truth)
+    write_seed_binary(seed_data, output_path)
+
+    # Drop any cached copy of this profile so later loads in this process see the new data
+    invalidate_profile(profile_name)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate natal chart seed data')
     parser.add_argument('--name', required=True, help='Profile name')
@@ -1558,12 +1569,7 @@ def main():
     else:
         output_path = Path(f'profiles/{args.name}/seed_data/master_seed_data.yaml')
 
-    # Create directories if needed
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to YAML
-    with open(output_path, 'w') as f:
-        yaml.dump(seed_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    save_seed_data(seed_data, output_path, args.name)
 
     print(f"✅ Seed data generated: {output_path}")
     print(f"   Profile: {args.name}")
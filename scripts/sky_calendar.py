@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Sky Calendar
+Exact sign ingresses of all ten planets and every lunation phase, precomputed as one sorted table.
+
+Report generators want to know when planets change sign and when the New,
+First Quarter, Full and Last Quarter Moons fall. Rather than re-deriving these
+from daily positions for every report, the calendar samples all bodies on a
+half-day grid in one vectorized pass (ephemeris_sampler.py), brackets every
+change of sign (or of lunar phase quadrant) and root-finds its exact moment.
+
+The events are stored as one fixed-width table sorted by time in
+ephemeris/sky_calendar.bin (1900-2100 by default, written by --build and
+memory-mapped on load), so every report over any span within it reuses the
+same data. Without the file, reports compute just their own years (plus a
+year each side) in memory. Range iterators are binary searches on time.
+
+File layout (little-endian):
+    Header:  magic 'SKYCAL01', version, event count, jd_start, jd_end
+    Records: EVENT_DTYPE rows sorted by time
+
+Usage:
+    python sky_calendar.py --build --start-year 1900 --end-year 2100
+    python sky_calendar.py --start-date 2025-10-01 --end-date 2026-01-01
+    python sky_calendar.py --start-date 2025-10-01 --end-date 2026-01-01 --bodies Sun Mars --no-lunations
+"""
+
+import argparse
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Union
+import numpy as np
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from aspect_solver import BodyTrack, find_root, jd_to_datetime, normalize_separation
+from ephemeris_cache import EPHEMERIS_DIR, get_cached_span
+from ephemeris_sampler import BODY_IDS, SIGNS, sample_positions, sign_indices
+from transits import calculate_julian_day
+
+# Constants
+DEFAULT_CALENDAR_PATH = EPHEMERIS_DIR / 'sky_calendar.bin'
+DEFAULT_START_YEAR = 1900
+DEFAULT_END_YEAR = 2100
+
+MAGIC = b'SKYCAL01'
+VERSION = 1
+HEADER_FORMAT = '<8sIIdd'
+
+EVENT_DTYPE = np.dtype([
+    ('jd', '<f8'),              # Exact moment (UT)
+    ('longitude', '<f8'),       # Body longitude (Moon for lunations)
+    ('body', 'i1'),             # Swiss Ephemeris body id (Moon for lunations)
+    ('kind', 'u1'),             # 0 = ingress, 1 = lunation
+    ('value', 'u1'),            # Sign entered (0 = Aries), or phase index
+    ('retrograde', 'u1'),       # Ingress made in retrograde motion
+])
+
+KINDS = ('ingress', 'lunation')
+PHASES = ('new_moon', 'first_quarter', 'full_moon', 'last_quarter')
+BODY_NAMES = {body_id: name for name, body_id in BODY_IDS.items()}
+
+# Sampling grid in days: the Moon moves at most ~7.8° and the Sun-Moon
+# elongation ~7.5° per step, so no sign or phase quadrant can be skipped
+GRID_STEP = 0.5
+
+_calendars = {}
+
+
+def _ingresses(name: str, jds: np.ndarray, longitudes: np.ndarray) -> List[tuple]:
+    """Root-find every sign change of one body between grid samples."""
+    signs = sign_indices(longitudes)
+    rows = []
+    for i in np.flatnonzero(signs[1:] != signs[:-1]).tolist():
+        entered = int(signs[i + 1])
+        # Direct motion crosses the entered sign's first degree, retrograde motion its last
+        step = (entered - int(signs[i])) % 12
+        boundary = 30.0 * entered if step == 1 else 30.0 * (entered + 1)
+        track = BodyTrack(name, boundary)
+        a, b = float(jds[i]), float(jds[i + 1])
+        jd = find_root(track.separation, a, b, track.separation(a), track.separation(b))
+        _, _, speed = track.sample(jd)
+        rows.append((jd, boundary % 360.0, BODY_IDS[name], 0, entered, int(speed < 0)))
+    return rows
+
+
+def _lunations(jds: np.ndarray, sun: np.ndarray, moon: np.ndarray) -> List[tuple]:
+    """Root-find every change of lunar phase quadrant (Moon - Sun elongation)."""
+    sun_track = BodyTrack('Sun', 0.0)
+    moon_track = BodyTrack('Moon', 0.0)
+    quadrants = np.floor(np.mod(moon - sun, 360.0) / 90.0).astype(np.int64) % 4
+    rows = []
+    for i in np.flatnonzero(quadrants[1:] != quadrants[:-1]).tolist():
+        phase = int(quadrants[i + 1])
+        angle = 90.0 * phase
+
+        def offset(jd: float) -> float:
+            return normalize_separation(moon_track.separation(jd) - sun_track.separation(jd), angle)
+
+        a, b = float(jds[i]), float(jds[i + 1])
+        jd = find_root(offset, a, b, offset(a), offset(b))
+        rows.append((jd, moon_track.separation(jd) % 360.0, BODY_IDS['Moon'], 1, phase, 0))
+    return rows
+
+
+def calculate_sky_events(start_year: int, end_year: int) -> np.ndarray:
+    """
+    Every ingress and lunation from 1 January start_year through 31 December end_year.
+
+    Returns:
+        EVENT_DTYPE array sorted by time
+    """
+    jd_start = swe.julday(start_year, 1, 1, 0.0)
+    jd_end = swe.julday(end_year + 1, 1, 1, 0.0)
+    jds = np.arange(jd_start, jd_end + GRID_STEP, GRID_STEP)
+
+    names = list(BODY_IDS)
+    samples = sample_positions(names, jds)
+    longitudes = samples['longitude']
+
+    rows = []
+    for col, name in enumerate(names):
+        rows.extend(_ingresses(name, jds, longitudes[:, col]))
+    rows.extend(_lunations(jds, longitudes[:, names.index('Sun')], longitudes[:, names.index('Moon')]))
+
+    table = np.array(rows, dtype=EVENT_DTYPE)
+    table = table[(table['jd'] >= jd_start) & (table['jd'] < jd_end)]
+    return np.sort(table, order='jd')
+
+
+def build_sky_calendar(
+    start_year: int = DEFAULT_START_YEAR,
+    end_year: int = DEFAULT_END_YEAR,
+    path: Union[str, Path] = DEFAULT_CALENDAR_PATH
+) -> 'SkyCalendar':
+    """
+    Compute the events of a span of years and write the calendar file.
+
+    Args:
+        start_year: First covered year
+        end_year: Last covered year (included)
+        path: Output file (default ephemeris/sky_calendar.bin)
+
+    Returns:
+        SkyCalendar over the written file
+    """
+    if end_year < start_year:
+        raise ValueError("End year must not be before start year")
+
+    table = calculate_sky_events(start_year, end_year)
+    jd_start = swe.julday(start_year, 1, 1, 0.0)
+    jd_end = swe.julday(end_year + 1, 1, 1, 0.0)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(table), jd_start, jd_end))
+        f.write(table.tobytes())
+    temp_path.replace(path)
+
+    _calendars.pop(str(path), None)
+    return SkyCalendar.load(path)
+
+
+class SkyCalendar:
+    """Time-sorted ingress and lunation table (memory-mapped from disk, or built in memory)."""
+
+    def __init__(self, table: np.ndarray, jd_start: float, jd_end: float, path: Optional[Path] = None):
+        """
+        Args:
+            table: EVENT_DTYPE rows sorted by 'jd'
+            jd_start: Start of the computed span
+            jd_end: End of the computed span (exclusive)
+            path: Backing file, if any
+        """
+        self.table = table
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self.path = path
+        self._jds = np.asarray(table['jd'])
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_CALENDAR_PATH) -> 'SkyCalendar':
+        """Memory-map a calendar file written by build_sky_calendar."""
+        path = Path(path)
+        with open(path, 'rb') as f:
+            header = f.read(struct.calcsize(HEADER_FORMAT))
+        magic, version, count, jd_start, jd_end = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a sky calendar file: {path}")
+
+        table = np.memmap(path, dtype=EVENT_DTYPE, mode='r',
+                          offset=struct.calcsize(HEADER_FORMAT), shape=(count,))
+        return cls(table, jd_start, jd_end, path)
+
+    @classmethod
+    def for_years(cls, start_year: int, end_year: int) -> 'SkyCalendar':
+        """Calendar computed in memory (not written to disk)."""
+        return cls(
+            calculate_sky_events(start_year, end_year),
+            swe.julday(start_year, 1, 1, 0.0),
+            swe.julday(end_year + 1, 1, 1, 0.0)
+        )
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def covers(self, jd_start: float, jd_end: float) -> bool:
+        return self.jd_start <= jd_start and jd_end <= self.jd_end
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        row = self.table[i]
+        jd = float(row['jd'])
+        longitude = float(row['longitude'])
+        dt = jd_to_datetime(jd)
+        record = {
+            'kind': KINDS[int(row['kind'])],
+            'date': dt.strftime('%Y-%m-%d'),
+            'time': dt.strftime('%Y-%m-%d %H:%M'),
+            'jd': jd,
+        }
+        if row['kind'] == 0:
+            record.update({
+                'planet': BODY_NAMES[int(row['body'])],
+                'sign': SIGNS[int(row['value'])],
+                'retrograde': bool(row['retrograde']),
+            })
+        else:
+            record.update({
+                'phase': PHASES[int(row['value'])],
+                'sign': SIGNS[int(longitude / 30) % 12],
+                'degree': longitude % 30,
+            })
+        return record
+
+    def _window(self, jd_start: float, jd_end: float) -> range:
+        first = int(np.searchsorted(self._jds, jd_start, side='left'))
+        last = int(np.searchsorted(self._jds, jd_end, side='right'))
+        return range(first, last)
+
+    def events(self, jd_start: float, jd_end: float) -> Iterator[Dict[str, Any]]:
+        """Every ingress and lunation in [jd_start, jd_end], chronological."""
+        for i in self._window(jd_start, jd_end):
+            yield self._record(i)
+
+    def ingresses(
+        self,
+        jd_start: float,
+        jd_end: float,
+        planets: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Sign ingresses in [jd_start, jd_end], optionally for some planets only."""
+        wanted = {BODY_IDS[p] for p in planets} if planets is not None else None
+        window = self._window(jd_start, jd_end)
+        rows = self.table[window.start:window.stop]
+        mask = rows['kind'] == 0
+        if wanted is not None:
+            mask &= np.isin(rows['body'], list(wanted))
+        for offset in np.flatnonzero(mask).tolist():
+            yield self._record(window.start + offset)
+
+    def lunations(
+        self,
+        jd_start: float,
+        jd_end: float,
+        phases: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Lunation phases in [jd_start, jd_end] (default all four)."""
+        wanted = [PHASES.index(p) for p in phases] if phases is not None else list(range(len(PHASES)))
+        window = self._window(jd_start, jd_end)
+        rows = self.table[window.start:window.stop]
+        mask = (rows['kind'] == 1) & np.isin(rows['value'], wanted)
+        for offset in np.flatnonzero(mask).tolist():
+            yield self._record(window.start + offset)
+
+
+def get_sky_calendar(start_date: str, end_date: str, path: Union[str, Path] = DEFAULT_CALENDAR_PATH) -> SkyCalendar:
+    """
+    Sky calendar covering a date range.
+
+    Uses the calendar file when it covers the range; otherwise computes the
+    range's years (plus a year each side) in memory - see get_cached_span.
+    Calendars are kept for the life of the process.
+    """
+    return get_cached_span(SkyCalendar, DEFAULT_CALENDAR_PATH, start_date, end_date, _calendars, path)
+
+
+def format_events(events: List[Dict[str, Any]]) -> str:
+    """Format calendar events for display."""
+    output = []
+    output.append(f"\n{'='*80}")
+    output.append(f"INGRESSES AND LUNATIONS ({len(events)})")
+    output.append(f"{'='*80}")
+    for event in events:
+        if event['kind'] == 'ingress':
+            retro = " (R)" if event['retrograde'] else ""
+            output.append(f"{event['time']} UT  {event['planet']:8} enters {event['sign']}{retro}")
+        else:
+            label = event['phase'].replace('_', ' ').title()
+            output.append(f"{event['time']} UT  {label:14} at {event['degree']:5.2f}° {event['sign']}")
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the ingress and lunation calendar')
+    parser.add_argument('--build', action='store_true', help='Compute events and write the calendar file')
+    parser.add_argument('--start-year', type=int, default=DEFAULT_START_YEAR, help='First year for --build')
+    parser.add_argument('--end-year', type=int, default=DEFAULT_END_YEAR, help='Last year for --build')
+    parser.add_argument('--start-date', help='Window start (YYYY-MM-DD)')
+    parser.add_argument('--end-date', help='Window end (YYYY-MM-DD)')
+    parser.add_argument('--bodies', nargs='+', choices=list(BODY_IDS), help='Ingresses of these bodies only')
+    parser.add_argument('--no-lunations', action='store_true', help='Leave out lunations')
+    parser.add_argument('--path', default=str(DEFAULT_CALENDAR_PATH), help='Calendar file')
+
+    args = parser.parse_args()
+
+    try:
+        if args.build:
+            calendar = build_sky_calendar(args.start_year, args.end_year, args.path)
+            print(f"Wrote {len(calendar)} events ({args.start_year}-{args.end_year}) to {args.path}")
+            return
+
+        if not (args.start_date and args.end_date):
+            raise ValueError("Provide --build, or --start-date and --end-date")
+
+        calendar = get_sky_calendar(args.start_date, args.end_date, args.path)
+        jd_start = calculate_julian_day(args.start_date) - 0.5
+        jd_end = calculate_julian_day(args.end_date) + 0.5
+
+        events = list(calendar.ingresses(jd_start, jd_end, args.bodies))
+        if not args.no_lunations:
+            events.extend(calendar.lunations(jd_start, jd_end))
+        print(format_events(sorted(events, key=lambda e: e['jd'])))
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,15 +14,18 @@ Usage:
 """
 
 import argparse
+import copy
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 import swisseph as swe
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 from profile_loader import load_profile, list_profiles
+from ephemeris_sampler import sample_positions, format_samples
+from natal_target_index import is_applying, profile_index
 
 # Constants
 SIGNS = [
@@ -42,6 +45,13 @@ PLANET_NAMES = {
 
 TRADITIONAL_PLANETS = [swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN]
 
+# Newton solver: stop once a step is below ~0.01 s
+MAX_NEWTON_ITERATIONS = 8
+NEWTON_TOLERANCE = 1e-7  # days
+
+# Process-level chart cache: (profile, natal Sun, birth date, natal ASC, location) -> {age: chart}
+_solar_return_cache: Dict[tuple, Dict[int, Dict[str, Any]]] = {}
+
 
 def get_sign_from_longitude(longitude: float) -> Tuple[str, float]:
     """Convert ecliptic longitude to sign and degree within sign."""
@@ -55,10 +65,21 @@ def calculate_julian_day(year: int, month: int, day: int, hour: float) -> float:
     return swe.julday(year, month, day, hour)
 
 
+def _sun_offset(jd: float, natal_sun_longitude: float) -> Tuple[float, float]:
+    """Signed distance of the Sun past its natal longitude, and its speed."""
+    sun_pos, _ = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    diff = (sun_pos[0] - natal_sun_longitude + 180.0) % 360.0 - 180.0
+    return diff, sun_pos[3]
+
+
 def find_solar_return_moment(natal_sun_longitude: float, birth_year: int, birth_month: int, birth_day: int, return_year: int) -> float:
     """
     Find the exact moment when transiting Sun returns to natal Sun position.
 
+    Newton iteration on the Sun's longitude using its daily speed from
+    Swiss Ephemeris: the Sun moves almost uniformly over a few days, so
+    2-3 steps from the birthday reach sub-second accuracy.
+
     Args:
         natal_sun_longitude: Natal Sun's ecliptic longitude
         birth_year: Year of birth
@@ -70,55 +91,100 @@ def find_solar_return_moment(natal_sun_longitude: float, birth_year: int, birth_
         Julian Day of exact solar return
     """
     # Approximate starting point (birthday in return year, noon)
-    approx_jd = calculate_julian_day(return_year, birth_month, birth_day, 12.0)
+    jd = calculate_julian_day(return_year, birth_month, birth_day, 12.0)
 
-    # Search for exact moment (within 2 days of approximate birthday)
-    search_start = approx_jd - 2
-    search_end = approx_jd + 2
+    for _ in range(MAX_NEWTON_ITERATIONS):
+        diff, speed = _sun_offset(jd, natal_sun_longitude)
+        step = diff / speed
+        jd -= step
+        if abs(step) < NEWTON_TOLERANCE:
+            break
 
-    # Use Swiss Ephemeris to find exact position
-    # Binary search for when Sun crosses natal position
-    tolerance = 0.0001  # Very tight tolerance for accuracy
+    return jd
 
-    while search_end - search_start > tolerance:
-        mid_jd = (search_start + search_end) / 2
-        sun_pos, _ = swe.calc_ut(mid_jd, swe.SUN)
-        sun_long = sun_pos[0]
 
-        # Handle zodiac wrap-around
-        diff = sun_long - natal_sun_longitude
-        if diff > 180:
-            diff -= 360
-        elif diff < -180:
-            diff += 360
+def _cast_solar_return(
+    profile_name: str,
+    age: int,
+    return_year: int,
+    sr_jd: float,
+    planet_row: List[Dict[str, Any]],
+    lat: float,
+    lon: float,
+    location_name: str,
+    natal_asc_index: int
+) -> Dict[str, Any]:
+    """Build one solar return chart from its moment and sampled planets."""
+    # Convert JD to calendar date/time
+    cal = swe.revjul(sr_jd)
+    sr_year, sr_month, sr_day, sr_hour = cal[0], cal[1], cal[2], cal[3]
 
-        if abs(diff) < 0.001:  # Close enough
-            return mid_jd
-        elif diff < 0:  # Sun hasn't reached position yet
-            search_start = mid_jd
-        else:  # Sun has passed position
-            search_end = mid_jd
+    sr_datetime = datetime(sr_year, sr_month, sr_day, int(sr_hour), int((sr_hour % 1) * 60))
 
-    return (search_start + search_end) / 2
+    # Calculate Ascendant and MC for solar return
+    houses = swe.houses(sr_jd, lat, lon, b'W')  # Whole sign houses
+    asc_longitude = houses[1][0]  # Ascendant
+    mc_longitude = houses[1][1]   # MC
 
+    asc_sign, asc_degree = get_sign_from_longitude(asc_longitude)
+    mc_sign, mc_degree = get_sign_from_longitude(mc_longitude)
 
-def calculate_solar_return_chart(
+    asc_sign_index = SIGNS.index(asc_sign)
+
+    sr_planets = planet_row
+    for planet in sr_planets:
+        planet_sign_index = SIGNS.index(planet['sign'])
+
+        # Determine house (whole sign from SR Ascendant) and natal house placement
+        planet['sr_house'] = ((planet_sign_index - asc_sign_index) % 12) + 1
+        planet['natal_house'] = ((planet_sign_index - natal_asc_index) % 12) + 1
+
+    return {
+        'profile': profile_name,
+        'age': age,
+        'return_year': return_year,
+        'sr_datetime': sr_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+        'location': location_name,
+        'latitude': lat,
+        'longitude': lon,
+        'ascendant': {
+            'sign': asc_sign,
+            'degree': asc_degree,
+            'dms': f"{int(asc_degree)}°{int((asc_degree % 1) * 60)}'{int(((asc_degree * 60) % 1) * 60)}\"",
+            'longitude': asc_longitude
+        },
+        'midheaven': {
+            'sign': mc_sign,
+            'degree': mc_degree,
+            'dms': f"{int(mc_degree)}°{int((mc_degree % 1) * 60)}'{int(((mc_degree * 60) % 1) * 60)}\"",
+            'longitude': mc_longitude
+        },
+        'planets': sr_planets,
+    }
+
+
+def calculate_solar_returns_range(
     profile_name: str,
-    age: Optional[int] = None,
-    year: Optional[int] = None,
+    ages: Iterable[int],
     location: Optional[Dict[str, float]] = None
-) -> Dict[str, Any]:
+) -> Dict[int, Dict[str, Any]]:
     """
-    Calculate solar return chart for given age or year.
+    Calculate solar return charts for many ages in one pass.
+
+    The profile is loaded once, every return moment is solved first and
+    all planet positions are then sampled in a single batch. Charts are
+    memoized per profile, natal Sun, birth date and location, so repeated
+    calls (e.g. a life arc after a single-age lookup) only compute the
+    ages not seen before.
 
     Args:
         profile_name: Profile to use
-        age: Age for solar return (e.g., 36 for 36th birthday)
-        year: Calendar year for solar return (alternative to age)
+        ages: Ages to cast (e.g. range(0, 101))
         location: Optional dict with 'latitude', 'longitude' for relocation
 
     Returns:
-        Dictionary with solar return chart data
+        {age: solar return chart} in the same format as
+        calculate_solar_return_chart
     """
     profile = load_profile(profile_name)
     birth_data = profile.get_birth_data()
@@ -128,28 +194,7 @@ def calculate_solar_return_chart(
     natal_sun = next(p for p in natal_planets if p['name'] == 'Sun')
     natal_sun_longitude = natal_sun['longitude']
 
-    # Determine return year
-    birth_date_parts = birth_data['date'].split('-')
-    birth_year = int(birth_date_parts[0])
-    birth_month = int(birth_date_parts[1])
-    birth_day = int(birth_date_parts[2])
-
-    if year is not None:
-        return_year = year
-        age = year - birth_year
-    elif age is not None:
-        return_year = birth_year + age
-    else:
-        raise ValueError("Must provide either age or year")
-
-    # Find exact solar return moment
-    sr_jd = find_solar_return_moment(natal_sun_longitude, birth_year, birth_month, birth_day, return_year)
-
-    # Convert JD to calendar date/time
-    cal = swe.revjul(sr_jd)
-    sr_year, sr_month, sr_day, sr_hour = cal[0], cal[1], cal[2], cal[3]
-
-    sr_datetime = datetime(sr_year, sr_month, sr_day, int(sr_hour), int((sr_hour % 1) * 60))
+    birth_year, birth_month, birth_day = (int(part) for part in birth_data['date'].split('-'))
 
     # Use relocation or natal location
     if location:
@@ -161,70 +206,58 @@ def calculate_solar_return_chart(
         lon = birth_data['longitude']
         location_name = birth_data['location']
 
-    # Calculate Ascendant and MC for solar return
-    houses = swe.houses(sr_jd, lat, lon, b'W')  # Whole sign houses
-    asc_longitude = houses[1][0]  # Ascendant
-    mc_longitude = houses[1][1]   # MC
+    natal_asc_sign = profile.seed_data['chart_framework']['ascendant']['sign']
+    natal_asc_index = SIGNS.index(natal_asc_sign)
 
-    asc_sign, asc_degree = get_sign_from_longitude(asc_longitude)
-    mc_sign, mc_degree = get_sign_from_longitude(mc_longitude)
+    key = (profile_name, natal_sun_longitude, birth_data['date'], natal_asc_sign, lat, lon, location_name)
+    charts = _solar_return_cache.setdefault(key, {})
 
-    # Calculate planet positions at solar return moment
-    sr_planets = []
+    ages = list(ages)
+    missing = sorted(set(age for age in ages if age not in charts))
+    if missing:
+        sr_jds = [
+            find_solar_return_moment(natal_sun_longitude, birth_year, birth_month, birth_day, birth_year + age)
+            for age in missing
+        ]
 
-    for planet_id in TRADITIONAL_PLANETS:
-        planet_name = PLANET_NAMES[planet_id]
+        # Calculate planet positions at every solar return moment at once
+        samples = sample_positions(TRADITIONAL_PLANETS, sr_jds)
+        names = [PLANET_NAMES[p] for p in TRADITIONAL_PLANETS]
+        for row, (age, sr_jd) in enumerate(zip(missing, sr_jds)):
+            charts[age] = _cast_solar_return(
+                profile_name, age, birth_year + age, sr_jd,
+                format_samples(samples, names, row=row),
+                lat, lon, location_name, natal_asc_index
+            )
 
-        position, _ = swe.calc_ut(sr_jd, planet_id)
-        longitude = position[0]
-        speed = position[3]
+    return {age: copy.deepcopy(charts[age]) for age in ages}
 
-        sign, degree = get_sign_from_longitude(longitude)
 
-        # Determine house (whole sign from SR Ascendant)
-        asc_sign_index = SIGNS.index(asc_sign)
-        planet_sign_index = SIGNS.index(sign)
-        house = ((planet_sign_index - asc_sign_index) % 12) + 1
+def calculate_solar_return_chart(
+    profile_name: str,
+    age: Optional[int] = None,
+    year: Optional[int] = None,
+    location: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
+    """
+    Calculate solar return chart for given age or year.
 
-        # Also determine natal house placement
-        natal_asc_sign = profile.seed_data['chart_framework']['ascendant']['sign']
-        natal_asc_index = SIGNS.index(natal_asc_sign)
-        natal_house = ((planet_sign_index - natal_asc_index) % 12) + 1
+    Args:
+        profile_name: Profile to use
+        age: Age for solar return (e.g., 36 for 36th birthday)
+        year: Calendar year for solar return (alternative to age)
+        location: Optional dict with 'latitude', 'longitude' for relocation
 
-        sr_planets.append({
-            'name': planet_name,
-            'longitude': longitude,
-            'sign': sign,
-            'degree': degree,
-            'dms': f"{int(degree)}°{int((degree % 1) * 60)}'{int(((degree * 60) % 1) * 60)}\"",
-            'sr_house': house,
-            'natal_house': natal_house,
-            'speed': speed,
-            'retrograde': speed < 0
-        })
+    Returns:
+        Dictionary with solar return chart data
+    """
+    if year is not None:
+        birth_year = int(load_profile(profile_name).get_birth_data()['date'].split('-')[0])
+        age = year - birth_year
+    elif age is None:
+        raise ValueError("Must provide either age or year")
 
-    return {
-        'profile': profile_name,
-        'age': age,
-        'return_year': return_year,
-        'sr_datetime': sr_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-        'location': location_name,
-        'latitude': lat,
-        'longitude': lon,
-        'ascendant': {
-            'sign': asc_sign,
-            'degree': asc_degree,
-            'dms': f"{int(asc_degree)}°{int((asc_degree % 1) * 60)}'{int(((asc_degree * 60) % 1) * 60)}\"",
-            'longitude': asc_longitude
-        },
-        'midheaven': {
-            'sign': mc_sign,
-            'degree': mc_degree,
-            'dms': f"{int(mc_degree)}°{int((mc_degree % 1) * 60)}'{int(((mc_degree * 60) % 1) * 60)}\"",
-            'longitude': mc_longitude
-        },
-        'planets': sr_planets,
-    }
+    return calculate_solar_returns_range(profile_name, [age], location=location)[age]
 
 
 def find_sr_to_natal_aspects(sr_chart: Dict[str, Any], profile_name: str, orb: float = 3.0) -> List[Dict[str, Any]]:
@@ -240,38 +273,26 @@ def find_sr_to_natal_aspects(sr_chart: Dict[str, Any], profile_name: str, orb: f
         List of aspect dictionaries
     """
     profile = load_profile(profile_name)
-    aspects = []
 
-    aspect_angles = {
-        'conjunction': 0,
-        'sextile': 60,
-        'square': 90,
-        'trine': 120,
-        'opposition': 180
-    }
+    # Every SR planet against the natal aspect points in one batched query
+    index = profile_index(profile, traditional_only=True)
+    sr_planets = sr_chart['planets']
+    hits = index.query_many([p['longitude'] for p in sr_planets], orb)
 
-    # Get natal planets
-    natal_planets = {p['name']: p['longitude'] for p in profile.get_planets(traditional_only=True)}
-
-    # Check each SR planet against each natal planet
-    for sr_planet in sr_chart['planets']:
-        for natal_name, natal_long in natal_planets.items():
-            # Calculate angular distance
-            diff = abs(sr_planet['longitude'] - natal_long)
-            if diff > 180:
-                diff = 360 - diff
-
-            # Check each aspect type
-            for aspect_name, aspect_angle in aspect_angles.items():
-                orb_diff = abs(diff - aspect_angle)
-
-                if orb_diff <= orb:
-                    aspects.append({
-                        'sr_planet': sr_planet['name'],
-                        'natal_planet': natal_name,
-                        'aspect_type': aspect_name,
-                        'orb': orb_diff,
-                    })
+    aspects = []
+    for sr_order, (sr_planet, planet_hits) in enumerate(zip(sr_planets, hits)):
+        for entry, distance in planet_hits:
+            aspects.append(((sr_order,) + entry['order'], {
+                'sr_planet': sr_planet['name'],
+                'natal_planet': entry['natal_planet'],
+                'aspect_type': entry['aspect_type'],
+                'orb': distance,
+                'applying': is_applying(sr_planet['longitude'], entry['target'], sr_planet['speed']),
+            }))
+
+    # SR planet, then natal planet, then aspect order
+    aspects.sort(key=lambda hit: hit[0])
+    aspects = [aspect for _, aspect in aspects]
 
     return aspects
 
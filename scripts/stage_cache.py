@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Stage Cache
+Content-addressed cache for the intermediate stages of a long calculation.
+
+Each stage result is stored under the SHA-256 of the stage name and its
+inputs: the profile's seed data hash, age range, settings, the keys of the
+stages it was computed from, and a fingerprint of the source files that
+compute it. Changing any input changes the key, so nothing has to be
+invalidated by hand - stale entries are simply never asked for again, and
+editing a calculator's code re-runs only the stages it feeds.
+
+Results are kept pickled, in memory and optionally on disk (one file per
+key, written atomically), so every hit returns a private copy the caller may
+modify freely.
+
+Usage:
+    python stage_cache.py --dir profiles/darren/cache/life_arc            # Show entries
+    python stage_cache.py --dir profiles/darren/cache/life_arc --clear    # Delete entries
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
+
+# Constants
+MAX_MEMORY_ENTRIES = 512
+CACHE_SUFFIX = '.stage'
+
+_file_hashes = {}
+_source_hashes = {}
+
+
+def file_fingerprint(path: Union[str, Path]) -> Optional[str]:
+    """SHA-256 of a file's contents (memoized on mtime and size), or None if missing."""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    stamp = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if stamp not in _file_hashes:
+        _file_hashes[stamp] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _file_hashes[stamp]
+
+
+def code_fingerprint(*objects) -> str:
+    """
+    Combined fingerprint of the source code of modules and functions.
+
+    Modules are hashed by file, functions by their own source only, so editing
+    one function in a module leaves stages computed by its neighbours valid.
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        if inspect.ismodule(obj):
+            digest.update(str(file_fingerprint(obj.__file__)).encode('ascii'))
+        else:
+            stamp = (obj.__module__, obj.__qualname__, file_fingerprint(inspect.getsourcefile(obj)))
+            if stamp not in _source_hashes:
+                _source_hashes[stamp] = hashlib.sha256(inspect.getsource(obj).encode('utf-8')).hexdigest()
+            digest.update(_source_hashes[stamp].encode('ascii'))
+    return digest.hexdigest()
+
+
+class StageCache:
+    """Pickled stage results keyed by a hash of their inputs (memory + optional disk)."""
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, max_memory_entries: int = MAX_MEMORY_ENTRIES):
+        """
+        Args:
+            directory: Directory for persistent entries (None = memory only)
+            max_memory_entries: Entries kept in memory (least recently used dropped first)
+        """
+        self.directory = Path(directory) if directory else None
+        self.max_memory_entries = max_memory_entries
+        self._memory = OrderedDict()
+        self.stats = {}
+
+    @staticmethod
+    def key(stage: str, inputs: Dict[str, Any]) -> str:
+        """Content address of a stage: SHA-256 of its name and canonical JSON inputs."""
+        payload = json.dumps({'stage': stage, 'inputs': inputs}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.directory / f"{stage}-{key}{CACHE_SUFFIX}"
+
+    def _remember(self, key: str, blob: bytes):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, stage: str, key: str) -> Optional[bytes]:
+        blob = self._memory.get(key)
+        if blob is not None:
+            self._memory.move_to_end(key)
+            return blob
+        if self.directory is None:
+            return None
+        try:
+            blob = self._path(stage, key).read_bytes()
+        except OSError:
+            return None
+        self._remember(key, blob)
+        return blob
+
+    def _store(self, stage: str, key: str, blob: bytes):
+        self._remember(key, blob)
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(stage, key)
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            temp_path.write_bytes(blob)
+            temp_path.replace(path)
+        except OSError:
+            # Read-only location: keep the in-memory entry only
+            pass
+
+    def contains(self, stage: str, inputs: Dict[str, Any]) -> bool:
+        """True if a result for these inputs is stored (in memory or on disk)."""
+        key = self.key(stage, inputs)
+        if key in self._memory:
+            return True
+        return self.directory is not None and self._path(stage, key).exists()
+
+    def get_or_compute(self, stage: str, inputs: Dict[str, Any], compute: Callable[[], Any]) -> Tuple[str, Any]:
+        """
+        Return a stage result, computing and storing it on a miss.
+
+        Args:
+            stage: Stage name (also used in the on-disk file name)
+            inputs: JSON-serializable description of everything the result depends on
+            compute: Zero-argument function producing the result
+
+        Returns:
+            (key, result) - pass the key on as an input of dependent stages
+        """
+        key = self.key(stage, inputs)
+        counts = self.stats.setdefault(stage, {'hits': 0, 'misses': 0})
+
+        blob = self._load(stage, key)
+        if blob is not None:
+            try:
+                result = pickle.loads(blob)
+                counts['hits'] += 1
+                return key, result
+            except Exception:
+                # Truncated or incompatible entry: recompute below
+                pass
+
+        counts['misses'] += 1
+        result = compute()
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self._store(stage, key, blob)
+        # Hand back a copy, exactly as a later hit would
+        return key, pickle.loads(blob)
+
+    def clear(self):
+        """Drop every entry, in memory and on disk."""
+        self._memory.clear()
+        for path in self.entries():
+            path.unlink(missing_ok=True)
+
+    def entries(self) -> List[Path]:
+        """On-disk entry files (empty for memory-only caches)."""
+        if self.directory is None or not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(f"*{CACHE_SUFFIX}"))
+
+
+def format_stats(stats: Dict[str, Dict[str, int]]) -> str:
+    """Format per-stage hit/miss counters for display."""
+    lines = []
+    for stage, counts in stats.items():
+        lines.append(f"  {stage:28} {counts['hits']:5} hit(s) {counts['misses']:5} miss(es)")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or clear a stage cache directory')
+    parser.add_argument('--dir', required=True, help='Stage cache directory')
+    parser.add_argument('--clear', action='store_true', help='Delete all entries')
+
+    args = parser.parse_args()
+
+    try:
+        cache = StageCache(args.dir)
+        entries = cache.entries()
+
+        if args.clear:
+            cache.clear()
+            print(f"Deleted {len(entries)} entries from {args.dir}")
+            return
+
+        by_stage = {}
+        for path in entries:
+            stage = path.name.rsplit('-', 1)[0]
+            count, size = by_stage.get(stage, (0, 0))
+            by_stage[stage] = (count + 1, size + path.stat().st_size)
+
+        print(f"\nStage cache: {args.dir} ({len(entries)} entries)")
+        for stage, (count, size) in sorted(by_stage.items()):
+            print(f"  {stage:28} {count:5} entries {size / 1024:10.1f} KB")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
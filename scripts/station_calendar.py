@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Station Calendar
+Every planetary station and retrograde shadow in a span of years, computed once.
+
+For each retrograde of Mercury through Pluto the calendar holds:
+
+    - Pre-shadow start:  the planet first reaches the degree where it will station direct
+    - Station retrograde (exact time, root-found on speed)
+    - Station direct     (exact time)
+    - Post-shadow end:   the planet clears the degree where it stationed retrograde
+
+The calendar depends only on the dates, never on a profile, so one calendar
+serves every profile in a batch. It is built for whole calendar years (one
+year of margin on each side, so shadows overlapping the span are complete)
+and kept in memory and on disk (ephemeris/station_cache, see stage_cache.py).
+Lookups - the retrograde phase of a planet at a moment, the stations in a
+window - are binary searches.
+
+Usage:
+    python station_calendar.py --start-date 2025-10-01 --end-date 2026-01-01
+    python station_calendar.py --start-date 2025-01-01 --end-date 2026-12-31 --planets Mercury Mars
+    python station_calendar.py --date 2025-11-15
+"""
+
+import argparse
+import sys
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+import swisseph as swe
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+from aspect_solver import BodyTrack, SCAN_STEPS, find_root, jd_to_datetime
+from ephemeris_cache import EPHEMERIS_DIR
+from ephemeris_sampler import SIGNS
+from stage_cache import StageCache, code_fingerprint
+from transits import calculate_julian_day
+
+# Constants
+RETROGRADE_PLANETS = ['Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
+
+DEFAULT_CACHE_DIR = EPHEMERIS_DIR / 'station_cache'
+
+# Years computed on each side of the requested span (a Pluto retrograde plus
+# its shadows lasts about 11 months)
+MARGIN_YEARS = 1
+
+# Longest search for a shadow boundary, in days from its station
+MAX_SHADOW_DAYS = 400
+
+_calendars = {}
+
+
+def _moment(jd: float) -> Dict[str, Any]:
+    dt = jd_to_datetime(jd)
+    return {'jd': jd, 'date': dt.strftime('%Y-%m-%d'), 'time': dt.strftime('%Y-%m-%d %H:%M')}
+
+
+def _position(longitude: float) -> Dict[str, Any]:
+    longitude %= 360
+    return {'longitude': longitude, 'sign': SIGNS[int(longitude / 30) % 12], 'degree': longitude % 30}
+
+
+def find_stations(planet_name: str, jd_start: float, jd_end: float) -> List[Dict[str, Any]]:
+    """
+    Every station of a planet between two Julian Days.
+
+    Steps through the span in SCAN_STEPS (shorter than any retrograde or direct
+    run) and root-finds each change of sign in speed.
+
+    Returns:
+        Chronological list of {'jd', 'motion': 'retrograde'/'direct', 'longitude'}
+    """
+    track = BodyTrack(planet_name, 0.0)
+    step = SCAN_STEPS.get(planet_name, 5.0)
+    stations = []
+
+    prev_jd, prev_speed = jd_start, track.speed(jd_start)
+    while prev_jd < jd_end:
+        jd = min(prev_jd + step, jd_end)
+        speed = track.speed(jd)
+        if (prev_speed > 0) != (speed > 0):
+            station_jd = find_root(track.speed, prev_jd, jd, prev_speed, speed)
+            stations.append({
+                'jd': station_jd,
+                'motion': 'retrograde' if prev_speed > 0 else 'direct',
+                'longitude': track.separation(station_jd) % 360,
+            })
+        prev_jd, prev_speed = jd, speed
+
+    return stations
+
+
+def _shadow_crossing(planet_name: str, longitude: float, jd_from: float, direction: int) -> Optional[float]:
+    """
+    Moment the planet, in direct motion, passes a longitude: searching backward
+    from the retrograde station (pre-shadow) or forward from the direct station
+    (post-shadow). None if it lies beyond MAX_SHADOW_DAYS.
+    """
+    track = BodyTrack(planet_name, longitude)
+    step = SCAN_STEPS.get(planet_name, 5.0)
+    prev_jd, prev_sep = jd_from, track.separation(jd_from)
+
+    while abs(prev_jd - jd_from) < MAX_SHADOW_DAYS:
+        jd = prev_jd + direction * step
+        sep = track.separation(jd)
+        # Direct motion carries the planet from behind the longitude (< 0) to past it (> 0)
+        if (prev_sep > 0) != (sep > 0) and abs(sep - prev_sep) < 180:
+            return find_root(track.separation, prev_jd, jd, prev_sep, sep)
+        prev_jd, prev_sep = jd, sep
+
+    return None
+
+
+def calculate_retrograde_periods(planet_name: str, jd_start: float, jd_end: float) -> List[Dict[str, Any]]:
+    """
+    Retrograde periods (with shadows) whose retrograde station falls in [jd_start, jd_end).
+
+    Returns:
+        Chronological list of {
+            'planet',
+            'pre_shadow_start': {'jd', 'date', 'time'} or None,
+            'station_retrograde': {'jd', 'date', 'time', 'longitude', 'sign', 'degree'},
+            'station_direct': {...},
+            'post_shadow_end': {'jd', 'date', 'time'} or None
+        }
+    """
+    # Search far enough past the end for the last direct station
+    stations = find_stations(planet_name, jd_start, jd_end + MAX_SHADOW_DAYS)
+
+    periods = []
+    for retro, direct in zip(stations, stations[1:]):
+        if retro['motion'] != 'retrograde' or retro['jd'] >= jd_end:
+            continue
+        pre_jd = _shadow_crossing(planet_name, direct['longitude'], retro['jd'], -1)
+        post_jd = _shadow_crossing(planet_name, retro['longitude'], direct['jd'], 1)
+        periods.append({
+            'planet': planet_name,
+            'pre_shadow_start': _moment(pre_jd) if pre_jd is not None else None,
+            'station_retrograde': {**_moment(retro['jd']), **_position(retro['longitude'])},
+            'station_direct': {**_moment(direct['jd']), **_position(direct['longitude'])},
+            'post_shadow_end': _moment(post_jd) if post_jd is not None else None,
+        })
+
+    return periods
+
+
+def calculate_station_calendar(start_year: int, end_year: int) -> Dict[str, Any]:
+    """
+    Retrograde periods of every planet with a retrograde station in the given years.
+
+    Returns:
+        {'start_year', 'end_year', 'periods': {planet: [period, ...]}}
+    """
+    jd_start = swe.julday(start_year, 1, 1, 0.0)
+    jd_end = swe.julday(end_year + 1, 1, 1, 0.0)
+    return {
+        'start_year': start_year,
+        'end_year': end_year,
+        'periods': {planet: calculate_retrograde_periods(planet, jd_start, jd_end) for planet in RETROGRADE_PLANETS},
+    }
+
+
+def _period_bounds(period: Dict[str, Any]) -> Tuple[float, float]:
+    """(first, last) Julian Day of a retrograde period, shadows included."""
+    first = (period['pre_shadow_start'] or period['station_retrograde'])['jd']
+    last = (period['post_shadow_end'] or period['station_direct'])['jd']
+    return first, last
+
+
+class StationCalendar:
+    """Binary-search lookups over the retrograde periods of a station calendar."""
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Args:
+            data: calculate_station_calendar result
+        """
+        self.start_year = data['start_year']
+        self.end_year = data['end_year']
+        self.periods = data['periods']
+
+        # Period start (pre-shadow, or the station if no shadow was found) per planet.
+        # Shadows of the slow planets overlap the next retrograde's, so each
+        # period keeps its own span instead of one merged phase timeline.
+        self._starts = {
+            planet: [_period_bounds(period)[0] for period in periods]
+            for planet, periods in self.periods.items()
+        }
+
+    def covers(self, jd_start: float, jd_end: float) -> bool:
+        """True if the calendar's years contain [jd_start, jd_end]."""
+        return (swe.julday(self.start_year, 1, 1, 0.0) <= jd_start
+                and jd_end < swe.julday(self.end_year + 1, 1, 1, 0.0))
+
+    def phase(self, planet_name: str, jd: float) -> Optional[str]:
+        """
+        Retrograde phase of a planet at a moment.
+
+        Returns:
+            'pre_shadow', 'retrograde', 'post_shadow', or None (direct, outside
+            any shadow - and always None for the Sun and Moon). Where one
+            period's post-shadow overlaps the next one's pre-shadow (the slow
+            planets), the later period's phase is returned.
+        """
+        if planet_name not in self._starts:
+            return None
+        periods = self.periods[planet_name]
+        i = bisect_right(self._starts[planet_name], jd) - 1
+
+        # Only the latest period to begin, or the one before it, can contain jd
+        for period in periods[max(i - 1, 0):i + 1][::-1]:
+            first, last = _period_bounds(period)
+            if first <= jd <= last:
+                if jd < period['station_retrograde']['jd']:
+                    return 'pre_shadow'
+                if jd < period['station_direct']['jd']:
+                    return 'retrograde'
+                return 'post_shadow'
+        return None
+
+    def retrograde_periods(
+        self,
+        jd_start: float,
+        jd_end: float,
+        planets: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrograde periods whose shadow-to-shadow span overlaps [jd_start, jd_end], by start."""
+        overlapping = []
+        for planet in planets or RETROGRADE_PLANETS:
+            for period in self.periods.get(planet, []):
+                first, last = _period_bounds(period)
+                if first <= jd_end and last >= jd_start:
+                    overlapping.append(period)
+        return sorted(overlapping, key=lambda p: _period_bounds(p)[0])
+
+    def stations(
+        self,
+        jd_start: float,
+        jd_end: float,
+        planets: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Stations in [jd_start, jd_end], chronological: {'planet', 'motion', 'jd', 'date', 'time', 'sign', ...}."""
+        found = []
+        for planet in planets or RETROGRADE_PLANETS:
+            for period in self.periods.get(planet, []):
+                for key, motion in (('station_retrograde', 'retrograde'), ('station_direct', 'direct')):
+                    station = period[key]
+                    if jd_start <= station['jd'] <= jd_end:
+                        found.append({'planet': planet, 'motion': motion, **station})
+        return sorted(found, key=lambda s: s['jd'])
+
+    def report(self, start_date: str, end_date: str, planets: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Stations and retrograde periods touching a report's date range (JSON-ready)."""
+        jd_start = calculate_julian_day(start_date) - 0.5
+        jd_end = calculate_julian_day(end_date) + 0.5
+        return {
+            'stations': self.stations(jd_start, jd_end, planets),
+            'retrograde_periods': self.retrograde_periods(jd_start, jd_end, planets),
+        }
+
+
+def get_station_calendar(
+    start_date: str,
+    end_date: str,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> StationCalendar:
+    """
+    Station calendar covering a date range, computed once per span of years.
+
+    Calendars are kept for the life of the process and on disk in cache_dir
+    (None = memory only), keyed by their years and this module's code.
+
+    Args:
+        start_date: First date (YYYY-MM-DD)
+        end_date: Last date (YYYY-MM-DD)
+        cache_dir: Directory for persistent calendars
+
+    Returns:
+        StationCalendar for the years of the range plus MARGIN_YEARS on each side
+    """
+    start_year = datetime.strptime(start_date, '%Y-%m-%d').year - MARGIN_YEARS
+    end_year = datetime.strptime(end_date, '%Y-%m-%d').year + MARGIN_YEARS
+
+    # A calendar already loaded for a wider span serves narrower ones too
+    for (first, last), calendar in _calendars.items():
+        if first <= start_year and end_year <= last:
+            return calendar
+
+    cache = StageCache(cache_dir)
+    inputs = {
+        'start_year': start_year,
+        'end_year': end_year,
+        'code': code_fingerprint(sys.modules[__name__], sys.modules[BodyTrack.__module__]),
+    }
+    _, data = cache.get_or_compute(
+        'stations', inputs, lambda: calculate_station_calendar(start_year, end_year)
+    )
+    calendar = StationCalendar(data)
+    _calendars[(start_year, end_year)] = calendar
+    return calendar
+
+
+def format_calendar(report: Dict[str, Any]) -> str:
+    """Format a StationCalendar.report result for display."""
+    output = []
+    output.append(f"\n{'='*80}")
+    output.append("RETROGRADE PERIODS")
+    output.append(f"{'='*80}")
+
+    def when(moment: Optional[Dict[str, Any]]) -> str:
+        return moment['time'] if moment else '(beyond search)'
+
+    for period in report['retrograde_periods']:
+        retro = period['station_retrograde']
+        direct = period['station_direct']
+        output.append(f"\n{period['planet']}")
+        output.append(f"  Pre-shadow:   {when(period['pre_shadow_start'])} UT")
+        output.append(f"  Stations R:   {retro['time']} UT at {retro['degree']:.2f}° {retro['sign']}")
+        output.append(f"  Stations D:   {direct['time']} UT at {direct['degree']:.2f}° {direct['sign']}")
+        output.append(f"  Post-shadow:  {when(period['post_shadow_end'])} UT")
+
+    output.append(f"\n{len(report['stations'])} station(s) in range")
+    return "\n".join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calculate planetary stations and retrograde shadows')
+    parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
+    parser.add_argument('--date', help='Show every planet\'s retrograde phase on this date (YYYY-MM-DD)')
+    parser.add_argument('--planets', nargs='+', choices=RETROGRADE_PLANETS, help='Limit to these planets')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the disk cache')
+
+    args = parser.parse_args()
+
+    try:
+        cache_dir = None if args.no_cache else DEFAULT_CACHE_DIR
+
+        if args.date:
+            calendar = get_station_calendar(args.date, args.date, cache_dir)
+            jd = calculate_julian_day(args.date)
+            print(f"\nRetrograde phases on {args.date}:")
+            for planet in args.planets or RETROGRADE_PLANETS:
+                print(f"  {planet:10} {calendar.phase(planet, jd) or 'direct'}")
+            return
+
+        if not (args.start_date and args.end_date):
+            raise ValueError("Provide --start-date and --end-date, or --date")
+
+        calendar = get_station_calendar(args.start_date, args.end_date, cache_dir)
+        print(format_calendar(calendar.report(args.start_date, args.end_date, args.planets)))
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Time Lord Index
+Bisect-based lookup over zodiacal releasing, firdaria and profection periods.
+
+Each time-lord level is a run of consecutive periods in age order, so a
+sorted array of start ages answers every question with a binary search:
+
+    - Point queries:  what is active at age 37.42 (every level at once)
+    - Range queries:  all L2 periods that begin between ages 30 and 45
+    - Boundaries:     every period change in an age window, merged across levels
+
+The index is built once per profile or timeline (the L3 lists alone hold
+thousands of periods per lot) instead of scanning the period lists for every
+age that is looked up.
+
+Series names:
+    fortune_l1, fortune_l2, fortune_l3, spirit_l1, spirit_l2, spirit_l3,
+    firdaria_major, firdaria_sub, profection
+
+Usage:
+    python time_lord_index.py --profile darren --age 37.42
+    python time_lord_index.py --profile darren --range 30 45 --series fortune_l2 spirit_l2
+"""
+
+import argparse
+import heapq
+import sys
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Constants
+ZR_LEVELS = ('l1', 'l2', 'l3')
+SERIES_ORDER = (
+    'fortune_l1', 'fortune_l2', 'fortune_l3',
+    'spirit_l1', 'spirit_l2', 'spirit_l3',
+    'firdaria_major', 'firdaria_sub',
+    'profection',
+)
+
+# Number of timelines whose index is kept by get_timeline_index
+MAX_CACHED_TIMELINES = 8
+
+_timeline_indexes = OrderedDict()
+
+
+class PeriodIndex:
+    """
+    Periods of a single time-lord level, sorted by start age.
+
+    Periods are expected to run in sequence, but may overlap slightly where
+    rounding meets a parent boundary (L3 periods at the end of an L2). Lookups
+    then return the earliest matching period, exactly as a linear scan would.
+    """
+
+    def __init__(
+        self,
+        periods: List[Dict[str, Any]],
+        starts: Optional[List[float]] = None,
+        ends: Optional[List[float]] = None
+    ):
+        """
+        Args:
+            periods: Period dicts (any order)
+            starts: Start ages (default: each period's 'start_age')
+            ends: End ages, exclusive (default: each period's 'end_age')
+        """
+        if starts is None:
+            starts = [p['start_age'] for p in periods]
+        if ends is None:
+            ends = [p['end_age'] for p in periods]
+
+        # Stable sort keeps generation order for equal starts
+        order = sorted(range(len(periods)), key=lambda i: starts[i])
+        self.periods = [periods[i] for i in order]
+        self.starts = [starts[i] for i in order]
+        self.ends = [ends[i] for i in order]
+
+        # Running maximum of end ages: sorted, and bounds how far back an overlap can reach
+        self._reach = []
+        reach = float('-inf')
+        for end in self.ends:
+            reach = max(reach, end)
+            self._reach.append(reach)
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    def at(self, age: float) -> Optional[Dict[str, Any]]:
+        """Earliest period with start_age <= age < end_age, or None."""
+        found = None
+        i = bisect_right(self.starts, age) - 1
+        while i >= 0 and self._reach[i] > age:
+            if age < self.ends[i]:
+                found = self.periods[i]
+            i -= 1
+        return found
+
+    def starting_between(self, start_age: float, end_age: float) -> List[Dict[str, Any]]:
+        """Periods that begin in [start_age, end_age), in age order."""
+        return self.periods[bisect_left(self.starts, start_age):bisect_left(self.starts, end_age)]
+
+    def overlapping(self, start_age: float, end_age: float) -> List[Dict[str, Any]]:
+        """Periods that intersect [start_age, end_age), in age order."""
+        first = bisect_right(self._reach, start_age)
+        last = bisect_left(self.starts, end_age)
+        return [self.periods[i] for i in range(first, last) if self.ends[i] > start_age]
+
+
+class TimeLordIndex:
+    """Point, range and boundary queries across every time-lord level of one chart."""
+
+    def __init__(
+        self,
+        zr_fortune: Optional[Dict[str, Any]] = None,
+        zr_spirit: Optional[Dict[str, Any]] = None,
+        firdaria: Optional[Dict[str, Any]] = None,
+        profections: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Args:
+            zr_fortune: calculate_zr_from_lot(..., 'fortune') result
+            zr_spirit: calculate_zr_from_lot(..., 'spirit') result
+            firdaria: {'sect', 'major_periods', 'sub_periods'} as in a life arc timeline
+            profections: calculate_profection_with_natal results (one per age)
+        """
+        self.series = {}
+
+        for lot, zr_data in (('fortune', zr_fortune), ('spirit', zr_spirit)):
+            if zr_data:
+                for level in ZR_LEVELS:
+                    self.series[f'{lot}_{level}'] = PeriodIndex(zr_data.get(f'{level}_periods', []))
+
+        if firdaria:
+            self.series['firdaria_major'] = PeriodIndex(firdaria.get('major_periods', []))
+            self.series['firdaria_sub'] = PeriodIndex(firdaria.get('sub_periods', []))
+
+        if profections:
+            # Each profection year runs from one birthday to the next
+            ages = [prof['profection']['age'] for prof in profections]
+            self.series['profection'] = PeriodIndex(profections, ages, [age + 1 for age in ages])
+
+    @classmethod
+    def from_timeline(cls, timeline: Dict[str, Any]) -> 'TimeLordIndex':
+        """Index a generate_life_arc_timeline result."""
+        return cls(
+            zr_fortune=timeline.get('zr_fortune'),
+            zr_spirit=timeline.get('zr_spirit'),
+            firdaria=timeline.get('firdaria'),
+            profections=timeline.get('profections'),
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.series
+
+    def _names(self, series: Optional[List[str]]) -> List[str]:
+        names = series or SERIES_ORDER
+        return [name for name in names if name in self.series]
+
+    def period(self, name: str, age: float) -> Optional[Dict[str, Any]]:
+        """Active period of one series at an age (None if not indexed or not covered)."""
+        index = self.series.get(name)
+        return index.at(age) if index else None
+
+    def active(self, age: float, series: Optional[List[str]] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Every active period at an age.
+
+        Args:
+            age: Age in years (can be decimal)
+            series: Series names to include (default: all indexed)
+
+        Returns:
+            {series_name: period or None}
+        """
+        return {name: self.series[name].at(age) for name in self._names(series)}
+
+    def changes(self, name: str, start_age: float, end_age: float) -> List[Dict[str, Any]]:
+        """Periods of one series that begin in [start_age, end_age)."""
+        index = self.series.get(name)
+        return index.starting_between(start_age, end_age) if index else []
+
+    def boundaries(
+        self,
+        start_age: float,
+        end_age: float,
+        series: Optional[List[str]] = None
+    ) -> Iterator[Tuple[float, str, Dict[str, Any]]]:
+        """
+        Every period change in [start_age, end_age), merged across series.
+
+        Yields:
+            (age, series_name, period) in age order; simultaneous changes
+            follow SERIES_ORDER (or the order given in series)
+        """
+        streams = []
+        for rank, name in enumerate(self._names(series)):
+            index = self.series[name]
+            first = bisect_left(index.starts, start_age)
+            last = bisect_left(index.starts, end_age)
+            streams.append([(index.starts[i], rank, name, i) for i in range(first, last)])
+
+        for age, _, name, i in heapq.merge(*streams):
+            yield age, name, self.series[name].periods[i]
+
+
+def get_timeline_index(timeline: Dict[str, Any]) -> TimeLordIndex:
+    """
+    TimeLordIndex for a life arc timeline, built once and reused.
+
+    Entries are matched on the identity of the timeline's period lists, so a
+    timeline whose periods are replaced gets a fresh index.
+    """
+    parts = (timeline.get('zr_fortune'), timeline.get('zr_spirit'),
+             timeline.get('firdaria'), timeline.get('profections'))
+    key = id(timeline)
+
+    cached = _timeline_indexes.get(key)
+    if cached is not None and all(a is b for a, b in zip(cached[0], parts)):
+        _timeline_indexes.move_to_end(key)
+        return cached[1]
+
+    index = TimeLordIndex.from_timeline(timeline)
+    # Holding the parts keeps their ids from being reused while cached
+    _timeline_indexes[key] = (parts, index)
+    _timeline_indexes.move_to_end(key)
+    while len(_timeline_indexes) > MAX_CACHED_TIMELINES:
+        _timeline_indexes.popitem(last=False)
+
+    return index
+
+
+def build_time_lord_index(profile_name: str, max_age: int = 100) -> TimeLordIndex:
+    """
+    Calculate and index ZR (Fortune and Spirit), firdaria and profections for a profile.
+
+    Args:
+        profile_name: Profile to load
+        max_age: Last age covered by ZR and profections
+
+    Returns:
+        TimeLordIndex
+    """
+    # Imported here: firdaria_calculator itself uses PeriodIndex
+    from profile_loader import load_profile
+    from zodiacal_releasing import calculate_zr_from_lot
+    from firdaria_calculator import calculate_major_periods, calculate_sub_periods
+    from profections_calculator import calculate_profection_with_natal
+
+    profile = load_profile(profile_name)
+    framework = profile.get_chart_framework() or {}
+    sect = framework.get('sect', {}).get('type', 'day')
+
+    major_periods = calculate_major_periods(sect)
+    sub_periods = []
+    for major in major_periods:
+        sub_periods.extend(calculate_sub_periods(major, sect))
+
+    return TimeLordIndex(
+        zr_fortune=calculate_zr_from_lot(profile_name, 'fortune', max_age=max_age),
+        zr_spirit=calculate_zr_from_lot(profile_name, 'spirit', max_age=max_age),
+        firdaria={'sect': sect, 'major_periods': major_periods, 'sub_periods': sub_periods},
+        profections=[calculate_profection_with_natal(profile_name, age) for age in range(max_age + 1)],
+    )
+
+
+def describe_period(name: str, period: Optional[Dict[str, Any]]) -> str:
+    """One-line description of a period from any series."""
+    if period is None:
+        return '—'
+    if name == 'profection':
+        prof = period['profection']
+        return f"House {prof['profected_house']} ({prof['profected_sign']}), lord {prof['lord_of_year']}"
+    if name == 'firdaria_major':
+        label = period['planet']
+    elif name == 'firdaria_sub':
+        label = period['label']
+    else:
+        label = f"{period['sign']} ({period['ruler']})"
+    return f"{label:25} ages {period['start_age']:.2f}-{period['end_age']:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Look up active time lords and period changes')
+    parser.add_argument('--profile', required=True, help='Profile name')
+    parser.add_argument('--age', type=float, help='Show every active period at this age')
+    parser.add_argument('--range', type=float, nargs=2, metavar=('START', 'END'),
+                        help='Show period changes between two ages')
+    parser.add_argument('--series', nargs='+', choices=SERIES_ORDER, help='Limit to these series')
+    parser.add_argument('--max-age', type=int, default=100, help='Last age indexed (default 100)')
+
+    args = parser.parse_args()
+
+    try:
+        if args.age is None and args.range is None:
+            raise ValueError("Provide --age or --range")
+
+        index = build_time_lord_index(args.profile, max_age=args.max_age)
+
+        if args.age is not None:
+            print(f"\nActive at age {args.age}:")
+            for name, period in index.active(args.age, args.series).items():
+                print(f"  {name:15} {describe_period(name, period)}")
+
+        if args.range is not None:
+            start_age, end_age = args.range
+            print(f"\nChanges between ages {start_age} and {end_age}:")
+            for age, name, period in index.boundaries(start_age, end_age, args.series):
+                print(f"  {age:8.2f}  {name:15} {describe_period(name, period)}")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -25,6 +25,9 @@ Usage:
 
     # Use profile default
     python transit_calculator.py --profile darren
+
+    # One record per transit episode, solved exactly instead of sampled weekly
+    python transit_calculator.py --profile darren --duration 180 --mode events
 """
 
 import argparse
@@ -42,7 +45,16 @@ from zodiacal_releasing import calculate_zr_from_lot, find_current_period
 from firdaria_calculator import calculate_major_periods, calculate_sub_periods, find_active_periods
 from solar_returns import calculate_solar_return_chart, find_sr_to_natal_aspects
 from secondary_progressions import calculate_progressed_positions, find_progressed_aspects_to_natal
-from transits import calculate_transiting_positions, find_transit_aspects_to_natal
+from transits import calculate_julian_day, PLANET_NAMES, TRADITIONAL_PLANETS, ALL_PLANETS
+from aspect_solver import (
+    ASPECT_ANGLES, BodyTrack, find_aspect_episode, find_aspect_episodes, jd_to_datetime, nearest_aspect_target
+)
+from ephemeris_sampler import SIGNS, sample_positions, format_samples
+from natal_target_index import NatalTargetIndex, is_applying
+from daily_scores import accumulate_daily_scores, analyze_daily_scores
+from station_calendar import StationCalendar, get_station_calendar
+from eclipse_catalog import get_eclipse_catalog, natal_points
+from sky_calendar import get_sky_calendar
 
 # Default orbs by planet speed
 DEFAULT_ORBS = {
@@ -58,6 +70,12 @@ DEFAULT_ORBS = {
     'Pluto': 2.0,         # Very slow
 }
 
+# Eclipse contact orb to natal planets and angles (conjunction/opposition)
+DEFAULT_ECLIPSE_ORB = 3.0
+
+# Transit detection modes: weekly sky snapshots, or every episode solved directly
+TRANSIT_MODES = ['snapshot', 'events']
+
 # Planet sets by report type
 PLANET_SETS = {
     'short': ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto'],
@@ -229,7 +247,8 @@ def calculate_transit_quality_score(
 def tier_transit(
     transit: Dict[str, Any],
     timing_context: Dict[str, Any],
-    natal_chart: Dict[str, Any]
+    natal_chart: Dict[str, Any],
+    use_orb: bool = True
 ) -> str:
     """
     Assign importance tier to transit aspect.
@@ -250,6 +269,15 @@ def tier_transit(
     - Transits with orb 2-3° to natal planets
     - Other transits
 
+    Args:
+        transit: Transit aspect record
+        timing_context: Current timing context
+        natal_chart: Natal chart summary
+        use_orb: Apply the orb rules. Event records (--mode events) are dated
+            at their exact hit, so their orb is always near zero and would
+            make almost every one critical; they are tiered by the timing
+            lords and sect light alone
+
     Returns:
         'critical', 'important', or 'notable'
     """
@@ -278,13 +306,13 @@ def tier_transit(
         return 'critical'
     if natal_planet_name == sect_light:
         return 'critical'
-    if orb < 1.0:  # Exact transit
+    if use_orb and orb < 1.0:  # Exact transit
         return 'critical'
 
     # IMPORTANT tier
     if natal_planet_name in [zr_fortune_lord, zr_spirit_lord, firdaria_major_lord]:
         return 'important'
-    if orb < 2.0:
+    if use_orb and orb < 2.0:
         return 'important'
 
     # NOTABLE tier (everything else)
@@ -303,7 +331,8 @@ def calculate_transit_duration(
     """
     Calculate full duration arc of a transit (applying → exact → separating).
 
-    Scans day-by-day around snapshot date to find:
+    Solves the in-orb episode around the snapshot date by root-finding on the
+    transiting planet's longitude and speed (see aspect_solver.py):
     - When transit first enters orb (applying_date)
     - When transit becomes exact (exact_dates - list, may be multiple if retrograde)
     - When transit leaves orb (separating_date)
@@ -316,8 +345,8 @@ def calculate_transit_duration(
         aspect_type: Type of aspect (conjunction, sextile, square, trine, opposition)
         snapshot_date: Date when transit was detected
         orb: Orb in degrees
-        include_modern: Include modern planets
-        max_scan_days: Maximum days to scan forward/backward
+        include_modern: Unused (only the transiting planet is calculated); kept for compatibility
+        max_scan_days: Maximum days to search forward/backward
 
     Returns:
         {
@@ -326,140 +355,449 @@ def calculate_transit_duration(
             'separating_date': str,
             'duration_days': int,
             'has_retrograde_loop': bool,
-            'stations': [{'date': str, 'motion': 'retrograde'/'direct'}, ...]
+            'stations': [{'date': str, 'time': str, 'motion': 'retrograde'/'direct'}, ...],
+            'applying_time': str,       # 'YYYY-MM-DD HH:MM' UT
+            'exact_times': [str, ...],
+            'separating_time': str
         }
     """
-    from transits import calculate_transiting_positions, find_transit_aspects_to_natal
-    from datetime import datetime, timedelta
-
-    # Calculate target aspect longitude
-    aspect_degrees = {
-        'conjunction': 0,
-        'sextile': 60,
-        'square': 90,
-        'trine': 120,
-        'opposition': 180
-    }
-    aspect_deg = aspect_degrees.get(aspect_type, 0)
-    target_longitude = (natal_longitude + aspect_deg) % 360
+    # Calculate target aspect longitude (natal ± aspect angle, whichever side is in play)
+    snapshot_jd = calculate_julian_day(snapshot_date)
+    target_longitude = nearest_aspect_target(transiting_planet, natal_longitude, aspect_type, snapshot_jd)
+
+    episode = find_aspect_episode(
+        transiting_planet,
+        target_longitude,
+        orb,
+        snapshot_jd,
+        max_days=max_scan_days
+    )
 
-    snapshot_dt = datetime.strptime(snapshot_date, '%Y-%m-%d')
+    return format_episode_duration(episode, snapshot_date)
 
-    # Helper function to calculate orb for a given date
-    def get_orb_for_date(date_dt):
-        try:
-            trans_data = calculate_transiting_positions(
-                date_dt.strftime('%Y-%m-%d'),
-                include_modern=include_modern
-            )
-            trans_planet = next(
-                (p for p in trans_data['planets'] if p['name'] == transiting_planet),
-                None
-            )
-            if not trans_planet:
-                return None
-
-            # Calculate orb to target aspect longitude
-            trans_long = trans_planet['longitude']
-            orb_calc = abs(trans_long - target_longitude)
-            if orb_calc > 180:
-                orb_calc = 360 - orb_calc
-
-            speed = trans_planet['speed']
-            return {'orb': orb_calc, 'speed': speed, 'longitude': trans_long}
-        except:
-            return None
-
-    # Scan backward to find applying date (when first enters orb)
-    applying_date = None
-    current_dt = snapshot_dt
-    for i in range(max_scan_days):
-        current_dt = snapshot_dt - timedelta(days=i)
-        result = get_orb_for_date(current_dt)
-        if result is None:
-            break
-        if result['orb'] > orb:
-            # Just exited orb going backward, so previous day was applying date
-            applying_date = (current_dt + timedelta(days=1)).strftime('%Y-%m-%d')
-            break
-
-    if not applying_date:
-        # Didn't find entry - transit may have started before scan window
-        applying_date = (snapshot_dt - timedelta(days=max_scan_days)).strftime('%Y-%m-%d')
-
-    # Scan forward to find exact dates and separating date
+
+def format_episode_duration(episode: Dict[str, Any], fallback_date: str) -> Dict[str, Any]:
+    """
+    Convert a solved aspect episode (aspect_solver.py) into a transit duration record.
+
+    Args:
+        episode: find_aspect_episode / find_aspect_episodes result
+        fallback_date: Date listed in exact_dates when the aspect never perfects
+
+    Returns:
+        Duration dict in calculate_transit_duration format
+    """
+    applying_dt = jd_to_datetime(episode['applying_jd'])
+    separating_dt = jd_to_datetime(episode['separating_jd'])
+    exact_dts = [jd_to_datetime(jd) for jd in episode['exact_jds']]
+    stations = [
+        {
+            'date': jd_to_datetime(s['jd']).strftime('%Y-%m-%d'),
+            'time': jd_to_datetime(s['jd']).strftime('%Y-%m-%d %H:%M'),
+            'motion': s['motion']
+        }
+        for s in episode['stations']
+    ]
+
+    applying_date = applying_dt.strftime('%Y-%m-%d')
+    separating_date = separating_dt.strftime('%Y-%m-%d')
     exact_dates = []
-    separating_date = None
-    stations = []
-    has_retrograde_loop = False
-
-    current_dt = snapshot_dt
-    prev_orb = None
-    prev_speed = None
-
-    for i in range(max_scan_days):
-        current_dt = snapshot_dt + timedelta(days=i)
-        result = get_orb_for_date(current_dt)
-        if result is None:
-            break
-
-        current_orb = result['orb']
-        current_speed = result['speed']
-
-        # Detect stations (retrograde/direct changes)
-        if prev_speed is not None:
-            if prev_speed > 0 and current_speed < 0:
-                stations.append({'date': current_dt.strftime('%Y-%m-%d'), 'motion': 'retrograde'})
-                has_retrograde_loop = True
-            elif prev_speed < 0 and current_speed > 0:
-                stations.append({'date': current_dt.strftime('%Y-%m-%d'), 'motion': 'direct'})
-                has_retrograde_loop = True
-
-        # Detect exact dates (orb crosses through minimum, allowing 0.3° threshold)
-        if prev_orb is not None:
-            if current_orb < 0.3 and current_orb <= prev_orb:
-                # Approaching exact
-                if current_dt.strftime('%Y-%m-%d') not in exact_dates:
-                    exact_dates.append(current_dt.strftime('%Y-%m-%d'))
-            elif prev_orb < 0.3 and current_orb > prev_orb:
-                # Just passed exact
-                if (current_dt - timedelta(days=1)).strftime('%Y-%m-%d') not in exact_dates:
-                    exact_dates.append((current_dt - timedelta(days=1)).strftime('%Y-%m-%d'))
-
-        # Detect separating date (when exits orb)
-        if current_orb > orb:
-            separating_date = current_dt.strftime('%Y-%m-%d')
-            break
-
-        prev_orb = current_orb
-        prev_speed = current_speed
-
-    if not separating_date:
-        # Transit still in orb at end of scan window
-        separating_date = (snapshot_dt + timedelta(days=max_scan_days)).strftime('%Y-%m-%d')
+    for dt in exact_dts:
+        if dt.strftime('%Y-%m-%d') not in exact_dates:
+            exact_dates.append(dt.strftime('%Y-%m-%d'))
 
     # Calculate total duration
-    apply_dt = datetime.strptime(applying_date, '%Y-%m-%d')
-    separate_dt = datetime.strptime(separating_date, '%Y-%m-%d')
-    duration_days = (separate_dt - apply_dt).days
+    duration_days = (datetime.strptime(separating_date, '%Y-%m-%d') - datetime.strptime(applying_date, '%Y-%m-%d')).days
 
     return {
         'applying_date': applying_date,
-        'exact_dates': exact_dates if exact_dates else [snapshot_date],  # Default to snapshot if no exact found
+        'exact_dates': exact_dates if exact_dates else [fallback_date],  # Default to snapshot if no exact found
         'separating_date': separating_date,
         'duration_days': duration_days,
-        'has_retrograde_loop': has_retrograde_loop,
-        'stations': stations
+        'has_retrograde_loop': bool(stations),
+        'stations': stations,
+        'applying_time': applying_dt.strftime('%Y-%m-%d %H:%M'),
+        'exact_times': [dt.strftime('%Y-%m-%d %H:%M') for dt in exact_dts],
+        'separating_time': separating_dt.strftime('%Y-%m-%d %H:%M')
     }
 
 
+class TransitEpisodeRegistry:
+    """
+    Solved transit episodes, keyed by (transiting planet, natal planet, aspect, episode window).
+
+    A slow transit stays in orb for many weekly snapshots. The first snapshot
+    solves its episode; every later snapshot that falls inside the same window
+    gets the same duration back without another ephemeris scan.
+    """
+
+    def __init__(self):
+        self._windows = {}      # (transiting, natal, aspect, target) -> [entry, ...]
+        self._episodes = {}     # (transiting, natal, aspect, applying_time, separating_time) -> entry
+        self.hits = 0
+        self.misses = 0
+
+    def register(
+        self,
+        transiting_planet: str,
+        natal_planet: str,
+        aspect_type: str,
+        target_longitude: float,
+        episode: Dict[str, Any],
+        date_str: str
+    ) -> Dict[str, Any]:
+        """
+        Record a solved episode (or find the identical one already recorded).
+
+        Returns:
+            Registry entry: {'id', 'transiting_planet', 'natal_planet', 'aspect_type',
+            'target_longitude', 'applying_jd', 'separating_jd', 'duration', 'snapshot_dates'}
+        """
+        duration = format_episode_duration(episode, date_str)
+        key = (transiting_planet, natal_planet, aspect_type, duration['applying_time'], duration['separating_time'])
+        entry = self._episodes.get(key)
+        if entry is None:
+            entry = {
+                'id': len(self._episodes),
+                'transiting_planet': transiting_planet,
+                'natal_planet': natal_planet,
+                'aspect_type': aspect_type,
+                'target_longitude': target_longitude,
+                'applying_jd': episode['applying_jd'],
+                'separating_jd': episode['separating_jd'],
+                'duration': duration,
+                'snapshot_dates': [],
+            }
+            self._episodes[key] = entry
+            pair = (transiting_planet, natal_planet, aspect_type, round(target_longitude, 6))
+            self._windows.setdefault(pair, []).append(entry)
+        entry['snapshot_dates'].append(date_str)
+        return entry
+
+    def duration(
+        self,
+        transiting_planet: str,
+        natal_planet: Dict[str, Any],
+        aspect_type: str,
+        snapshot_date: str,
+        orb: float,
+        max_scan_days: int = 180
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Duration of the episode in progress at a snapshot, solved at most once per episode.
+
+        Args:
+            transiting_planet: Name of transiting planet
+            natal_planet: Natal planet dict ('name', 'longitude')
+            aspect_type: Type of aspect
+            snapshot_date: Date the transit was detected (YYYY-MM-DD)
+            orb: Orb in degrees (the same for every snapshot, so windows line up)
+            max_scan_days: Maximum days to search forward/backward
+
+        Returns:
+            (episode id, duration in calculate_transit_duration format)
+        """
+        snapshot_jd = calculate_julian_day(snapshot_date)
+        target = nearest_aspect_target(transiting_planet, natal_planet['longitude'], aspect_type, snapshot_jd)
+        pair = (transiting_planet, natal_planet['name'], aspect_type, round(target, 6))
+
+        for entry in self._windows.get(pair, []):
+            if entry['applying_jd'] <= snapshot_jd <= entry['separating_jd']:
+                self.hits += 1
+                entry['snapshot_dates'].append(snapshot_date)
+                return entry['id'], entry['duration']
+
+        self.misses += 1
+        episode = find_aspect_episode(transiting_planet, target, orb, snapshot_jd, max_days=max_scan_days)
+        entry = self.register(transiting_planet, natal_planet['name'], aspect_type, target, episode, snapshot_date)
+        return entry['id'], entry['duration']
+
+    def episodes(self) -> List[Dict[str, Any]]:
+        """Deduplicated episodes for the report, in order of orb entry."""
+        entries = sorted(self._episodes.values(), key=lambda e: (e['applying_jd'], e['id']))
+        return [
+            {
+                'id': e['id'],
+                'transiting_planet': e['transiting_planet'],
+                'natal_planet': e['natal_planet'],
+                'aspect_type': e['aspect_type'],
+                'target_longitude': e['target_longitude'],
+                'snapshot_dates': e['snapshot_dates'],
+                **e['duration'],
+            }
+            for e in entries
+        ]
+
+
+def calculate_transit_sky(
+    start_date: str,
+    end_date: str,
+    include_modern: bool = True,
+    step_days: int = 7
+) -> List[Dict[str, Any]]:
+    """
+    Calculate the transiting sky for every snapshot date in a range.
+
+    The sky does not depend on the profile, so batch runs compute it once and
+    share it. All snapshot dates are sampled in a single ephemeris pass.
+
+    Args:
+        start_date: First snapshot (YYYY-MM-DD)
+        end_date: Last possible snapshot (YYYY-MM-DD)
+        include_modern: Include Uranus, Neptune, Pluto
+        step_days: Days between snapshots (default weekly)
+
+    Returns:
+        List of snapshots in calculate_transiting_positions format
+        ({'date', 'julian_day', 'planets'})
+    """
+    start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+    end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+    dates = []
+    current_date = start_dt
+    while current_date <= end_dt:
+        dates.append(current_date.strftime('%Y-%m-%d'))
+        current_date += timedelta(days=step_days)
+
+    planets_to_calc = ALL_PLANETS if include_modern else TRADITIONAL_PLANETS
+    names = [PLANET_NAMES[p] for p in planets_to_calc]
+    samples = sample_positions(planets_to_calc, [calculate_julian_day(d) for d in dates])
+
+    sky = []
+    for row, date_str in enumerate(dates):
+        planets = format_samples(samples, names, row)
+        for planet_id, planet in zip(planets_to_calc, planets):
+            planet['traditional'] = planet_id in TRADITIONAL_PLANETS
+        sky.append({
+            'date': date_str,
+            'julian_day': float(samples['jd'][row]),
+            'planets': planets,
+        })
+
+    return sky
+
+
+def find_snapshot_aspects(
+    sky: List[Dict[str, Any]],
+    charts: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Match every sky snapshot against many natal charts at once.
+
+    All charts go into one NatalTargetIndex, so each transiting planet costs a
+    single range query per snapshot regardless of how many charts there are.
+    Results match find_transit_aspects_to_natal (same fields, sorted by orb).
+
+    Args:
+        sky: Snapshots from calculate_transit_sky
+        charts: {profile_name: {'planets': [...], 'orb': float}}
+
+    Returns:
+        {profile_name: {date: [aspect, ...]}}
+    """
+    index = NatalTargetIndex()
+    for profile_name, chart in charts.items():
+        index.add_chart(profile_name, chart['planets'])
+    max_orb = max((chart['orb'] for chart in charts.values()), default=0.0)
+
+    results = {profile_name: {} for profile_name in charts}
+    for snapshot in sky:
+        hits_by_profile = {profile_name: [] for profile_name in charts}
+
+        for trans_order, trans_planet in enumerate(snapshot['planets']):
+            for entry, distance in index.query(trans_planet['longitude'], max_orb):
+                if distance > charts[entry['key']]['orb']:
+                    continue
+                hits_by_profile[entry['key']].append(((distance, trans_order) + entry['order'], {
+                    'transiting_planet': trans_planet['name'],
+                    'natal_planet': entry['natal_planet'],
+                    'aspect_type': entry['aspect_type'],
+                    'orb': distance,
+                    'exact': distance < 0.5,
+                    'applying': is_applying(trans_planet['longitude'], entry['target'], trans_planet['speed']),
+                    'transit_retrograde': trans_planet['retrograde']
+                }))
+
+        for profile_name, hits in hits_by_profile.items():
+            hits.sort(key=lambda hit: hit[0])
+            results[profile_name][snapshot['date']] = [aspect for _, aspect in hits]
+
+    return results
+
+
+def _episode_peak(episode: Dict[str, Any], jd_start: float, jd_end: float) -> float:
+    """
+    Moment that represents an episode in the report: its first exact hit inside
+    the range, else a station inside the range (an aspect that grazes the orb
+    and turns back), else the nearest range edge to the exact hit or midpoint.
+    """
+    for jd in episode['exact_jds']:
+        if jd_start <= jd <= jd_end:
+            return jd
+    for station in episode['stations']:
+        if jd_start <= station['jd'] <= jd_end:
+            return station['jd']
+    if episode['exact_jds']:
+        jd = episode['exact_jds'][0]
+    else:
+        jd = (episode['applying_jd'] + episode['separating_jd']) / 2
+    return min(max(jd, jd_start), jd_end)
+
+
+def find_transit_episodes(
+    natal_planets: List[Dict[str, Any]],
+    transiting_planets: List[str],
+    start_date: str,
+    end_date: str,
+    orb: float
+) -> List[Dict[str, Any]]:
+    """
+    Solve every transit episode to a natal chart over a date range.
+
+    Each (transiting planet, natal planet, aspect point) pair is searched with
+    find_aspect_episodes, which skips ahead by the planet's maximum speed while
+    it is out of orb - so the cost follows the number of episodes rather than
+    days x planets x natal points, and fast planets cannot slip through between
+    weekly snapshots.
+
+    Args:
+        natal_planets: Natal planets with 'name' and 'longitude'
+        transiting_planets: Transiting planet names
+        start_date: First day (YYYY-MM-DD, from 00:00 UT)
+        end_date: Last day (YYYY-MM-DD, through 24:00 UT)
+        orb: Orb in degrees
+
+    Returns:
+        Episodes in chronological order of their peak:
+        {
+            'transiting_planet', 'natal_planet', 'aspect_type',
+            'target_longitude': float,   # Natal longitude ± aspect angle
+            'peak_jd': float,            # See _episode_peak
+            'longitude': float,          # Transiting longitude at the peak
+            'speed': float,              # Transiting speed at the peak
+            'orb': float,                # Distance from exact at the peak
+            'applying': bool,            # Closing in on exact where the episode enters the range
+            'episode': {...}             # find_aspect_episode result
+        }
+    """
+    jd_start = calculate_julian_day(start_date) - 0.5
+    jd_end = calculate_julian_day(end_date) + 0.5
+
+    found = []
+    for trans_order, trans_name in enumerate(transiting_planets):
+        for natal_order, natal_planet in enumerate(natal_planets):
+            for aspect_order, (aspect_type, angle) in enumerate(ASPECT_ANGLES.items()):
+                # Conjunction and opposition have a single aspect point
+                for target in sorted({(natal_planet['longitude'] + angle) % 360,
+                                      (natal_planet['longitude'] - angle) % 360}):
+                    track = BodyTrack(trans_name, target)
+                    for episode in find_aspect_episodes(trans_name, target, orb, jd_start, jd_end):
+                        peak_jd = _episode_peak(episode, jd_start, jd_end)
+                        _, separation, speed = track.sample(peak_jd)
+                        _, entry_separation, entry_speed = track.sample(max(episode['applying_jd'], jd_start))
+                        found.append(((peak_jd, trans_order, natal_order, aspect_order), {
+                            'transiting_planet': trans_name,
+                            'natal_planet': natal_planet['name'],
+                            'aspect_type': aspect_type,
+                            'target_longitude': target,
+                            'peak_jd': peak_jd,
+                            'longitude': (target + separation) % 360,
+                            'speed': speed,
+                            'orb': abs(separation),
+                            'applying': entry_separation * entry_speed < 0,
+                            'episode': episode,
+                        }))
+
+    found.sort(key=lambda item: item[0])
+    return [episode for _, episode in found]
+
+
+def calculate_event_transits(
+    natal_chart: Dict[str, Any],
+    timing_context: Dict[str, Any],
+    transiting_planets: List[str],
+    start_date: str,
+    end_date: str,
+    orb: float,
+    registry: Optional[TransitEpisodeRegistry] = None
+) -> List[Dict[str, Any]]:
+    """
+    Build transit aspect records from solved episodes, one record per episode.
+
+    Records carry the same fields as the weekly snapshot records; the date,
+    position and orb are taken at the episode's peak (its exact hit when it
+    perfects in the range), and every record gets its duration - the episode
+    is already solved, so it costs nothing extra. Tiers ignore the orb rules
+    (see tier_transit), since the orb at the peak is near zero for nearly
+    every episode.
+
+    Args:
+        natal_chart: {'sect', 'chart_ruler', 'planets'} as built by calculate_transit_report_data
+        timing_context: Current timing context (for tiering)
+        transiting_planets: Transiting planet names
+        start_date: First day (YYYY-MM-DD)
+        end_date: Last day (YYYY-MM-DD)
+        orb: Orb in degrees
+        registry: Registry the episodes are recorded in (for the transit_episodes section)
+
+    Returns:
+        List of transit aspect records, in chronological order
+    """
+    if registry is None:
+        registry = TransitEpisodeRegistry()
+    natal_by_name = {p['name']: p for p in natal_chart['planets']}
+    transits = []
+
+    for found in find_transit_episodes(natal_chart['planets'], transiting_planets, start_date, end_date, orb):
+        natal_planet = natal_by_name[found['natal_planet']]
+        peak_dt = jd_to_datetime(found['peak_jd'])
+        date_str = peak_dt.strftime('%Y-%m-%d')
+        longitude = found['longitude']
+
+        aspect = {
+            'date': date_str,
+            'time': peak_dt.strftime('%Y-%m-%d %H:%M'),
+            'transiting_planet': found['transiting_planet'],
+            'transiting_sign': SIGNS[int(longitude / 30) % 12],
+            'transiting_degree': longitude % 30,
+            'natal_planet': found['natal_planet'],
+            'natal_sign': natal_planet['sign'],
+            'natal_degree': natal_planet['degree'],
+            'aspect_type': found['aspect_type'],
+            'orb': found['orb'],
+            'exact': found['orb'] < 0.5,
+            'applying': found['applying'],
+            'quality_score': calculate_transit_quality_score(
+                found['transiting_planet'],
+                natal_planet,
+                found['aspect_type'],
+                natal_chart
+            )
+        }
+        # The orb at the peak says nothing about the episode's weight - tier on the lords only
+        aspect['tier'] = tier_transit(aspect, timing_context, natal_chart, use_orb=False)
+        entry = registry.register(
+            found['transiting_planet'], found['natal_planet'], found['aspect_type'],
+            found['target_longitude'], found['episode'], date_str
+        )
+        aspect['duration'] = entry['duration']
+        aspect['episode_id'] = entry['id']
+        transits.append(aspect)
+
+    return transits
+
+
 def calculate_transit_report_data(
     profile_name: str,
     start_date: str,
     end_date: str,
     report_type: str = 'short',
     orb: Optional[float] = None,
-    include_modern: bool = True
+    include_modern: bool = True,
+    sky: Optional[List[Dict[str, Any]]] = None,
+    snapshot_aspects: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    mode: str = 'snapshot',
+    station_calendar: Optional[StationCalendar] = None
 ) -> Dict[str, Any]:
     """
     Calculate comprehensive transit report data.
@@ -471,6 +809,11 @@ def calculate_transit_report_data(
         report_type: 'short' (all planets, 1-4 months) or 'long' (slower planets, 1-5 years)
         orb: Custom orb override (optional)
         include_modern: Include Uranus, Neptune, Pluto
+        sky: Precomputed snapshots from calculate_transit_sky (batch runs)
+        snapshot_aspects: Precomputed {date: aspects} from find_snapshot_aspects
+        mode: 'snapshot' (weekly sky snapshots) or 'events' (one record per
+              solved episode, see calculate_event_transits)
+        station_calendar: Shared StationCalendar covering the range (batch runs)
 
     Returns:
         Complete transit report data structure
@@ -677,109 +1020,125 @@ def calculate_transit_report_data(
     print(f"Tier filtering: {'CRITICAL only' if report_type == 'long' else 'All tiers (CRITICAL, IMPORTANT, NOTABLE)'}\n")
 
     all_transits = []
+    episode_registry = TransitEpisodeRegistry()
+
+    # Get default orb (use settings or default to 2.0)
+    default_orb = orb if orb else float(settings.get('transit_default_orb', 2.0))
+
+    if mode not in TRANSIT_MODES:
+        raise ValueError(f"Unknown transit mode '{mode}' (expected one of {TRANSIT_MODES})")
+
+    if mode == 'events':
+        transiting_planets = [
+            PLANET_NAMES[p] for p in (ALL_PLANETS if include_modern else TRADITIONAL_PLANETS)
+            if PLANET_NAMES[p] in allowed_planets
+        ]
+        all_transits = calculate_event_transits(
+            natal_chart, timing_context, transiting_planets, start_date, end_date, default_orb,
+            registry=episode_registry
+        )
+        # For long reports, only include CRITICAL tier transits
+        if report_type == 'long':
+            all_transits = [t for t in all_transits if t['tier'] == 'critical']
+        print(f"Solved {len(all_transits)} transit episodes")
+    else:
+        # For MVP, calculate transits weekly (not daily) to keep data manageable.
+        # Batch runs pass the shared sky and pre-matched aspects in.
+        if sky is None:
+            sky = calculate_transit_sky(start_date, end_date, include_modern=include_modern)
+        if snapshot_aspects is None:
+            charts = {profile_name: {'planets': profile.get_planets(traditional_only=False), 'orb': default_orb}}
+            snapshot_aspects = find_snapshot_aspects(sky, charts)[profile_name]
+
+        week_count = 0
+        for transiting_data in sky:
+            date_str = transiting_data['date']
+            week_count += 1
+
+            try:
+                # Aspects between transiting and natal planets for this date
+                aspect_list = snapshot_aspects.get(date_str, [])
+
+                # Get allowed planets for this report type
+                allowed_planets = get_allowed_planets(report_type)
+
+                # Process each aspect found
+                for asp in aspect_list:
+                    trans_name = asp['transiting_planet']
+                    natal_name = asp['natal_planet']
+
+                    # Filter by allowed planets for report type
+                    if trans_name not in allowed_planets:
+                        continue
 
-    # For MVP, calculate transits weekly (not daily) to keep data manageable
-    current_date = start_dt
-    week_count = 0
-    while current_date <= end_dt:
-        date_str = current_date.strftime('%Y-%m-%d')
-        week_count += 1
-
-        # Calculate transiting positions for this date
-        try:
-            transiting_data = calculate_transiting_positions(date_str, include_modern=include_modern)
-
-            # Get default orb (use settings or default to 2.0)
-            default_orb = orb if orb else float(settings.get('transit_default_orb', 2.0))
-
-            # Find aspects between transiting and natal planets
-            aspect_list = find_transit_aspects_to_natal(
-                transits=transiting_data,
-                profile_name=profile_name,
-                orb=default_orb
-            )
-
-            # Get allowed planets for this report type
-            allowed_planets = get_allowed_planets(report_type)
-
-            # Process each aspect found
-            for asp in aspect_list:
-                trans_name = asp['transiting_planet']
-                natal_name = asp['natal_planet']
-
-                # Filter by allowed planets for report type
-                if trans_name not in allowed_planets:
-                    continue
-
-                # Find the transiting planet data
-                trans_planet = next(
-                    (p for p in transiting_data['planets'] if p['name'] == trans_name),
-                    None
-                )
-
-                # Find the natal planet data
-                natal_planet = next(
-                    (p for p in natal_chart['planets'] if p['name'] == natal_name),
-                    None
-                )
-
-                if trans_planet and natal_planet:
-                    # Build aspect data
-                    aspect = {
-                        'date': date_str,
-                        'transiting_planet': trans_name,
-                        'transiting_sign': trans_planet['sign'],
-                        'transiting_degree': trans_planet['degree'],
-                        'natal_planet': natal_name,
-                        'natal_sign': natal_planet['sign'],
-                        'natal_degree': natal_planet['degree'],
-                        'aspect_type': asp['aspect_type'],
-                        'orb': asp['orb'],
-                        'exact': asp.get('exact', False),
-                        'applying': asp.get('applying', False),
-                        'quality_score': calculate_transit_quality_score(
-                            trans_name,
-                            natal_planet,
-                            asp['aspect_type'],
-                            natal_chart
-                        )
-                    }
-
-                    # Assign tier
-                    aspect['tier'] = tier_transit(aspect, timing_context, natal_chart)
-
-                    # Calculate duration for CRITICAL and IMPORTANT transits only (optimization)
-                    if aspect['tier'] in ['critical', 'important']:
-                        try:
-                            duration_data = calculate_transit_duration(
-                                transiting_planet=trans_name,
-                                natal_longitude=natal_planet['longitude'],
-                                aspect_type=asp['aspect_type'],
-                                snapshot_date=date_str,
-                                orb=asp['orb'],
-                                include_modern=include_modern,
-                                max_scan_days=180
+                    # Find the transiting planet data
+                    trans_planet = next(
+                        (p for p in transiting_data['planets'] if p['name'] == trans_name),
+                        None
+                    )
+
+                    # Find the natal planet data
+                    natal_planet = next(
+                        (p for p in natal_chart['planets'] if p['name'] == natal_name),
+                        None
+                    )
+
+                    if trans_planet and natal_planet:
+                        # Build aspect data
+                        aspect = {
+                            'date': date_str,
+                            'transiting_planet': trans_name,
+                            'transiting_sign': trans_planet['sign'],
+                            'transiting_degree': trans_planet['degree'],
+                            'natal_planet': natal_name,
+                            'natal_sign': natal_planet['sign'],
+                            'natal_degree': natal_planet['degree'],
+                            'aspect_type': asp['aspect_type'],
+                            'orb': asp['orb'],
+                            'exact': asp.get('exact', False),
+                            'applying': asp.get('applying', False),
+                            'quality_score': calculate_transit_quality_score(
+                                trans_name,
+                                natal_planet,
+                                asp['aspect_type'],
+                                natal_chart
                             )
-                            aspect['duration'] = duration_data
-                        except Exception as e:
-                            print(f"Warning: Could not calculate duration for {trans_name} {asp['aspect_type']} {natal_name}: {e}")
+                        }
+
+                        # Assign tier
+                        aspect['tier'] = tier_transit(aspect, timing_context, natal_chart)
+
+                        # Calculate duration for CRITICAL and IMPORTANT transits only (optimization)
+                        # (solved once per episode - later snapshots reuse it)
+                        if aspect['tier'] in ['critical', 'important']:
+                            try:
+                                episode_id, duration_data = episode_registry.duration(
+                                    transiting_planet=trans_name,
+                                    natal_planet=natal_planet,
+                                    aspect_type=asp['aspect_type'],
+                                    snapshot_date=date_str,
+                                    orb=default_orb,
+                                    max_scan_days=180
+                                )
+                                aspect['duration'] = duration_data
+                                aspect['episode_id'] = episode_id
+                            except Exception as e:
+                                print(f"Warning: Could not calculate duration for {trans_name} {asp['aspect_type']} {natal_name}: {e}")
+                                aspect['duration'] = None
+                        else:
                             aspect['duration'] = None
-                    else:
-                        aspect['duration'] = None
 
-                    # For long reports, only include CRITICAL tier transits
-                    if report_type == 'long' and aspect['tier'] != 'critical':
-                        continue
+                        # For long reports, only include CRITICAL tier transits
+                        if report_type == 'long' and aspect['tier'] != 'critical':
+                            continue
 
-                    all_transits.append(aspect)
+                        all_transits.append(aspect)
 
-        except Exception as e:
-            print(f"Warning: Could not calculate transits for {date_str}: {e}")
+            except Exception as e:
+                print(f"Warning: Could not calculate transits for {date_str}: {e}")
 
-        # Advance by 7 days (weekly snapshots)
-        current_date += timedelta(days=7)
-
-    print(f"Calculated {week_count} weeks of transits")
+        print(f"Calculated {week_count} weeks of transits")
+        print(f"Solved {episode_registry.misses} transit episodes ({episode_registry.hits} repeat snapshots reused)")
 
     # Separate by tier
     transits_by_tier = {
@@ -788,11 +1147,45 @@ def calculate_transit_report_data(
         'notable': [t for t in all_transits if t['tier'] == 'notable']
     }
 
-    # Eclipse detection
-    # TODO: Implement eclipse detection using Swiss Ephemeris
-    # For now, placeholder - would use swe.sol_eclipse_when() and swe.lun_eclipse_when()
-    eclipses = []
-    print("Eclipse detection not yet implemented (TODO)")
+    # Stations and retrograde shadows (one calendar per span of years, shared by every profile).
+    # Timing context for the reports only: tiers depend on the natal point touched,
+    # and each pass of a retrograde is already its own transit.
+    if station_calendar is None:
+        station_calendar = get_station_calendar(start_date, end_date)
+    for transit in all_transits:
+        transit['retrograde_phase'] = station_calendar.phase(
+            transit['transiting_planet'],
+            calculate_julian_day(transit['date'])
+        )
+    stations = station_calendar.report(start_date, end_date, allowed_planets)
+
+    # Sign ingresses (Moon left out - it changes sign every 2-3 days) and lunations
+    sky_calendar = get_sky_calendar(start_date, end_date)
+    window_start = calculate_julian_day(start_date) - 0.5
+    window_end = calculate_julian_day(end_date) + 0.5
+    ingresses = list(sky_calendar.ingresses(window_start, window_end, [p for p in allowed_planets if p != 'Moon']))
+    lunations = list(sky_calendar.lunations(window_start, window_end))
+
+    # Deduplicated episodes behind the reported transits
+    reported_ids = {t['episode_id'] for t in all_transits if 'episode_id' in t}
+    transit_episodes = [e for e in episode_registry.episodes() if e['id'] in reported_ids]
+
+    # Eclipse detection (catalog searched once - see eclipse_catalog.py), with
+    # contacts to natal planets and angles within the eclipse orb
+    eclipse_orb = float(settings.get('eclipse_orb', DEFAULT_ECLIPSE_ORB))
+    try:
+        eclipse_catalog = get_eclipse_catalog(start_date, end_date)
+        eclipses = eclipse_catalog.near_points(
+            natal_points(profile),
+            calculate_julian_day(start_date) - 0.5,
+            calculate_julian_day(end_date) + 0.5,
+            eclipse_orb
+        )
+        print(f"Found {len(eclipses)} eclipses "
+              f"({sum(1 for e in eclipses if e['natal_contacts'])} within {eclipse_orb:g}° of natal points)")
+    except Exception as e:
+        print(f"Warning: Could not calculate eclipses: {e}")
+        eclipses = []
 
     # Convergence detection
     # TODO: Implement convergence detection similar to life arc system
@@ -804,145 +1197,18 @@ def calculate_transit_report_data(
     print("Analyzing daily quality scores for peak/low periods...")
 
     # Calculate daily quality scores by summing all active transits for each day
-    daily_scores = {}
-    current_scan_dt = start_dt
-    while current_scan_dt <= end_dt:
-        date_key = current_scan_dt.strftime('%Y-%m-%d')
-        day_score = 0
-        day_transits = []
-
-        # Find all transits active on this day
-        for transit in all_transits:
-            if transit.get('duration'):
-                applying = transit['duration']['applying_date']
-                separating = transit['duration']['separating_date']
-
-                # Check if this day is within the transit's duration
-                try:
-                    apply_dt = datetime.strptime(applying, '%Y-%m-%d')
-                    separate_dt = datetime.strptime(separating, '%Y-%m-%d')
-
-                    if apply_dt <= current_scan_dt <= separate_dt:
-                        transit_score = transit['quality_score']['score']
-                        day_score += transit_score
-                        day_transits.append({
-                            'transiting': transit['transiting_planet'],
-                            'natal': transit['natal_planet'],
-                            'aspect': transit['aspect_type'],
-                            'score': transit_score
-                        })
-                except:
-                    pass
-
-        daily_scores[date_key] = {
-            'score': day_score,
-            'transits': day_transits
-        }
-
-        current_scan_dt += timedelta(days=1)
-
-    # Sort days by score to find most auspicious/challenging
-    sorted_days = sorted(daily_scores.items(), key=lambda x: x[1]['score'], reverse=True)
-
-    # THE most auspicious day (single highest score)
-    most_auspicious_day = None
-    if sorted_days and sorted_days[0][1]['score'] > 0:
-        most_auspicious_day = {
-            'date': sorted_days[0][0],
-            'score': sorted_days[0][1]['score'],
-            'transits': sorted_days[0][1]['transits']
-        }
-
-    # Top 10-20 auspicious days (threshold > +10 or top 20, whichever is fewer)
-    auspicious_days = []
-    for date, data in sorted_days:
-        if data['score'] > 10 or (len(auspicious_days) < 20 and data['score'] > 5):
-            auspicious_days.append({
-                'date': date,
-                'score': data['score'],
-                'transits': data['transits']
-            })
-        if len(auspicious_days) >= 20:
-            break
-
-    # THE most challenging day (single lowest score)
-    most_challenging_day = None
-    if sorted_days and sorted_days[-1][1]['score'] < 0:
-        most_challenging_day = {
-            'date': sorted_days[-1][0],
-            'score': sorted_days[-1][1]['score'],
-            'transits': sorted_days[-1][1]['transits']
-        }
-
-    # Top 10-20 challenging days (threshold < -10 or bottom 20, whichever is fewer)
-    challenging_days = []
-    for date, data in reversed(sorted_days):
-        if data['score'] < -10 or (len(challenging_days) < 20 and data['score'] < -5):
-            challenging_days.append({
-                'date': date,
-                'score': data['score'],
-                'transits': data['transits']
-            })
-        if len(challenging_days) >= 20:
-            break
-
-    # Detect peak periods (consecutive days with total score > +12)
-    peak_periods = []
-    current_peak = None
-    for date_key in sorted(daily_scores.keys()):
-        score = daily_scores[date_key]['score']
-
-        if score > 12:
-            if current_peak is None:
-                current_peak = {
-                    'start_date': date_key,
-                    'end_date': date_key,
-                    'total_score': score,
-                    'peak_score': score,
-                    'days': [date_key]
-                }
-            else:
-                current_peak['end_date'] = date_key
-                current_peak['total_score'] += score
-                current_peak['peak_score'] = max(current_peak['peak_score'], score)
-                current_peak['days'].append(date_key)
-        else:
-            if current_peak is not None:
-                peak_periods.append(current_peak)
-                current_peak = None
-
-    # Add final peak if exists
-    if current_peak is not None:
-        peak_periods.append(current_peak)
-
-    # Detect low periods (consecutive days with total score < -12)
-    low_periods = []
-    current_low = None
-    for date_key in sorted(daily_scores.keys()):
-        score = daily_scores[date_key]['score']
-
-        if score < -12:
-            if current_low is None:
-                current_low = {
-                    'start_date': date_key,
-                    'end_date': date_key,
-                    'total_score': score,
-                    'low_score': score,
-                    'days': [date_key]
-                }
-            else:
-                current_low['end_date'] = date_key
-                current_low['total_score'] += score
-                current_low['low_score'] = min(current_low['low_score'], score)
-                current_low['days'].append(date_key)
-        else:
-            if current_low is not None:
-                low_periods.append(current_low)
-                current_low = None
-
-    # Add final low if exists
-    if current_low is not None:
-        low_periods.append(current_low)
+    # (difference array over the transit durations - see daily_scores.py)
+    score_series = accumulate_daily_scores(all_transits, start_dt, end_dt)
+    daily_scores = score_series.to_dict()
+
+    # Peak/low periods (consecutive days beyond ±12) and the top 20 auspicious/challenging days
+    score_analysis = analyze_daily_scores(score_series)
+    peak_periods = score_analysis['peak_periods']
+    low_periods = score_analysis['low_periods']
+    most_auspicious_day = score_analysis['most_auspicious_day']
+    auspicious_days = score_analysis['auspicious_days']
+    most_challenging_day = score_analysis['most_challenging_day']
+    challenging_days = score_analysis['challenging_days']
 
     print(f"Found {len(peak_periods)} peak periods and {len(low_periods)} low periods")
     if most_auspicious_day:
@@ -963,6 +1229,10 @@ def calculate_transit_report_data(
         'current_timing': timing_context,
         'transits_by_tier': transits_by_tier,
         'all_transits': all_transits,
+        'transit_episodes': transit_episodes,
+        'stations': stations,
+        'ingresses': ingresses,
+        'lunations': lunations,
         'eclipses': eclipses,
         'convergences': convergences,
         'peak_periods': peak_periods,
@@ -977,7 +1247,8 @@ def calculate_transit_report_data(
             'report_type': report_type,
             'planets_included': get_allowed_planets(report_type),
             'orb_defaults': DEFAULT_ORBS,
-            'include_modern': include_modern
+            'include_modern': include_modern,
+            'transit_mode': mode
         }
     }
 
@@ -1047,6 +1318,8 @@ def main():
                         help='Report type: short (1-4 months, all planets) or long (1-5 years, slower planets + timing techniques)')
     parser.add_argument('--orb', type=float, help='Custom orb override')
     parser.add_argument('--include-modern', type=bool, default=True, help='Include modern planets')
+    parser.add_argument('--mode', choices=TRANSIT_MODES, default='snapshot',
+                        help='Transit detection: snapshot (weekly sky snapshots) or events (every episode solved exactly)')
     parser.add_argument('--list-profiles', action='store_true', help='List available profiles')
 
     args = parser.parse_args()
@@ -1083,7 +1356,8 @@ def main():
         end_date=end_date,
         report_type=args.report_type,
         orb=args.orb,
-        include_modern=args.include_modern
+        include_modern=args.include_modern,
+        mode=args.mode
     )
 
     # Save to file
@@ -22,6 +22,8 @@ import swisseph as swe
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 from profile_loader import load_profile, list_profiles
+from ephemeris_sampler import sample_positions, format_samples
+from natal_target_index import ASPECT_ANGLES, is_applying, profile_index
 
 # Constants
 SIGNS = [
@@ -75,27 +77,11 @@ def calculate_transiting_positions(date_str: str, include_modern: bool = True) -
 
     planets_to_calc = ALL_PLANETS if include_modern else TRADITIONAL_PLANETS
 
-    transiting_planets = []
+    samples = sample_positions(planets_to_calc, [jd])
+    transiting_planets = format_samples(samples, [PLANET_NAMES[p] for p in planets_to_calc])
 
-    for planet_id in planets_to_calc:
-        planet_name = PLANET_NAMES[planet_id]
-
-        position, _ = swe.calc_ut(jd, planet_id)
-        longitude = position[0]
-        speed = position[3]
-
-        sign, degree = get_sign_from_longitude(longitude)
-
-        transiting_planets.append({
-            'name': planet_name,
-            'longitude': longitude,
-            'sign': sign,
-            'degree': degree,
-            'dms': f"{int(degree)}°{int((degree % 1) * 60)}'{int(((degree * 60) % 1) * 60)}\"",
-            'speed': speed,
-            'retrograde': speed < 0,
-            'traditional': planet_id in TRADITIONAL_PLANETS
-        })
+    for planet_id, planet in zip(planets_to_calc, transiting_planets):
+        planet['traditional'] = planet_id in TRADITIONAL_PLANETS
 
     return {
         'date': date_str,
@@ -125,50 +111,31 @@ def find_transit_aspects_to_natal(
     profile = load_profile(profile_name)
     aspects = []
 
-    aspect_angles = {
-        'conjunction': 0,
-        'sextile': 60,
-        'square': 90,
-        'trine': 120,
-        'opposition': 180
-    }
-
+    aspect_angles = ASPECT_ANGLES
     if aspects_to_check:
         aspect_angles = {k: v for k, v in aspect_angles.items() if k in aspects_to_check}
 
-    # Get natal planets
-    natal_planets = {p['name']: p['longitude'] for p in profile.get_planets(traditional_only=False)}
-
-    # Check each transiting planet against each natal planet
-    for trans_planet in transits['planets']:
-        for natal_name, natal_long in natal_planets.items():
-            # Calculate angular distance
-            diff = abs(trans_planet['longitude'] - natal_long)
-            if diff > 180:
-                diff = 360 - diff
-
-            # Check each aspect type
-            for aspect_name, aspect_angle in aspect_angles.items():
-                orb_diff = abs(diff - aspect_angle)
-
-                if orb_diff <= orb:
-                    # Determine if applying or separating (simplified)
-                    applying = trans_planet['speed'] > 0  # Simplified: direct motion = applying
-
-                    aspects.append({
-                        'transiting_planet': trans_planet['name'],
-                        'natal_planet': natal_name,
-                        'aspect_type': aspect_name,
-                        'orb': orb_diff,
-                        'exact': orb_diff < 0.5,
-                        'applying': applying,
-                        'transit_retrograde': trans_planet['retrograde']
-                    })
+    # Every transiting planet against the natal aspect points in one batched query
+    index = profile_index(profile, traditional_only=False, aspect_angles=aspect_angles)
+    trans_planets = transits['planets']
+    hits = index.query_many([p['longitude'] for p in trans_planets], orb)
+
+    for trans_order, (trans_planet, planet_hits) in enumerate(zip(trans_planets, hits)):
+        for entry, distance in planet_hits:
+            aspects.append(((distance, trans_order) + entry['order'], {
+                'transiting_planet': trans_planet['name'],
+                'natal_planet': entry['natal_planet'],
+                'aspect_type': entry['aspect_type'],
+                'orb': distance,
+                'exact': distance < 0.5,
+                'applying': is_applying(trans_planet['longitude'], entry['target'], trans_planet['speed']),
+                'transit_retrograde': trans_planet['retrograde']
+            }))
 
     # Sort by orb (tightest first)
-    aspects.sort(key=lambda x: x['orb'])
+    aspects.sort(key=lambda hit: hit[0])
 
-    return aspects
+    return [aspect for _, aspect in aspects]
 
 
 def find_transits_in_natal_houses(transits: Dict[str, Any], profile_name: str) -> Dict[str, Any]: